@@ -1,32 +1,117 @@
 import argparse
 import csv
-from functools import partial
+import os
 import re
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
 import sys
 import time
-from typing import Iterable, List, Tuple
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
 
+import attr
+from alignment.sequence import Sequence as SignSequence
 from alignment.vocabulary import Vocabulary
 from tqdm import tqdm
 
 from ebl.alignment.application.align import align
+from ebl.alignment.domain.kmers import KMER_SIZE, MIN_SHARED_KMERS, KmerIndex
 from ebl.alignment.domain.result import AlignmentResult
-from ebl.alignment.domain.sequence import NamedSequence
+from ebl.alignment.domain.sequence import NamedSequence, make_sequence
 from ebl.app import create_context
 from ebl.context import Context
 from ebl.corpus.domain.chapter import ChapterId, Chapter
 from ebl.corpus.domain.text import Text
+from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
+FIELDNAMES = [
+    "fragment",
+    "text id",
+    "text name",
+    "chapter",
+    "manuscript",
+    "score",
+    "preserved identity",
+    "preserved similarity",
+    "notes",
+]
+
 
 def has_clear_signs(signs: str) -> bool:
     return not re.fullmatch(r"[X\\n\s]*", signs)
 
 
+@attr.s(auto_attribs=True, frozen=True)
+class ChapterSigns:
+    text: Text
+    chapter: Chapter
+    manuscripts: Sequence[Tuple[str, SignSequence]]
+
+    @staticmethod
+    def of(text: Text, chapter: Chapter) -> "ChapterSigns":
+        return ChapterSigns(
+            text,
+            chapter,
+            [
+                (str(chapter.manuscripts[index].siglum), make_sequence(signs))
+                for index, signs in enumerate(chapter.signs)
+                if signs is not None and has_clear_signs(signs)
+            ],
+        )
+
+    def select(self, indexes: Iterable[int]) -> "ChapterSigns":
+        return attr.evolve(
+            self, manuscripts=[self.manuscripts[index] for index in sorted(indexes)]
+        )
+
+
+def create_kmer_index(
+    chapters: Sequence[ChapterSigns], size: int = KMER_SIZE
+) -> KmerIndex:
+    return KmerIndex.of(
+        (
+            ((chapter_index, manuscript_index), signs)
+            for chapter_index, chapter in enumerate(chapters)
+            for manuscript_index, (_, signs) in enumerate(chapter.manuscripts)
+        ),
+        size,
+    )
+
+
+def shortlist_chapters(
+    fragment: Fragment,
+    chapters: Sequence[ChapterSigns],
+    index: KmerIndex,
+    min_shared: int,
+) -> List[ChapterSigns]:
+    candidates: Dict[int, Set[int]] = {}
+    for chapter_index, manuscript_index in index.shortlist(
+        make_sequence(fragment.signs), min_shared
+    ):
+        candidates.setdefault(chapter_index, set()).add(manuscript_index)
+    return [
+        chapters[chapter_index].select(manuscript_indexes)
+        for chapter_index, manuscript_indexes in sorted(candidates.items())
+    ]
+
+
 def align_fragment_and_chapter(
-    fragment: Fragment, chapter: Chapter
+    fragment: Fragment, chapter: ChapterSigns, vectorized: bool = False
 ) -> List[AlignmentResult]:
     vocabulary = Vocabulary()
     fragment_sequence = NamedSequence.of_fragment(fragment, vocabulary)
@@ -34,15 +119,12 @@ def align_fragment_and_chapter(
     pairs = [
         (
             fragment_sequence,
-            NamedSequence.of_signs(
-                chapter.manuscripts[index].siglum, signs, vocabulary
-            ),
+            NamedSequence(siglum, vocabulary.encodeSequence(signs)),
         )
-        for index, signs in enumerate(chapter.signs)
-        if signs is not None and has_clear_signs(signs)
+        for siglum, signs in chapter.manuscripts
     ]
 
-    return align(pairs, vocabulary)
+    return align(pairs, vocabulary, vectorized)
 
 
 def to_dict(
@@ -67,32 +149,103 @@ def to_dict(
     }
 
 
-def align_fragment(
-    number: MuseumNumber,
-    chapters: Iterable[Tuple[Text, Chapter]],
+_fragments: Optional[FragmentRepository] = None
+_chapters: Sequence[ChapterSigns] = ()
+_kmer_index: Optional[KmerIndex] = None
+_min_shared_kmers = 0
+_max_lines = 0
+_min_score = 0
+_vectorized = False
+
+
+def init_worker(
+    chapters: Sequence[ChapterSigns],
     max_lines: int,
     min_score: int,
-) -> List[dict]:
+    vectorized: bool = False,
+    kmer_prune: bool = False,
+    kmer_size: int = KMER_SIZE,
+    min_shared_kmers: int = MIN_SHARED_KMERS,
+) -> None:
+    global _fragments, _chapters, _kmer_index, _min_shared_kmers
+    global _max_lines, _min_score, _vectorized
     sys.setrecursionlimit(50000)
-    context = create_context()
-    fragment = context.fragment_repository.query_by_museum_number(number)
+    if _fragments is None:
+        _fragments = create_context().fragment_repository
+    _chapters = chapters
+    _kmer_index = create_kmer_index(chapters, kmer_size) if kmer_prune else None
+    _min_shared_kmers = min_shared_kmers
+    _max_lines = max_lines
+    _min_score = min_score
+    _vectorized = vectorized
+
+
+def align_fragment(number: MuseumNumber) -> List[dict]:
+    fragment = cast(FragmentRepository, _fragments).query_by_museum_number(number)
+    chapters = (
+        _chapters
+        if _kmer_index is None
+        else shortlist_chapters(
+            fragment, _chapters, cast(KmerIndex, _kmer_index), _min_shared_kmers
+        )
+    )
 
     return (
         [
-            to_dict(fragment, text, chapter, result)
-            for (text, chapter) in chapters
-            for result in align_fragment_and_chapter(fragment, chapter)
-            if result.score >= min_score
+            to_dict(fragment, chapter.text, chapter.chapter, result)
+            for chapter in chapters
+            for result in align_fragment_and_chapter(fragment, chapter, _vectorized)
+            if result.score >= _min_score
         ]
-        if fragment.text.number_of_lines <= max_lines
+        if fragment.text.number_of_lines <= _max_lines
         else []
     )
 
 
-def load_chapters(context: Context) -> List[Tuple[Text, Chapter]]:
+def align_chunk(
+    numbers: Sequence[MuseumNumber],
+) -> Tuple[Sequence[MuseumNumber], List[dict], float]:
+    t0 = time.perf_counter()
+    results = [result for number in numbers for result in align_fragment(number)]
+    return numbers, results, time.perf_counter() - t0
+
+
+def chunk(
+    numbers: Sequence[MuseumNumber], size: int
+) -> Iterator[Sequence[MuseumNumber]]:
+    for index in range(0, len(numbers), size):
+        yield numbers[index : index + size]
+
+
+def read_checkpoint(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as file:
+        return {line.strip() for line in file if line.strip()}
+
+
+def remove_unfinished_rows(path: str, done: Set[str]) -> None:
+    """Keep only the results of the fragments in the checkpoint.
+
+    Results are written before the checkpoint, so the fragments of a task
+    which was interrupted in between would otherwise be written twice.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8", newline="") as file:
+        rows = [row for row in csv.DictReader(file) if row["fragment"] in done]
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(temporary, path)
+
+
+def load_chapters(context: Context) -> List[ChapterSigns]:
     texts = context.text_repository
     return [
-        (text, chapter)
+        ChapterSigns.of(text, chapter)
         for (text, chapter) in (
             (text, texts.find_chapter(ChapterId(text.id, listing.stage, listing.name)))
             for text in texts.list()
@@ -102,6 +255,41 @@ def load_chapters(context: Context) -> List[Tuple[Text, Chapter]]:
     ]
 
 
+def run(
+    executor: Executor,
+    chunks: Iterable[Sequence[MuseumNumber]],
+    total: int,
+    output: str,
+    checkpoint: str,
+    resume: bool,
+) -> None:
+    mode = "a" if resume else "w"
+    if resume:
+        remove_unfinished_rows(output, read_checkpoint(checkpoint))
+    write_header = not resume or not os.path.exists(output)
+    with (
+        open(output, mode, encoding="utf-8", newline="") as file,
+        open(checkpoint, mode, encoding="utf-8") as done,
+        tqdm(total=total) as progress,
+    ):
+        writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+        if write_header:
+            writer.writeheader()
+
+        futures = [executor.submit(align_chunk, numbers) for numbers in chunks]
+        for future in as_completed(futures):
+            numbers, results, seconds = future.result()
+            writer.writerows(results)
+            file.flush()
+            done.writelines(f"{number}\n" for number in numbers)
+            done.flush()
+            progress.update(len(numbers))
+            progress.write(
+                f"{len(numbers)} fragments in {seconds:.1f} s "
+                f"({len(numbers) / max(seconds, 1e-9):.2f} fragments/s)"
+            )
+
+
 def parse_arguments() -> argparse.Namespace:
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -124,6 +312,29 @@ def parse_arguments() -> argparse.Namespace:
         default=10,
         help="Maximum size of fragment to align.",
     )
+    parser.add_argument(
+        "--kmer-prune",
+        dest="kmer_prune",
+        action="store_true",
+        help="Align only the manuscripts sharing sign k-mers with a fragment. "
+        "K-mers compare signs exactly, so matches through substitutions or X "
+        "can be missed; check the recall with benchmark_kmer_pruning first.",
+    )
+    parser.add_argument(
+        "--kmerSize",
+        dest="kmer_size",
+        type=int,
+        default=KMER_SIZE,
+        help="Length of the sign k-mers used with --kmer-prune.",
+    )
+    parser.add_argument(
+        "--minSharedKmers",
+        dest="min_shared_kmers",
+        type=int,
+        default=MIN_SHARED_KMERS,
+        help="Minimum number of k-mers a manuscript must share with a fragment "
+        "to be aligned with --kmer-prune.",
+    )
     parser.add_argument(
         "-o",
         "--output",
@@ -132,15 +343,39 @@ def parse_arguments() -> argparse.Namespace:
         help="Filename for saving the results.",
     )
     parser.add_argument(
-        "-w", "--workers", default=None, help="Number of parallel workers."
+        "-c",
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Filename for saving aligned museum numbers. Defaults to OUTPUT.done.",
+    )
+    parser.add_argument(
+        "-r",
+        "--resume",
+        action="store_true",
+        help="Skip fragments in the checkpoint and append to the results.",
+    )
+    parser.add_argument(
+        "--chunkSize",
+        dest="chunk_size",
+        type=int,
+        default=50,
+        help="Number of fragments per task.",
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None, help="Number of parallel workers."
     )
     parser.add_argument(
         "-t",
         "--threads",
         action="store_true",
-        default=True,
         help="Use threads instead of processes.",
     )
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Use the NumPy aligner instead of the reference aligner.",
+    )
 
     return parser.parse_args()
 
@@ -149,51 +384,44 @@ if __name__ == "__main__":
     args = parse_arguments()
     start = args.skip
     end = args.skip + args.limit
+    checkpoint = args.checkpoint or f"{args.output}.done"
 
     context = create_context()
     fragments = context.fragment_repository
 
     t0 = time.time()
 
-    fragment_numbers = fragments.query_transliterated_numbers()[start:end]
+    done = read_checkpoint(checkpoint) if args.resume else set()
+    fragment_numbers = [
+        number
+        for number in fragments.query_transliterated_numbers()[start:end]
+        if str(number) not in done
+    ]
     chapters = load_chapters(context)
 
-    Executor = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
+    executor_class = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
 
-    with (
-        Executor(max_workers=args.workers) as executor,
-        open(args.output, "w", encoding="utf-8") as file,
-    ):
-        results = tqdm(
-            executor.map(
-                partial(
-                    align_fragment,
-                    chapters=chapters,
-                    max_lines=args.max_lines,
-                    min_score=args.min_score,
-                ),
-                fragment_numbers,
-            ),
-            total=len(fragment_numbers),
+    with executor_class(
+        max_workers=args.workers,
+        initializer=init_worker,
+        initargs=(
+            chapters,
+            args.max_lines,
+            args.min_score,
+            args.vectorized,
+            args.kmer_prune,
+            args.kmer_size,
+            args.min_shared_kmers,
+        ),
+    ) as executor:
+        run(
+            executor,
+            chunk(fragment_numbers, args.chunk_size),
+            len(fragment_numbers),
+            args.output,
+            checkpoint,
+            args.resume,
         )
 
-        fieldnames = [
-            "fragment",
-            "text id",
-            "text name",
-            "chapter",
-            "manuscript",
-            "score",
-            "preserved identity",
-            "preserved similarity",
-            "notes",
-        ]
-        writer = csv.DictWriter(file, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for fragment_results in results:
-            for result in fragment_results:
-                writer.writerow(result)
-
     t = time.time()
     print(f"\nTime: {round((t - t0) / 60, 2)} min")
@@ -12,9 +12,16 @@ def align_pair(
     first: NamedSequence,
     second: NamedSequence,
     vocabulary: Vocabulary,
+    vectorized: bool = False,
 ) -> AlignmentResult:
     scoring = EblScoring(vocabulary)
-    aligner = GlobalSequenceAligner(scoring, True)
+    if vectorized:
+        # NumPy is only needed by the opt-in aligner.
+        from ebl.alignment.domain.vectorized_aligner import VectorizedAligner
+
+        aligner = VectorizedAligner(scoring)
+    else:
+        aligner = GlobalSequenceAligner(scoring, True)
     score, alignments = aligner.align(first.sequence, second.sequence, backtrace=True)
     return AlignmentResult(
         score,
@@ -25,10 +32,15 @@ def align_pair(
 
 
 def align(
-    pairs: List[Tuple[NamedSequence, NamedSequence]], vocabulary: Vocabulary
+    pairs: List[Tuple[NamedSequence, NamedSequence]],
+    vocabulary: Vocabulary,
+    vectorized: bool = False,
 ) -> List[AlignmentResult]:
     return sorted(
-        (align_pair(first, second, vocabulary) for (first, second) in pairs),
+        (
+            align_pair(first, second, vocabulary, vectorized)
+            for (first, second) in pairs
+        ),
         key=lambda result: result.score,
         reverse=True,
     )
@@ -0,0 +1,90 @@
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List, Sequence, Tuple
+
+from alignment.sequence import EncodedSequence, Sequence as SignSequence
+from alignment.sequencealigner import GlobalSequenceAligner
+from alignment.vocabulary import Vocabulary
+
+from ebl.alignment.domain.scoring import EblScoring
+from ebl.alignment.domain.sequence import LINE_BREAK, UNCLEAR_OR_UNKNOWN_SIGN
+from ebl.alignment.domain.vectorized_aligner import VectorizedAligner
+
+SIGNS = [f"ABZ{number}" for number in range(1, 600)]
+SIGN_WEIGHTS = [1 / number for number in range(1, 600)]
+
+
+def create_signs(rng: random.Random, length: int, line_length: int) -> List[str]:
+    signs = rng.choices(SIGNS, SIGN_WEIGHTS, k=length)
+    for index in range(len(signs)):
+        if rng.random() < 0.1:
+            signs[index] = UNCLEAR_OR_UNKNOWN_SIGN
+        if index % line_length == line_length - 1:
+            signs[index] = LINE_BREAK
+    return signs
+
+
+def create_pairs(
+    vocabulary: Vocabulary,
+    number_of_pairs: int,
+    fragment_length: int,
+    manuscript_length: int,
+    seed: int,
+) -> List[Tuple[EncodedSequence, EncodedSequence]]:
+    rng = random.Random(seed)
+    return [
+        (
+            vocabulary.encodeSequence(
+                SignSequence(create_signs(rng, fragment_length, 10))
+            ),
+            vocabulary.encodeSequence(
+                SignSequence(create_signs(rng, manuscript_length, 10))
+            ),
+        )
+        for _ in range(number_of_pairs)
+    ]
+
+
+def measure(
+    align: Callable[[EncodedSequence, EncodedSequence], object],
+    pairs: Sequence[Tuple[EncodedSequence, EncodedSequence]],
+) -> float:
+    start = time.perf_counter()
+    for first, second in pairs:
+        align(first, second)
+    return (time.perf_counter() - start) / len(pairs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the reference and the NumPy aligner on synthetic signs."
+    )
+    parser.add_argument("-p", "--pairs", type=int, default=5)
+    parser.add_argument("-f", "--fragment", type=int, default=100)
+    parser.add_argument("-m", "--manuscript", type=int, default=1000)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sys.setrecursionlimit(50000)
+    vocabulary = Vocabulary()
+    pairs = create_pairs(
+        vocabulary, args.pairs, args.fragment, args.manuscript, args.seed
+    )
+
+    before = measure(
+        lambda first, second: GlobalSequenceAligner(EblScoring(vocabulary), True).align(
+            first, second, backtrace=True
+        ),
+        pairs,
+    )
+    after = measure(
+        lambda first, second: VectorizedAligner(EblScoring(vocabulary)).align(
+            first, second, backtrace=True
+        ),
+        pairs,
+    )
+    print(f"GlobalSequenceAligner per pair: {before:.3f} s")
+    print(f"VectorizedAligner per pair: {after:.3f} s")
+    print(f"Speed-up: {before / after:.1f}x")
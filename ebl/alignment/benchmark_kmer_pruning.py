@@ -0,0 +1,176 @@
+import argparse
+import csv
+import os
+from functools import partial
+import sys
+import time
+from typing import Callable, List, Optional, Sequence, Set, Tuple
+
+from tqdm import tqdm
+
+from ebl.alignment.align_fragmentarium import (
+    ChapterSigns,
+    align_fragment_and_chapter,
+    create_kmer_index,
+    load_chapters,
+    shortlist_chapters,
+    to_dict,
+)
+from ebl.alignment.domain.kmers import KMER_SIZE
+from ebl.app import create_context
+from ebl.fragmentarium.domain.fragment import Fragment
+
+Key = Tuple[str, str, str, str]
+
+BASELINE = "ebl/alignment/alignment.csv"
+
+
+def to_key(row: dict) -> Key:
+    return (
+        str(row["fragment"]),
+        str(row["text id"]),
+        str(row["chapter"]),
+        str(row["manuscript"]),
+    )
+
+
+def read_baseline(path: str, fragments: Sequence[Fragment]) -> Set[Key]:
+    numbers = {str(fragment.number) for fragment in fragments}
+    with open(path, encoding="utf-8") as file:
+        return {
+            to_key(row) for row in csv.DictReader(file) if row["fragment"] in numbers
+        }
+
+
+def run(
+    fragments: Sequence[Fragment],
+    select: Callable[[Fragment], Sequence[ChapterSigns]],
+    min_score: int,
+) -> Tuple[Set[Key], int, float]:
+    results: Set[Key] = set()
+    pairs = 0
+    t0 = time.perf_counter()
+    for fragment in tqdm(fragments, leave=False):
+        for chapter in select(fragment):
+            pairs += len(chapter.manuscripts)
+            results.update(
+                to_key(to_dict(fragment, chapter.text, chapter.chapter, result))
+                for result in align_fragment_and_chapter(fragment, chapter)
+                if result.score >= min_score
+            )
+    return results, pairs, time.perf_counter() - t0
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare k-mer pruned alignment with exhaustive alignment."
+    )
+    parser.add_argument(
+        "-s", "--skip", type=int, default=0, help="Number of fragments to skip."
+    )
+    parser.add_argument(
+        "-l", "--limit", type=int, default=200, help="Number of fragments to align."
+    )
+    parser.add_argument(
+        "--minScore",
+        dest="min_score",
+        type=int,
+        default=100,
+        help="Minimum score to show in the results.",
+    )
+    parser.add_argument(
+        "--maxLines",
+        dest="max_lines",
+        type=int,
+        default=10,
+        help="Maximum size of fragment to align.",
+    )
+    parser.add_argument(
+        "--kmerSize",
+        dest="kmer_size",
+        type=int,
+        default=KMER_SIZE,
+        help="Length of the sign k-mers used to shortlist manuscripts.",
+    )
+    parser.add_argument(
+        "--minSharedKmers",
+        dest="min_shared_kmers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 3],
+        help="Thresholds to benchmark.",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        type=str,
+        default=BASELINE,
+        help="Results of an exhaustive align_fragmentarium run. The exhaustive "
+        "alignment is run if it has no results for the sampled fragments.",
+    )
+
+    return parser.parse_args()
+
+
+def print_row(
+    name: str,
+    results: Set[Key],
+    expected: Set[Key],
+    pairs: int,
+    seconds: Optional[float],
+) -> None:
+    recall = len(results & expected) / len(expected) if expected else 1.0
+    timing = "-" if seconds is None else f"{seconds:.1f}"
+    print(f"{name:<20}{pairs:>12}{len(results):>10}{recall:>10.3f}{timing:>12}")
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    sys.setrecursionlimit(50000)
+
+    context = create_context()
+    chapters: List[ChapterSigns] = load_chapters(context)
+    fragments = [
+        fragment
+        for fragment in (
+            context.fragment_repository.query_by_museum_number(number)
+            for number in context.fragment_repository.query_transliterated_numbers()[
+                args.skip : args.skip + args.limit
+            ]
+        )
+        if fragment.text.number_of_lines <= args.max_lines
+    ]
+
+    print(f"{'run':<20}{'pairs':>12}{'results':>10}{'recall':>10}{'seconds':>12}")
+
+    expected = (
+        read_baseline(args.baseline, fragments)
+        if os.path.exists(args.baseline)
+        else set()
+    )
+    if expected:
+        print_row("baseline", expected, expected, 0, None)
+    else:
+        expected, pairs, seconds = run(
+            fragments, lambda fragment: chapters, args.min_score
+        )
+        print_row("exhaustive", expected, expected, pairs, seconds)
+
+    t0 = time.perf_counter()
+    index = create_kmer_index(chapters, args.kmer_size)
+    print(f"Indexed {len(index.postings)} k-mers in {time.perf_counter() - t0:.1f} s")
+
+    for min_shared in args.min_shared_kmers:
+        results, pairs, seconds = run(
+            fragments,
+            partial(
+                shortlist_chapters,
+                chapters=chapters,
+                index=index,
+                min_shared=min_shared,
+            ),
+            args.min_score,
+        )
+        print_row(
+            f"k={args.kmer_size} min={min_shared}", results, expected, pairs, seconds
+        )
@@ -0,0 +1,56 @@
+from collections import Counter
+from itertools import product
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Mapping, Set, Tuple
+
+import attr
+
+from ebl.alignment.domain.sequence import LINE_BREAK
+from ebl.transliteration.domain.atf import VARIANT_SEPARATOR
+
+KMER_SIZE = 3
+MIN_SHARED_KMERS = 1
+
+Kmer = Tuple[str, ...]
+
+
+def create_kmers(signs: Iterable[str], size: int = KMER_SIZE) -> FrozenSet[Kmer]:
+    alternatives = [
+        sign.split(VARIANT_SEPARATOR) for sign in signs if sign and sign != LINE_BREAK
+    ]
+    return frozenset(
+        kmer
+        for index in range(len(alternatives) - size + 1)
+        for kmer in product(*alternatives[index : index + size])
+    )
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class KmerIndex:
+    size: int
+    postings: Mapping[Kmer, List[Hashable]]
+
+    @staticmethod
+    def of(
+        sequences: Iterable[Tuple[Hashable, Iterable[str]]], size: int = KMER_SIZE
+    ) -> "KmerIndex":
+        postings: Dict[Kmer, List[Hashable]] = {}
+        for key, signs in sequences:
+            for kmer in create_kmers(signs, size):
+                postings.setdefault(kmer, []).append(key)
+        return KmerIndex(size, postings)
+
+    def count_shared(self, signs: Iterable[str]) -> Counter:
+        return Counter(
+            key
+            for kmer in create_kmers(signs, self.size)
+            for key in self.postings.get(kmer, ())
+        )
+
+    def shortlist(
+        self, signs: Iterable[str], min_shared: int = MIN_SHARED_KMERS
+    ) -> Set[Hashable]:
+        return {
+            key
+            for key, count in self.count_shared(signs).items()
+            if count >= min_shared
+        }
@@ -1,4 +1,5 @@
-from typing import Callable, Generator, Tuple
+from functools import lru_cache
+from typing import Dict, Tuple
 from alignment.sequencealigner import Scoring, GapScoring
 from alignment.vocabulary import Vocabulary
 
@@ -15,6 +16,7 @@ x_mismatch = -3
 gap_start = -5
 gap_extension = -1
 break_gap_extension = break_mismatch
+score_cache_size = 2**16
 
 curated_substitutions = frozenset(
     [
@@ -62,66 +64,42 @@ def is_variant(first_decoded: str, second_decoded: str) -> bool:
     return VARIANT_SEPARATOR in first_decoded or VARIANT_SEPARATOR in second_decoded
 
 
+@lru_cache(maxsize=score_cache_size)
+def score_signs(first: str, second: str) -> int:
+    if first == LINE_BREAK or second == LINE_BREAK:
+        return break_match if first == second else break_mismatch
+    if first == UNCLEAR_OR_UNKNOWN_SIGN or second == UNCLEAR_OR_UNKNOWN_SIGN:
+        return x_match if first == second else x_mismatch
+    if is_curated(first, second):
+        return common_mismatch
+    if is_variant(first, second):
+        return max(
+            score_signs(first_part, second_part)
+            for first_part in first.split(VARIANT_SEPARATOR)
+            for second_part in second.split(VARIANT_SEPARATOR)
+        )
+    return match if first == second else mismatch
+
+
 class EblScoring(GapScoring, Scoring):
     def __init__(self, vocabulary: Vocabulary):
         self.vocabulary = vocabulary
         self.line_break = vocabulary.encode(LINE_BREAK)
-        self.x = vocabulary.encode(UNCLEAR_OR_UNKNOWN_SIGN)
+        self._scores: Dict[Tuple[int, int], int] = {}
 
     def __call__(self, firstElement, secondElement) -> int:
-        return next(
-            score()
-            for (predicate, score) in self._get_scores(firstElement, secondElement)
-            if predicate
-        )
+        key = (firstElement, secondElement)
+        try:
+            return self._scores[key]
+        except KeyError:
+            score = self._scores[key] = score_signs(
+                self.vocabulary.decode(firstElement),
+                self.vocabulary.decode(secondElement),
+            )
+            return score
 
     def gapStart(self, element) -> int:
         return gap_start
 
     def gapExtension(self, element) -> int:
         return break_gap_extension if element == self.line_break else gap_extension
-
-    def _get_scores(
-        self, firstElement, secondElement
-    ) -> Generator[Tuple[bool, Callable[[], int]], None, None]:
-        first_decoded = self.vocabulary.decode(firstElement)
-        second_decoded = self.vocabulary.decode(secondElement)
-
-        yield (
-            self._is_break(firstElement, secondElement),
-            lambda: self._get_break_score(firstElement, secondElement),
-        )
-        yield (
-            self._is_x(firstElement, secondElement),
-            lambda: self._get_x_score(firstElement, secondElement),
-        )
-        yield (is_curated(first_decoded, second_decoded), lambda: common_mismatch)
-        yield (
-            is_variant(first_decoded, second_decoded),
-            lambda: self._get_variant_score(first_decoded, second_decoded),
-        )
-        yield (True, lambda: match if firstElement == secondElement else mismatch)
-
-    def _is_break(self, first_element, second_element) -> bool:
-        return first_element == self.line_break or second_element == self.line_break
-
-    def _is_x(self, first_element, second_element) -> bool:
-        return first_element == self.x or second_element == self.x
-
-    def _get_break_score(self, first_element, second_element) -> int:
-        return break_match if first_element == second_element else break_mismatch
-
-    def _get_x_score(self, first_element, second_element) -> int:
-        return x_match if first_element == second_element else x_mismatch
-
-    def _get_variant_score(self, first_decoded: str, second_decoded: str) -> int:
-        result = []
-        for first_part in first_decoded.split(VARIANT_SEPARATOR):
-            for second_part in second_decoded.split(VARIANT_SEPARATOR):
-                result.append(
-                    self(
-                        self.vocabulary.encode(first_part),
-                        self.vocabulary.encode(second_part),
-                    )
-                )
-        return max(result)
@@ -0,0 +1,235 @@
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from alignment.sequence import EncodedSequence
+from alignment.sequencealigner import SequenceAlignment
+
+from ebl.alignment.domain.scoring import (
+    EblScoring,
+    common_mismatch,
+    curated_substitutions,
+    match,
+    mismatch,
+)
+from ebl.alignment.domain.sequence import LINE_BREAK, UNCLEAR_OR_UNKNOWN_SIGN
+from ebl.transliteration.domain.atf import VARIANT_SEPARATOR
+
+NEGATIVE_INFINITY = np.iinfo(np.int64).min // 4
+
+FROM_GAP_IN_FIRST = 1
+FROM_GAP_IN_SECOND = 2
+OPENS_GAP_IN_FIRST = 4
+OPENS_GAP_IN_SECOND = 8
+
+ANY = 0
+GAP_IN_FIRST = 1
+GAP_IN_SECOND = 2
+
+
+def _elements(sequence: EncodedSequence) -> np.ndarray:
+    return np.asarray(sequence.elements[: len(sequence)], dtype=np.int64)
+
+
+def _is_scored_separately(sign: str) -> bool:
+    return sign in (LINE_BREAK, UNCLEAR_OR_UNKNOWN_SIGN) or VARIANT_SEPARATOR in sign
+
+
+def substitution_table(
+    scoring: EblScoring, first: Sequence[int], second: Sequence[int]
+) -> np.ndarray:
+    """Score every element of `first` against every element of `second`.
+
+    Only line breaks, unclear signs and variants are scored one by one,
+    the rest is filled in from matches and the curated substitutions.
+    """
+    first_signs = [scoring.vocabulary.decode(element) for element in first]
+    second_signs = [scoring.vocabulary.decode(element) for element in second]
+    table = np.where(
+        np.equal.outer(np.asarray(first), np.asarray(second)), match, mismatch
+    )
+
+    second_indexes: Dict[str, list] = {}
+    for index, sign in enumerate(second_signs):
+        second_indexes.setdefault(sign, []).append(index)
+    for row, sign in enumerate(first_signs):
+        for pair in curated_substitutions:
+            if sign in pair:
+                (other,) = pair - {sign}
+                table[row, second_indexes.get(other, [])] = common_mismatch
+
+    for row, sign in enumerate(first_signs):
+        if _is_scored_separately(sign):
+            table[row] = [scoring(int(first[row]), int(element)) for element in second]
+    for column, sign in enumerate(second_signs):
+        if _is_scored_separately(sign):
+            table[:, column] = [
+                scoring(int(element), int(second[column])) for element in first
+            ]
+    return table
+
+
+class VectorizedAligner:
+    """Global alignment with free end gaps computed row by row with NumPy.
+
+    The rows follow the first sequence and each row is computed with whole
+    array operations over the second sequence, so the shorter sequence should
+    be passed first. A gap scores `gapStart` for its first element and
+    `gapExtension` for each further element. Gaps before the first and after
+    the last aligned pair are free and are not part of the alignment. A single
+    alignment is traced back, breaking ties in favour of a match, then a gap
+    in the first sequence, then a gap in the second sequence.
+    """
+
+    def __init__(self, scoring: EblScoring):
+        self.scoring = scoring
+
+    def align(
+        self, first: EncodedSequence, second: EncodedSequence, backtrace=False
+    ) -> Union[int, Tuple[int, List[SequenceAlignment]]]:
+        a = _elements(first)
+        b = _elements(second)
+        score, traceback = self._compute(a, b)
+        if backtrace:
+            return score, [self._backtrace(first, second, a, b, traceback)]
+        else:
+            return score
+
+    def _substitutions(
+        self, a: np.ndarray, b: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Score each distinct sign of the first sequence against the second."""
+        codes_a, index_a = np.unique(a, return_inverse=True)
+        codes_b, index_b = np.unique(b, return_inverse=True)
+        table = substitution_table(self.scoring, codes_a, codes_b)
+        return table[:, index_b.reshape(-1)], index_a.reshape(-1)
+
+    def _gap_scores(self, elements: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        start = np.array(
+            [self.scoring.gapStart(int(element)) for element in elements],
+            dtype=np.int64,
+        )
+        extension = np.array(
+            [self.scoring.gapExtension(int(element)) for element in elements],
+            dtype=np.int64,
+        )
+        return start, extension
+
+    def _compute(self, a: np.ndarray, b: np.ndarray) -> Tuple[int, np.ndarray]:
+        m, n = len(a), len(b)
+        traceback = np.zeros((m + 1, n + 1), dtype=np.uint8)
+        if m == 0 or n == 0:
+            return 0, traceback
+
+        substitutions, rows = self._substitutions(a, b)
+        start_a, extension_a = self._gap_scores(a)
+        start_b, extension_b = self._gap_scores(b)
+        # A gap may also be closed and opened again at no extra cost, so an
+        # element continues a gap with the better of both scores.
+        continuation_b = np.maximum(start_b, extension_b)
+        continued = np.concatenate(([0], np.cumsum(continuation_b)))
+
+        previous = np.zeros(n + 1, dtype=np.int64)
+        gap_in_second = np.full(n + 1, NEGATIVE_INFINITY, dtype=np.int64)
+        for i in range(1, m + 1):
+            current = np.zeros(n + 1, dtype=np.int64)
+            pointers = traceback[i]
+
+            matched = np.full(n + 1, NEGATIVE_INFINITY, dtype=np.int64)
+            matched[1:] = previous[:-1] + substitutions[rows[i - 1]]
+
+            opened = previous + start_a[i - 1]
+            extended = gap_in_second + extension_a[i - 1]
+            gap_in_second = np.maximum(opened, extended)
+            pointers |= np.where(opened >= extended, OPENS_GAP_IN_SECOND, 0).astype(
+                np.uint8
+            )
+            gap_in_second[0] = NEGATIVE_INFINITY
+            gap_in_second[n] = previous[n]
+
+            best = np.maximum(matched, gap_in_second)
+            best[0] = 0
+
+            if i == m:
+                gap_in_first = np.full(n + 1, NEGATIVE_INFINITY, dtype=np.int64)
+                gap_in_first[1:] = np.maximum.accumulate(best)[:-1]
+            else:
+                candidates = best[:-1] + start_b - continued[1:]
+                running = np.maximum.accumulate(candidates)
+                gap_in_first = np.full(n + 1, NEGATIVE_INFINITY, dtype=np.int64)
+                gap_in_first[1:] = running + continued[1:]
+
+            takes_gap_in_first = (gap_in_first > matched) & (
+                gap_in_first >= gap_in_second
+            )
+            pointers |= np.where(takes_gap_in_first, FROM_GAP_IN_FIRST, 0).astype(
+                np.uint8
+            )
+            pointers |= np.where(gap_in_second > matched, FROM_GAP_IN_SECOND, 0).astype(
+                np.uint8
+            )
+            current[1:] = np.maximum(best, gap_in_first)[1:]
+            if i < m:
+                pointers[1:] |= np.where(
+                    current[:-1] + start_b >= gap_in_first[:-1] + extension_b,
+                    OPENS_GAP_IN_FIRST,
+                    0,
+                ).astype(np.uint8)
+            previous = current
+
+        return int(previous[n]), traceback
+
+    def _backtrace(
+        self,
+        first: EncodedSequence,
+        second: EncodedSequence,
+        a: np.ndarray,
+        b: np.ndarray,
+        traceback: np.ndarray,
+    ) -> SequenceAlignment:
+        m, n = len(a), len(b)
+        alignment = SequenceAlignment(
+            EncodedSequence(m + n, id=first.id), EncodedSequence(m + n, id=second.id)
+        )
+        i, j = m, n
+        state = ANY
+        while i > 0 and j > 0:
+            pointers = int(traceback[i, j])
+            element_a = int(a[i - 1])
+            element_b = int(b[j - 1])
+            if state == ANY:
+                if pointers & FROM_GAP_IN_FIRST:
+                    state = GAP_IN_FIRST
+                elif pointers & FROM_GAP_IN_SECOND:
+                    state = GAP_IN_SECOND
+                else:
+                    alignment.push(
+                        element_a, element_b, self.scoring(element_a, element_b)
+                    )
+                    i, j = i - 1, j - 1
+            elif state == GAP_IN_FIRST:
+                if i == m:
+                    state = ANY
+                elif pointers & OPENS_GAP_IN_FIRST:
+                    alignment.push(
+                        alignment.gap, element_b, self.scoring.gapStart(element_b)
+                    )
+                    state = ANY
+                else:
+                    alignment.push(
+                        alignment.gap, element_b, self.scoring.gapExtension(element_b)
+                    )
+                j -= 1
+            else:
+                if j == n:
+                    state = ANY
+                elif pointers & OPENS_GAP_IN_SECOND:
+                    alignment.push(
+                        element_a, alignment.gap, self.scoring.gapStart(element_a)
+                    )
+                    state = ANY
+                else:
+                    alignment.push(
+                        element_a, alignment.gap, self.scoring.gapExtension(element_a)
+                    )
+                i -= 1
+        return alignment.reversed()
@@ -1,4 +1,6 @@
 import os
+import signal
+import sys
 from base64 import b64decode
 
 import falcon
@@ -15,6 +17,7 @@ from ebl.bibliography.web.bootstrap import create_bibliography_routes
 from ebl.cache.application.cache import create_cache
 from ebl.cache.application.custom_cache import ChapterCache
 from ebl.cache.infrastructure.mongo_cache_repository import MongoCacheRepository
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
 from ebl.changelog import Changelog
 from ebl.context import Context
 from ebl.corpus.infrastructure.mongo_text_repository import MongoTextRepository
@@ -25,6 +28,7 @@ from ebl.ebl_ai_client import EblAiClient
 from ebl.files.infrastructure.grid_fs_file_repository import GridFsFileRepository
 from ebl.files.web.bootstrap import create_files_route
 from ebl.markup.web.bootstrap import create_markup_routes
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.infrastructure.cropped_sign_images_repository import (
     MongoCroppedSignImagesRepository,
 )
@@ -39,7 +43,11 @@ from ebl.lemmatization.infrastrcuture.mongo_suggestions_finder import (
     MongoLemmaRepository,
 )
 from ebl.lemmatization.web.bootstrap import create_lemmatization_routes
+from ebl.signs.infrastructure.cached_sign_catalogue import CachedSignCatalogue
 from ebl.signs.infrastructure.mongo_sign_repository import MongoSignRepository
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+)
 from ebl.signs.web.bootstrap import create_signs_routes
 from ebl.afo_register.web.bootstrap import create_afo_register_routes
 from ebl.dossiers.web.bootstrap import create_dossiers_routes
@@ -79,7 +87,7 @@ def set_sentry_user(id_: str) -> None:
         scope.user = {"id": id_}
 
 
-def create_context():
+def create_context(batched_changelog: bool = False):
     ebl_ai_client = EblAiClient(os.environ["EBL_AI_API"])
     client = MongoClient(os.environ["MONGODB_URI"])
     database = client.get_database(os.environ.get("MONGODB_DB"))
@@ -93,21 +101,23 @@ def create_context():
     cache = create_cache()
     cache_repository = MongoCacheRepository(database)
     cache_repository.create_indexes()
-    custom_cache = ChapterCache(cache_repository)
+    custom_cache = ChapterCache(cache_repository, MongoVersionRepository(database))
     provenance_repository = MongoProvenanceRepository(database)
     provenance_service = ProvenanceService(provenance_repository)
+    fragment_repository = MongoFragmentRepository(database, provenance_service)
+    sign_repository = MongoSignRepository(database)
     return Context(
         ebl_ai_client=ebl_ai_client,
         auth_backend=MultiAuthBackend(auth_backend, guest_backend),
         cropped_sign_images_repository=MongoCroppedSignImagesRepository(database),
         word_repository=MongoWordRepository(database),
-        sign_repository=MongoSignRepository(database),
+        sign_repository=sign_repository,
         public_file_repository=GridFsFileRepository(database, "fs"),
         photo_repository=GridFsFileRepository(database, "photos"),
         folio_repository=GridFsFileRepository(database, "folios"),
         thumbnail_repository=GridFsFileRepository(database, "thumbnails"),
-        fragment_repository=MongoFragmentRepository(database, provenance_service),
-        changelog=Changelog(database),
+        fragment_repository=fragment_repository,
+        changelog=Changelog(database, batched=batched_changelog),
         bibliography_repository=MongoBibliographyRepository(database),
         text_repository=MongoTextRepository(database, provenance_service),
         annotations_repository=MongoAnnotationsRepository(database),
@@ -121,6 +131,9 @@ def create_context():
         custom_cache=custom_cache,
         cache=cache,
         parallel_line_injector=ParallelLineInjector(MongoParallelRepository(database)),
+        line_to_vec_store=LineToVecStore(fragment_repository),
+        transliteration_query_cache=TransliterationQueryCache(sign_repository),
+        sign_catalogue=CachedSignCatalogue(sign_repository),
     )
 
 
@@ -152,7 +165,25 @@ def create_app(context: Context, issuer: str = "", audience: str = ""):
     return api
 
 
+def close_on_termination(changelog: Changelog) -> None:
+    """Write the queued changelog entries before the server is stopped.
+
+    Python does not run the exit handlers when it is terminated by SIGTERM.
+    """
+    previous = signal.getsignal(signal.SIGTERM)
+
+    def terminate(signum, frame) -> None:
+        changelog.close()
+        if callable(previous):
+            previous(signum, frame)
+        else:
+            sys.exit(128 + signum)
+
+    signal.signal(signal.SIGTERM, terminate)
+
+
 def get_app():
     sentry_sdk.init(dsn=os.environ["SENTRY_DSN"], integrations=[FalconIntegration()])
-    context = create_context()
+    context = create_context(batched_changelog=True)
+    close_on_termination(context.changelog)
     return create_app(context, os.environ["AUTH0_ISSUER"], os.environ["AUTH0_AUDIENCE"])
@@ -1,5 +1,5 @@
 import codecs
-from lark import Lark, ParseError
+from lark import ParseError
 from lark.visitors import Tree
 from typing import Tuple, Optional, List, Dict, Type, Any
 from ebl.atf_importer.domain.atf_preprocessor import AtfPreprocessor
@@ -20,6 +20,7 @@ from ebl.transliteration.domain.line import EmptyLine, ControlLine
 from ebl.transliteration.domain.atf import ATF_PARSER_VERSION
 from ebl.atf_importer.application.lemmatization import LemmaLookup
 from ebl.atf_importer.application.atf_importer_config import AtfImporterConfigData
+from ebl.transliteration.domain.atf_parsers.lark_parser_cache import open_parser
 from ebl.transliteration.domain.atf_parsers.lark_parser_errors import PARSE_ERRORS
 from ebl.transliteration.domain.transliteration_error import TransliterationError
 from ebl.transliteration.domain.transliteration_error import (
@@ -39,11 +40,7 @@ def include_line(line_instance) -> bool:
 
 
 class LegacyAtfConverter:
-    ebl_parser = Lark.open(
-        "../../transliteration/domain/atf_parsers/lark_parser/ebl_atf.lark",
-        maybe_placeholders=True,
-        rel_to=__file__,
-    )
+    ebl_parser = open_parser("ebl_atf.lark", maybe_placeholders=True)
     indexing_visitor = IndexingVisitor()
     legacy_visitor = LegacyAtfVisitor()
     translation_block_transformer = translation_block_transformer[0]
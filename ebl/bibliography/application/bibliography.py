@@ -1,5 +1,5 @@
 import re
-from typing import Any, Mapping, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence
 
 import attr
 from pydash import uniq_with
@@ -56,7 +56,59 @@ class Bibliography:
                 seen_ids.add(resolved_id)
         return resolved_entries
 
-    def _follow_redirect(self, entry: dict) -> dict:
+    def find_all(self, ids: Iterable[str]) -> Dict[str, dict]:
+        unresolved = list(dict.fromkeys(ids))
+        found: Dict[str, dict] = {}
+        for query in (
+            self._query_by_ids,
+            self._repository.query_by_citation_keys,
+            self._repository.query_by_aliases,
+        ):
+            if not unresolved:
+                break
+            found.update(query(unresolved))
+            unresolved = [id_ for id_ in unresolved if id_ not in found]
+        if unresolved:
+            raise NotFoundError(f"bibliography {unresolved[0]} not found.")
+
+        entries = self._query_redirect_targets(found.values())
+
+        def query_by_id(id_: str) -> dict:
+            try:
+                return entries[id_]
+            except KeyError as error:
+                raise NotFoundError(f"bibliography {id_} not found.") from error
+
+        return {
+            id_: self._follow_redirect(entry, query_by_id)
+            for id_, entry in found.items()
+        }
+
+    def _query_by_ids(self, ids: Sequence[str]) -> Dict[str, dict]:
+        return {entry["id"]: entry for entry in self._repository.query_by_ids(ids)}
+
+    def _query_redirect_targets(self, entries: Iterable[dict]) -> Dict[str, dict]:
+        known = {entry["id"]: entry for entry in entries}
+        pending = list(known.values())
+        for _ in range(MAX_REDIRECT_DEPTH):
+            targets = {
+                redirect_to
+                for entry in pending
+                if entry.get("deprecated", False)
+                and isinstance(redirect_to := entry.get("redirectTo"), str)
+                and redirect_to
+                and redirect_to not in known
+            }
+            if not targets:
+                break
+            pending = list(self._repository.query_by_ids(sorted(targets)))
+            known.update((entry["id"], entry) for entry in pending)
+        return known
+
+    def _follow_redirect(
+        self, entry: dict, query_by_id: Optional[Callable[[str], dict]] = None
+    ) -> dict:
+        query_by_id = query_by_id or self._repository.query_by_id
         current = entry
         visited_ids: set[str] = set()
         redirects_followed = 0
@@ -81,7 +133,7 @@ class Bibliography:
             if isinstance(current_id, str):
                 visited_ids.add(current_id)
             try:
-                current = self._repository.query_by_id(redirect_to)
+                current = query_by_id(redirect_to)
             except NotFoundError as error:
                 raise NotFoundError(
                     f"Bibliography redirect target {redirect_to} not found."
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Optional, Sequence
+from typing import Any, Mapping, Optional, Sequence
 
 from ebl.bibliography.application.lookup_reservation import LookupReservationOperation
 from ebl.errors import DuplicateError
@@ -73,6 +73,14 @@ class BibliographyRepository(ABC):
     def query_by_ids(self, ids: Sequence[str]) -> Sequence[Any]:
         raise NotImplementedError
 
+    @abstractmethod
+    def query_by_citation_keys(self, citation_keys: Sequence[str]) -> Mapping[str, Any]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_by_aliases(self, aliases: Sequence[str]) -> Mapping[str, Any]:
+        raise NotImplementedError
+
     @abstractmethod
     def update(self, entry: Any) -> None:
         raise NotImplementedError
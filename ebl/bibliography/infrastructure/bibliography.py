@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 
 import pymongo
 
@@ -109,6 +109,51 @@ class MongoBibliographyRepository(BibliographyRepository):
         data = self._collection.find_many({"_id": {"$in": ids}})
         return [create_object_entry(item) for item in data]
 
+    def query_by_citation_keys(self, citation_keys: Sequence[str]) -> Dict[str, dict]:
+        entries: Dict[str, dict] = {}
+        for data in self._collection.find_many(
+            {"citationKey": {"$in": list(citation_keys)}}
+        ):
+            citation_key = data["citationKey"]
+            if citation_key in entries:
+                raise DuplicateError(
+                    f"bibliography citation key {citation_key} is ambiguous."
+                )
+            entries[citation_key] = create_object_entry(data)
+        return entries
+
+    def query_by_aliases(self, aliases: Sequence[str]) -> Dict[str, dict]:
+        normalized_aliases = {alias: normalize_partner_id(alias) for alias in aliases}
+        query = {
+            "$or": [
+                {ALIASES_VALUE_FIELD: {"$in": list(normalized_aliases)}},
+                {
+                    "aliases.normalizedValue": {
+                        "$in": [value for value in normalized_aliases.values() if value]
+                    }
+                },
+            ]
+        }
+        matches: Dict[str, List[dict]] = {}
+        for data in self._collection.find_many(query):
+            stored = [
+                alias for alias in data.get("aliases", []) if isinstance(alias, dict)
+            ]
+            values = {alias.get("value") for alias in stored}
+            normalized_values = {alias.get("normalizedValue") for alias in stored}
+            for alias, normalized_alias in normalized_aliases.items():
+                if alias in values or (
+                    normalized_alias and normalized_alias in normalized_values
+                ):
+                    matches.setdefault(alias, []).append(data)
+
+        entries: Dict[str, dict] = {}
+        for alias, data in matches.items():
+            if len({item["_id"] for item in data}) > 1:
+                raise DuplicateError(f"bibliography alias {alias} is ambiguous.")
+            entries[alias] = create_object_entry(data[0])
+        return entries
+
     def update(self, entry) -> None:
         mongo_entry = create_mongo_entry(entry)
         self._collection.replace_one(mongo_entry)
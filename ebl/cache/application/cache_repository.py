@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class CacheRepository(ABC):
@@ -11,7 +12,7 @@ class CacheRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def set(self, cache_key: str, item: dict) -> None:
+    def set(self, cache_key: str, item: dict, timeout: Optional[int] = None) -> None:
         raise NotImplementedError
 
     @abstractmethod
@@ -1,7 +1,113 @@
+import json
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Callable, Collection, NamedTuple, Optional
+
 import attr
 
+from ebl.cache.application.cache import DAILY_TIMEOUT
 from ebl.cache.application.cache_repository import CacheRepository
+from ebl.cache.application.local_cache import LocalCache, LocalCacheStatistics
+from ebl.cache.application.version_repository import VersionRepository
 from ebl.corpus.domain.chapter import ChapterId
+from ebl.errors import NotFoundError
+
+CHAPTER_CACHE_VERSION: str = "chapterCache"
+CHAPTER_DISPLAY_TIMEOUT: int = 7 * DAILY_TIMEOUT
+DEFAULT_REFRESH_INTERVAL: float = 60
+
+
+def compress(data) -> bytes:
+    return zlib.compress(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+
+
+def decompress(data: bytes):
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def compress_chapter(chapter: dict) -> dict:
+    return {
+        "chapter": compress(
+            {key: value for key, value in chapter.items() if key != "lines"}
+        ),
+        "lines": [compress(line) for line in chapter["lines"]],
+    }
+
+
+def decompress_chapter(item: dict, lines: Optional[Collection[int]] = None) -> dict:
+    return {
+        **decompress(item["chapter"]),
+        "lines": [
+            decompress(line) if lines is None or index in lines else None
+            for index, line in enumerate(item["lines"])
+        ],
+    }
+
+
+def compressed_size(item: dict) -> int:
+    return len(item["chapter"]) + sum(len(line) for line in item["lines"])
+
+
+class ChapterCacheStatistics(NamedTuple):
+    local: LocalCacheStatistics
+    mongo_hits: int
+    mongo_misses: int
+
+
+class CachedVersion:
+    """A version read from the repository at most once per refresh interval."""
+
+    def __init__(
+        self,
+        versions: VersionRepository,
+        key: str,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._versions = versions
+        self._key = key
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._version = 0
+        self._checked_at: Optional[float] = None
+
+    def get(self) -> int:
+        now = self._clock()
+        with self._lock:
+            if (
+                self._checked_at is not None
+                and now - self._checked_at < self._refresh_interval
+            ):
+                return self._version
+        version = self._versions.get(self._key)
+        with self._lock:
+            self._version = version
+            self._checked_at = now
+        return version
+
+    def increment(self) -> int:
+        version = self._versions.increment(self._key)
+        now = self._clock()
+        with self._lock:
+            self._version = version
+            self._checked_at = now
+        return version
+
+
+def _create_chapter_version(cache: "ChapterCache") -> Optional[CachedVersion]:
+    return (
+        None
+        if cache._versions is None
+        else CachedVersion(
+            cache._versions,
+            CHAPTER_CACHE_VERSION,
+            cache._refresh_interval,
+            cache._clock,
+        )
+    )
 
 
 @attr.attrs(auto_attribs=True, frozen=True)
@@ -26,5 +132,61 @@ class CustomCache:
 
 @attr.attrs(auto_attribs=True, frozen=True)
 class ChapterCache(CustomCache):
+    _versions: Optional[VersionRepository] = None
+    _local: LocalCache[dict] = attr.Factory(LocalCache)
+    _mongo_counts: Counter = attr.Factory(Counter)
+    _refresh_interval: float = DEFAULT_REFRESH_INTERVAL
+    _clock: Callable[[], float] = time.monotonic
+    _version: Optional[CachedVersion] = attr.Factory(
+        _create_chapter_version, takes_self=True
+    )
+
+    @property
+    def statistics(self) -> ChapterCacheStatistics:
+        return ChapterCacheStatistics(
+            self._local.statistics,
+            self._mongo_counts["hits"],
+            self._mongo_counts["misses"],
+        )
+
+    def get_chapter_display(
+        self, chapter_id: ChapterId, lines: Optional[Collection[int]] = None
+    ) -> Optional[dict]:
+        """Lines not in `lines` are left compressed and returned as None."""
+        key = str(chapter_id)
+        version = self._get_version()
+        item = None if version is None else self._local.get(key, version)
+        if item is None:
+            item = self._get_compressed(key)
+            if item is None:
+                return None
+            if version is not None:
+                self._local.set(key, item, compressed_size(item), version)
+        return decompress_chapter(item, lines)
+
+    def set_chapter_display(self, chapter_id: ChapterId, chapter: dict) -> None:
+        key = str(chapter_id)
+        item = compress_chapter(chapter)
+        self._mongo_cache_repository.set(key, item, CHAPTER_DISPLAY_TIMEOUT)
+        version = self._get_version()
+        if version is not None:
+            self._local.set(key, item, compressed_size(item), version)
+
     def delete_chapter(self, chapter_id: ChapterId) -> None:
         self.delete_all(pattern=rf"^{str(chapter_id)}(\sline-\d+)?$")
+        if self._version is not None:
+            self._version.increment()
+
+    def _get_version(self) -> Optional[int]:
+        return None if self._version is None else self._version.get()
+
+    def _get_compressed(self, key: str) -> Optional[dict]:
+        try:
+            item = self._mongo_cache_repository.get(key)
+        except NotFoundError:
+            item = None
+        if item is None or "chapter" not in item:
+            self._mongo_counts["misses"] += 1
+            return None
+        self._mongo_counts["hits"] += 1
+        return item
@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from typing import Generic, NamedTuple, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+
+class LocalCacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    bytes: int
+
+
+class LocalCache(Generic[T]):
+    """A thread-safe LRU bounded by the total size of its entries.
+
+    Entries are stamped with a version. Reading with a different version
+    drops every entry, so a shared counter can invalidate all processes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[int, T]] = OrderedDict()
+        self._version = 0
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def statistics(self) -> LocalCacheStatistics:
+        with self._lock:
+            return LocalCacheStatistics(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._bytes,
+            )
+
+    def get(self, key: str, version: int) -> Optional[T]:
+        with self._lock:
+            self._set_version(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: str, value: T, size: int, version: int) -> None:
+        with self._lock:
+            self._set_version(version)
+            self._remove(key)
+            if size > self._max_bytes:
+                return
+            self._entries[key] = (size, value)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[0]
+
+    def _set_version(self, version: int) -> None:
+        if version != self._version:
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+
+class VersionRepository(ABC):
+    @abstractmethod
+    def get(self, key: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def increment(self, key: str) -> int:
+        raise NotImplementedError
@@ -1,10 +1,12 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
 import pymongo
 from pymongo.database import Database
 
 from ebl.cache.application.cache_repository import CacheRepository
 from ebl.mongo_collection import MongoCollection
 
-
 COLLECTION = "cache"
 
 
@@ -14,6 +16,9 @@ class MongoCacheRepository(CacheRepository):
 
     def create_indexes(self) -> None:
         self._collection.create_index([("cache_key", pymongo.ASCENDING)])
+        self._collection.create_index(
+            [("expiresAt", pymongo.ASCENDING)], expireAfterSeconds=0
+        )
 
     def has(self, cache_key: str, regex=False) -> bool:
         return self._collection.exists(
@@ -22,11 +27,21 @@ class MongoCacheRepository(CacheRepository):
 
     def get(self, cache_key: str) -> dict:
         return self._collection.find_one(
-            {"cache_key": cache_key}, projection={"cache_key": 0, "_id": 0}
+            {"cache_key": cache_key},
+            projection={"cache_key": 0, "_id": 0, "expiresAt": 0},
         )
 
-    def set(self, cache_key: str, item: dict) -> None:
-        self._collection.insert_one({"cache_key": cache_key, **item})
+    def set(self, cache_key: str, item: dict, timeout: Optional[int] = None) -> None:
+        expiration = (
+            {}
+            if timeout is None
+            else {"expiresAt": datetime.now(timezone.utc) + timedelta(seconds=timeout)}
+        )
+        self._collection.replace_one(
+            {"cache_key": cache_key, **item, **expiration},
+            {"cache_key": cache_key},
+            upsert=True,
+        )
 
     def delete(self, cache_key: str) -> None:
         if self.has(cache_key):
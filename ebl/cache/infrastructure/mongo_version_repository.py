@@ -0,0 +1,23 @@
+from pymongo import ReturnDocument
+from pymongo.database import Database
+
+from ebl.cache.application.version_repository import VersionRepository
+
+COLLECTION = "versions"
+
+
+class MongoVersionRepository(VersionRepository):
+    def __init__(self, database: Database) -> None:
+        self._collection = database[COLLECTION]
+
+    def get(self, key: str) -> int:
+        document = self._collection.find_one({"_id": key})
+        return 0 if document is None else document["version"]
+
+    def increment(self, key: str) -> int:
+        return self._collection.find_one_and_update(
+            {"_id": key},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )["version"]
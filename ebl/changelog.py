@@ -1,9 +1,61 @@
+import atexit
 import datetime
+import logging
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import MutableMapping, MutableSequence
+from typing import Any, List, NamedTuple, Optional, Sequence, Tuple
 
 import dictdiffer
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
 
 from ebl.mongo_collection import MongoCollection
 
+logger = logging.getLogger(__name__)
+
+COLLECTION = "changelog"
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_DELAY = 0.5
+DUPLICATE_KEY_ERROR = 11000
+
+_STOP = object()
+
+
+def prune_unchanged(old: Any, new: Any) -> Tuple[Any, Any]:
+    """Replace the values which are equal in both with None.
+
+    Equal values produce no diff, so the diff only has to walk the changed
+    sub-documents. Keys, indices and their order are kept.
+    """
+    if old == new:
+        return None, None
+    if isinstance(old, MutableMapping) and isinstance(new, MutableMapping):
+        pruned = {key: prune_unchanged(old[key], new[key]) for key in old if key in new}
+        return (
+            {key: pruned[key][0] if key in pruned else old[key] for key in old},
+            {key: pruned[key][1] if key in pruned else new[key] for key in new},
+        )
+    if isinstance(old, MutableSequence) and isinstance(new, MutableSequence):
+        size = min(len(old), len(new))
+        pruned_items = [
+            prune_unchanged(old_item, new_item)
+            for old_item, new_item in zip(old[:size], new[:size], strict=True)
+        ]
+        return (
+            [old_item for old_item, _ in pruned_items] + list(old[size:]),
+            [new_item for _, new_item in pruned_items] + list(new[size:]),
+        )
+    return old, new
+
+
+def diff(old: dict, new: dict) -> list:
+    return list(dictdiffer.diff(*prune_unchanged(old, new)))
+
 
 def create_entry(user_profile: dict, resource_type, resource_id, diff) -> dict:
     return {
@@ -17,12 +69,158 @@ def create_entry(user_profile: dict, resource_type, resource_id, diff) -> dict:
     }
 
 
+class ChangelogStatistics(NamedTuple):
+    queued: int
+    written: int
+    failed: int
+    batches: int
+
+
+class ChangelogWriter:
+    """Inserts changelog entries in batches on a background thread.
+
+    Adding blocks while the queue is full. Failed inserts are retried with
+    an exponential backoff. The queued entries are written when the writer is
+    closed, which is done at exit and on SIGTERM in the web app.
+    """
+
+    def __init__(
+        self,
+        collection: MongoCollection,
+        max_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+    ) -> None:
+        self._collection = collection
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._queue: queue.Queue = queue.Queue(max_size)
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="changelog-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def statistics(self) -> ChangelogStatistics:
+        with self._lock:
+            return ChangelogStatistics(
+                self._queue.qsize(),
+                self._counts["written"],
+                self._counts["failed"],
+                self._counts["batches"],
+            )
+
+    def add(self, entry: dict) -> None:
+        if self._closed:
+            self._write([entry])
+        else:
+            self._queue.put(entry)
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        atexit.unregister(self.close)
+        self._write_remaining()
+
+    def _run(self) -> None:
+        stopped = False
+        while not stopped:
+            batch, stopped = self._take_batch()
+            if batch:
+                self._write(batch)
+            for _ in range(len(batch) + int(stopped)):
+                self._queue.task_done()
+
+    def _take_batch(self) -> Tuple[List[dict], bool]:
+        batch: List[dict] = []
+        entry = self._queue.get()
+        while entry is not _STOP:
+            batch.append(entry)
+            if len(batch) >= self._batch_size:
+                return batch, False
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _write_remaining(self) -> None:
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+            self._queue.task_done()
+        if remaining:
+            self._write(remaining)
+
+    def _write(self, batch: Sequence[dict]) -> None:
+        pending = list(batch)
+        for attempt in range(self._max_attempts):
+            if attempt:
+                logger.warning("Retrying %d changelog entries.", len(pending))
+                time.sleep(self._retry_delay * 2 ** (attempt - 1))
+            try:
+                self._collection.insert_many(pending, ordered=False)
+                pending = []
+            except BulkWriteError as error:
+                pending = _retryable_entries(pending, error)
+            except Exception:
+                logger.exception("Could not write %d changelog entries.", len(pending))
+            if not pending:
+                break
+        if pending:
+            logger.error("Could not write changelog entries: %r", pending)
+        self._count(written=len(batch) - len(pending), failed=len(pending), batches=1)
+
+    def _count(self, **counts: int) -> None:
+        with self._lock:
+            self._counts.update(counts)
+
+
+def _retryable_entries(entries: Sequence[dict], error: BulkWriteError) -> List[dict]:
+    """Entries which failed for other reasons than being written already."""
+    return [
+        entries[write_error["index"]]
+        for write_error in error.details.get("writeErrors", [])
+        if write_error.get("code") != DUPLICATE_KEY_ERROR
+    ]
+
+
 class Changelog:
-    def __init__(self, database):
-        self._collection = MongoCollection(database, "changelog")
+    def __init__(self, database, batched: bool = False):
+        self._collection = MongoCollection(database, COLLECTION)
+        self._writer: Optional[ChangelogWriter] = (
+            ChangelogWriter(self._collection) if batched else None
+        )
+
+    @property
+    def statistics(self) -> Optional[ChangelogStatistics]:
+        return None if self._writer is None else self._writer.statistics
 
     def create(self, resource_type, user_profile, old, new):
-        entry = create_entry(
-            user_profile, resource_type, old["_id"], list(dictdiffer.diff(old, new))
-        )
-        return self._collection.insert_one(entry)
+        entry = create_entry(user_profile, resource_type, old["_id"], diff(old, new))
+        if self._writer is None:
+            return self._collection.insert_one(entry)
+        entry["_id"] = ObjectId()
+        self._writer.add(entry)
+        return entry["_id"]
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
@@ -5,7 +5,7 @@ from ebl.transliteration.application.transliteration_query_factory import (
     TransliterationQueryFactory,
 )
 
-COUNT_MODES = ("exact", "none", "page")
+COUNT_MODES = ("exact", "estimate", "none", "page")
 
 
 def parse_integer_field(field: str) -> Callable[[Dict], Dict]:
@@ -53,13 +53,17 @@ def parse_transliteration(
         if "transliteration" not in parameters:
             return parameters
 
+        queries = [
+            transliteration_query_factory.create(line)
+            for line in parameters["transliteration"].strip().split("\n")
+            if line
+        ]
         return {
             **parameters,
-            "transliteration": [
-                transliteration_query_factory.create(line).regexp
-                for line in parameters["transliteration"].strip().split("\n")
-                if line
-            ],
+            "transliteration": [query.regexp for query in queries],
+            "signNgrams": sorted(
+                {ngram for query in queries for ngram in query.sign_ngrams}
+            ),
         }
 
     return _parse
@@ -57,6 +57,13 @@ class AfORegisterToFragmentQueryItemSchema(Schema):
         return AfORegisterToFragmentQueryItem(**data)
 
 
+def _count_mode(data: dict) -> str:
+    """Tell clients whether they have to ask for the exact total separately."""
+    if data["matchCountTotal"] is None:
+        return "none" if data.get("hasNextPage") is None else "page"
+    return "exact" if data.get("isMatchCountTotalExact", True) else "estimate"
+
+
 class QueryResultSchema(Schema):
     def __init__(self, *args, include_count_metadata=False, **kwargs):
         super().__init__(*args, **kwargs)
@@ -75,7 +82,9 @@ class QueryResultSchema(Schema):
 
     @post_dump
     def filter_count_metadata(self, data, **kwargs):
-        if not self._include_count_metadata:
+        if self._include_count_metadata:
+            data["countMode"] = _count_mode(data)
+        else:
             data.pop("isMatchCountTotalExact", None)
             data.pop("hasNextPage", None)
         return data
@@ -13,6 +13,7 @@ from ebl.files.application.file_repository import FileRepository
 from ebl.fragmentarium.application.annotations_repository import AnnotationsRepository
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.application.fragment_updater import FragmentUpdater
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.application.transliteration_update_factory import (
     TransliterationUpdateFactory,
 )
@@ -22,6 +23,9 @@ from ebl.fragmentarium.infrastructure.cropped_sign_images_repository import (
 from ebl.lemmatization.application.suggestion_finder import LemmaRepository
 from ebl.transliteration.application.parallel_line_injector import ParallelLineInjector
 from ebl.transliteration.application.sign_repository import SignRepository
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+)
 from ebl.transliteration.application.transliteration_query_factory import (
     TransliterationQueryFactory,
 )
@@ -61,6 +65,9 @@ class Context:
     provenance_repository: ProvenanceRepository
     provenance_service: ProvenanceService
     realia_repository: RealiaRepository
+    line_to_vec_store: LineToVecStore
+    transliteration_query_cache: TransliterationQueryCache
+    sign_catalogue: SignRepository
 
     def get_bibliography(self):
         return Bibliography(self.bibliography_repository, self.changelog)
@@ -72,10 +79,13 @@ class Context:
             self.get_bibliography(),
             self.photo_repository,
             self.parallel_line_injector,
+            self.line_to_vec_store,
         )
 
     def get_transliteration_update_factory(self):
-        return TransliterationUpdateFactory(self.sign_repository)
+        return TransliterationUpdateFactory(self.sign_catalogue)
 
     def get_transliteration_query_factory(self):
-        return TransliterationQueryFactory(self.sign_repository)
+        return TransliterationQueryFactory(
+            self.sign_catalogue, self.transliteration_query_cache
+        )
@@ -14,7 +14,7 @@ from ebl.corpus.application.lemmatization import ChapterLemmatization
 from ebl.corpus.application.lemmatization_updater import LemmatizationUpdater
 from ebl.corpus.application.lines_updater import LinesUpdater
 from ebl.corpus.application.manuscripts_updater import ManuscriptUpdater
-from ebl.corpus.application.schemas import ChapterSchema
+from ebl.corpus.application.schemas import ChapterSchema, LineSchema
 from ebl.corpus.application.text_validator import TextValidator
 from ebl.corpus.domain.alignment import Alignment
 from ebl.corpus.domain.chapter import Chapter, ChapterId
@@ -36,10 +36,36 @@ from ebl.transliteration.application.sign_repository import SignRepository
 from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 from ebl.users.domain.user import User
 
-
 COLLECTION = "chapters"
 
 
+def dump_changed_lines(old: Chapter, new: Chapter) -> Tuple[dict, dict]:
+    """Dump the chapters with None for the lines which are equal in both.
+
+    The changelog diff of the dumps is the same as of the full dumps.
+    """
+    unchanged = {
+        index
+        for index, (old_line, new_line) in enumerate(
+            zip(old.lines, new.lines, strict=False)
+        )
+        if old_line == new_line
+    }
+    schema = ChapterSchema(exclude=["lines"])
+    line_schema = LineSchema()
+    keys = [field.data_key or name for name, field in ChapterSchema().fields.items()]
+
+    def dump(chapter: Chapter) -> dict:
+        data = schema.dump(chapter)
+        data["lines"] = [
+            None if index in unchanged else line_schema.dump(line)
+            for index, line in enumerate(chapter.lines)
+        ]
+        return {key: data[key] for key in keys if key in data}
+
+    return dump(old), dump(new)
+
+
 @dataclass(frozen=True)
 class CorpusDependencies:
     repository: TextRepository
@@ -104,7 +130,7 @@ class Corpus:
     ) -> Sequence[Manuscript]:
         injector = ManuscriptReferenceInjector(self._bibliography)
         try:
-            return tuple(map(injector.inject_manuscript, manuscripts))
+            return injector.inject_manuscripts(manuscripts)
         except NotFoundError as error:
             raise Defect(error) from error
 
@@ -168,9 +194,7 @@ class Corpus:
     ) -> Chapter:
         try:
             injector = ManuscriptReferenceInjector(self._bibliography)
-            manuscripts = tuple(
-                injector.inject_manuscript(manuscript) for manuscript in manuscripts
-            )
+            manuscripts = injector.inject_manuscripts(manuscripts)
         except NotFoundError as error:
             raise DataError(error) from error
 
@@ -217,9 +241,13 @@ class Corpus:
             raise Defect(error) from error
 
     def _create_changelog(self, old: Chapter, new: Chapter, user: User) -> None:
-        old_dict: dict = {**ChapterSchema().dump(old), "_id": old.id_.to_tuple()}
-        new_dict: dict = {**ChapterSchema().dump(new), "_id": new.id_.to_tuple()}
-        self._changelog.create(COLLECTION, user.profile, old_dict, new_dict)
+        old_dict, new_dict = dump_changed_lines(old, new)
+        self._changelog.create(
+            COLLECTION,
+            user.profile,
+            {**old_dict, "_id": old.id_.to_tuple()},
+            {**new_dict, "_id": new.id_.to_tuple()},
+        )
 
     def _inject_parallels(self, chapter: ChapterDisplay) -> ChapterDisplay:
         return attr.evolve(
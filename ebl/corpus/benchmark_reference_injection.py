@@ -0,0 +1,79 @@
+import argparse
+import time
+from typing import Callable
+
+from pymongo import monitoring
+
+from ebl.app import create_context
+from ebl.corpus.application.manuscript_reference_injector import (
+    ManuscriptReferenceInjector,
+)
+from ebl.corpus.web.text_utils import create_chapter_id
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self.count += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+def measure(name: str, counter: CommandCounter, run: Callable[[], object]) -> None:
+    start = counter.count
+    t0 = time.perf_counter()
+    run()
+    seconds = time.perf_counter() - t0
+    print(f"{name:<12}{counter.count - start:>10} queries{seconds:>10.3f} s")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare per-reference and batched bibliography resolution "
+        "for the manuscripts of a chapter."
+    )
+    parser.add_argument("genre", help="e.g. L")
+    parser.add_argument("category", help="e.g. 1")
+    parser.add_argument("index", help="e.g. 2")
+    parser.add_argument("stage", help="e.g. SB")
+    parser.add_argument("name", help="e.g. II")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    counter = CommandCounter()
+    monitoring.register(counter)
+
+    context = create_context()
+    chapter = context.text_repository.find_chapter(
+        create_chapter_id(args.genre, args.category, args.index, args.stage, args.name)
+    )
+    references = [
+        reference
+        for manuscript in chapter.manuscripts
+        for reference in (
+            *manuscript.references,
+            *(old_siglum.reference for old_siglum in manuscript.old_sigla),
+        )
+    ]
+    print(f"{len(chapter.manuscripts)} manuscripts, {len(references)} references")
+
+    measure(
+        "find",
+        counter,
+        lambda: [context.bibliography.find(reference.id) for reference in references],
+    )
+    measure(
+        "find_all",
+        counter,
+        lambda: ManuscriptReferenceInjector(context.bibliography).inject_manuscripts(
+            chapter.manuscripts
+        ),
+    )
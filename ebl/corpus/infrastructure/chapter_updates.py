@@ -0,0 +1,87 @@
+from typing import Any, Callable, Dict, Optional
+
+import bson
+
+Differ = Callable[[str, Any, Any], Dict[str, Any]]
+
+
+def _join(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def replace(path: str, old: Any, new: Any) -> Dict[str, Any]:
+    return {} if old == new else {path: new}
+
+
+def items(differ: Differ = replace) -> Differ:
+    """Diff lists of the same length item by item, otherwise replace them."""
+
+    def diff(path: str, old: Any, new: Any) -> Dict[str, Any]:
+        if old == new:
+            return {}
+        if not isinstance(old, list) or len(old) != len(new):
+            return {path: new}
+        updates: Dict[str, Any] = {}
+        for index, (old_item, new_item) in enumerate(zip(old, new, strict=True)):
+            updates.update(differ(_join(path, index), old_item, new_item))
+        return updates
+
+    return diff
+
+
+def fields(**differs: Differ) -> Differ:
+    """Diff dicts with the same keys field by field, otherwise replace them."""
+
+    def diff(path: str, old: Any, new: Any) -> Dict[str, Any]:
+        if old == new:
+            return {}
+        if not isinstance(old, dict) or old.keys() != new.keys():
+            return {path: new}
+        updates: Dict[str, Any] = {}
+        for key, value in new.items():
+            updates.update(differs.get(key, replace)(_join(path, key), old[key], value))
+        return updates
+
+    return diff
+
+
+diff_chapter: Differ = fields(
+    manuscripts=items(),
+    lines=items(fields(variants=items(fields(manuscripts=items())))),
+    signs=items(),
+)
+
+
+def create_chapter_update(old: dict, new: dict) -> Dict[str, Any]:
+    """Create `$set` paths for the changed lines, variants and manuscript lines.
+
+    Fields of `new` missing from `old` are set whole. A line, variant or
+    manuscript line is rewritten only when it changed, and an array whose
+    length changed is rewritten whole.
+    """
+    return diff_chapter("", {key: old.get(key) for key in new}, new)
+
+
+def create_update_guard(old: dict, update: Dict[str, Any]) -> Dict[str, Any]:
+    """Match the sizes of the arrays indexed by the update paths.
+
+    Positional paths only point to the same elements while no item was added
+    to or removed from the arrays on the path.
+    """
+    guard: Dict[str, Any] = {}
+    for path in update:
+        value: Any = old
+        keys = path.split(".")
+        for depth, key in enumerate(keys):
+            if isinstance(value, list):
+                guard[".".join(keys[:depth])] = {"$size": len(value)}
+                value = value[int(key)]
+            elif isinstance(value, dict):
+                value = value.get(key)
+            else:
+                break
+    return guard
+
+
+def get_update_size(update: Optional[Dict[str, Any]]) -> int:
+    return len(bson.encode({"$set": update})) if update else 0
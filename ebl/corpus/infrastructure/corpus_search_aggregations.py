@@ -1,4 +1,6 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence
+
+from bson.objectid import ObjectId
 from ebl.common.query.query_result import LemmaQueryType
 from ebl.common.query.util import flatten_field
 from ebl.corpus.infrastructure.corpus_lemma_matcher import CorpusLemmaMatcher
@@ -6,8 +8,13 @@ from ebl.corpus.infrastructure.corpus_sign_matcher import CorpusSignMatcher
 
 
 class CorpusPatternMatcher:
-    def __init__(self, query: Dict):
+    def __init__(
+        self,
+        query: Dict,
+        candidates: Optional[Dict[ObjectId, Sequence[int]]] = None,
+    ):
         self._query = query
+        self._candidates = candidates
 
         self._lemma_matcher = (
             CorpusLemmaMatcher(
@@ -18,7 +25,7 @@ class CorpusPatternMatcher:
             else None
         )
         self._sign_matcher = (
-            CorpusSignMatcher(query["transliteration"])
+            CorpusSignMatcher(query["transliteration"], candidates)
             if "transliteration" in query
             else None
         )
@@ -127,8 +134,15 @@ class CorpusPatternMatcher:
             },
         ]
 
+    def _filter_candidates(self) -> List[Dict]:
+        return (
+            []
+            if self._candidates is None
+            else [{"$match": {"_id": {"$in": list(self._candidates)}}}]
+        )
+
     def build_pipeline(self) -> List[Dict]:
-        pipeline = []
+        pipeline = self._filter_candidates()
 
         if self._lemma_matcher and self._sign_matcher:
             pipeline.extend(self._merge_pipelines())
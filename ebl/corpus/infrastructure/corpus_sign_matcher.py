@@ -1,10 +1,18 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence
+
+from bson.objectid import ObjectId
+
 from ebl.common.query.util import ngrams, flatten_field
 
 
 class CorpusSignMatcher:
-    def __init__(self, pattern: List[str]):
+    def __init__(
+        self,
+        pattern: List[str],
+        candidates: Optional[Dict[ObjectId, Sequence[int]]] = None,
+    ):
         self.pattern = pattern
+        self._candidates = candidates
         self._pattern_length = len(self.pattern)
         self._is_multiline = self._pattern_length > 1
 
@@ -57,6 +65,22 @@ class CorpusSignMatcher:
             },
         ]
 
+    def _filter_candidate_manuscripts(self) -> List[Dict]:
+        return (
+            [
+                {
+                    "$match": {
+                        "$or": [
+                            {"_id": chapter, "manuscriptId": {"$in": manuscript_ids}}
+                            for chapter, manuscript_ids in self._candidates.items()
+                        ]
+                    }
+                }
+            ]
+            if self._candidates
+            else []
+        )
+
     def _create_sign_line_ngrams(self) -> List[Dict]:
         return [
             {
@@ -246,6 +270,7 @@ class CorpusSignMatcher:
     def build_pipeline(self, count_matches_per_item=True) -> List[Dict]:
         return [
             *self._merge_manuscripts_and_signs(),
+            *self._filter_candidate_manuscripts(),
             *(
                 self._match_multiline()
                 if self._is_multiline
@@ -1,15 +1,25 @@
+from typing import Optional, Sequence
+
+from bson.objectid import ObjectId
 from pymongo.database import Database
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
 from ebl.provenance.application.provenance_service import ProvenanceService
 from ebl.corpus.application.text_repository import TextRepository
 from ebl.corpus.domain.chapter import ChapterId
 from ebl.corpus.domain.text import TextId
 from ebl.errors import NotFoundError
+from ebl.fragmentarium.infrastructure.join_members import JoinMembersVersion
+from ebl.lemmatization.infrastrcuture.lemma_statistics import MongoLemmaStatistics
 from ebl.mongo_collection import MongoCollection
+from ebl.transliteration.domain.sign_ngrams import create_sign_ngrams
 from ebl.transliteration.infrastructure.collections import (
+    CHAPTER_SIGN_NGRAMS_COLLECTION,
     CHAPTERS_COLLECTION,
     TEXTS_COLLECTION,
 )
 
+SIGN_NGRAMS_VERSION = "chapterSignNgrams"
+
 
 def text_not_found(id_: TextId) -> Exception:
     return NotFoundError(f"Text {id_} not found.")
@@ -29,4 +39,29 @@ class MongoTextRepositoryBase(TextRepository):
     ) -> None:
         self._texts = MongoCollection(database, TEXTS_COLLECTION)
         self._chapters = MongoCollection(database, CHAPTERS_COLLECTION)
+        self._sign_ngrams = database[CHAPTER_SIGN_NGRAMS_COLLECTION]
+        self._versions = MongoVersionRepository(database)
+        self._join_members_version = JoinMembersVersion(database)
+        self._lemma_statistics = MongoLemmaStatistics(database)
         self._provenance_service = provenance_service
+
+    def _update_sign_ngrams(
+        self,
+        chapter: ObjectId,
+        manuscript_ids: Sequence[int],
+        signs: Sequence[Optional[str]],
+    ) -> None:
+        self._sign_ngrams.delete_many({"chapter": chapter})
+        documents = [
+            {
+                "chapter": chapter,
+                "manuscriptId": manuscript_id,
+                "ngrams": sorted(create_sign_ngrams(manuscript_signs)),
+            }
+            for manuscript_id, manuscript_signs in zip(
+                manuscript_ids, signs, strict=False
+            )
+            if manuscript_signs
+        ]
+        if documents:
+            self._sign_ngrams.insert_many(documents)
@@ -1,3 +1,5 @@
+import logging
+
 import pymongo
 from ebl.corpus.application.schemas import (
     ChapterSchema,
@@ -5,10 +7,30 @@ from ebl.corpus.application.schemas import (
 )
 from ebl.corpus.domain.chapter import Chapter, ChapterId
 from ebl.corpus.domain.text import Text
+from ebl.corpus.infrastructure.chapter_updates import (
+    create_chapter_update,
+    create_update_guard,
+    get_update_size,
+)
 from ebl.corpus.infrastructure.queries import (
     chapter_id_query,
 )
-from ebl.corpus.infrastructure.mongo_text_repository_base import MongoTextRepositoryBase
+from ebl.corpus.infrastructure.mongo_text_repository_base import (
+    SIGN_NGRAMS_VERSION,
+    MongoTextRepositoryBase,
+)
+from ebl.errors import NotFoundError
+from ebl.lemmatization.infrastrcuture.lemma_statistics import chapter_tokens
+
+logger = logging.getLogger(__name__)
+
+UPDATED_CHAPTER_FIELDS = [
+    "manuscripts",
+    "uncertain_fragments",
+    "lines",
+    "signs",
+    "parser_version",
+]
 
 
 class MongoTextRepositoryModify(MongoTextRepositoryBase):
@@ -65,28 +87,78 @@ class MongoTextRepositoryModify(MongoTextRepositoryBase):
             ]
         )
 
+    def _create_sign_ngram_indexes(self) -> None:
+        self._sign_ngrams.create_index([("chapter", pymongo.ASCENDING)])
+        self._sign_ngrams.create_index([("ngrams", pymongo.ASCENDING)])
+
     def create_indexes(self) -> None:
         self._create_text_indexes()
         self._create_chapter_indexes()
+        self._create_sign_ngram_indexes()
+        self._lemma_statistics.create_indexes()
 
     def create(self, text: Text) -> None:
         self._texts.insert_one(TextSchema(exclude=["chapters"]).dump(text))
 
     def create_chapter(self, chapter: Chapter) -> None:
-        self._chapters.insert_one(ChapterSchema().dump(chapter))
+        data = ChapterSchema().dump(chapter)
+        self._update_sign_ngrams(
+            self._chapters.insert_one(data),
+            [manuscript.id for manuscript in chapter.manuscripts],
+            chapter.signs,
+        )
+        self._lemma_statistics.update([], chapter_tokens(data))
 
     def update(self, id_: ChapterId, chapter: Chapter) -> None:
-        self._chapters.update_one(
-            chapter_id_query(id_),
-            {
-                "$set": ChapterSchema(
-                    only=[
-                        "manuscripts",
-                        "uncertain_fragments",
-                        "lines",
-                        "signs",
-                        "parser_version",
-                    ]
-                ).dump(chapter)
-            },
+        """Set only the changed parts of the chapter.
+
+        The chapter is rewritten whole if that is smaller or if items were
+        added to or removed from the updated arrays concurrently.
+        """
+        data = ChapterSchema(only=UPDATED_CHAPTER_FIELDS).dump(chapter)
+        old = self._chapters.find_one(
+            chapter_id_query(id_), projection=list(data.keys())
+        )
+        self._update_chapter(id_, old, data)
+        manuscript_ids = [manuscript.id for manuscript in chapter.manuscripts]
+        old_manuscript_ids = [
+            manuscript.get("id") for manuscript in old.get("manuscripts", [])
+        ]
+        if old.get("signs") != data["signs"] or old_manuscript_ids != manuscript_ids:
+            self._update_sign_ngrams(old["_id"], manuscript_ids, chapter.signs)
+        self._lemma_statistics.update(chapter_tokens(old), chapter_tokens(data))
+
+    def _update_chapter(self, id_: ChapterId, old: dict, data: dict) -> None:
+        update = create_chapter_update(old, data)
+        size = get_update_size(update)
+        full_size = get_update_size(data)
+        if size and size < full_size and self._set_changes(old, update):
+            logger.info("Updated chapter %s: %d/%d bytes.", id_, size, full_size)
+        elif size:
+            self._chapters.update_one({"_id": old["_id"]}, {"$set": data})
+            logger.info("Rewrote chapter %s: %d bytes.", id_, full_size)
+
+    def _set_changes(self, old: dict, update: dict) -> bool:
+        try:
+            self._chapters.update_one(
+                {"_id": old["_id"], **create_update_guard(old, update)},
+                {"$set": update},
+            )
+            return True
+        except NotFoundError:
+            return False
+
+    def rebuild_sign_ngrams(self) -> int:
+        cursor = self._chapters.find_many(
+            {}, projection={"manuscripts.id": True, "signs": True}
         )
+        count = 0
+        for chapter in cursor:
+            self._update_sign_ngrams(
+                chapter["_id"],
+                [manuscript["id"] for manuscript in chapter.get("manuscripts", [])],
+                chapter.get("signs", []),
+            )
+            count += 1
+        self._versions.increment(SIGN_NGRAMS_VERSION)
+        return count
@@ -1,4 +1,6 @@
 from typing import List, Optional, Tuple, Sequence, Dict
+
+from bson.objectid import ObjectId
 from pymongo.collation import Collation
 
 from ebl.common.query.query_result import CorpusQueryResult
@@ -23,18 +25,46 @@ from ebl.corpus.infrastructure.queries import (
     join_text_title,
 )
 from ebl.errors import NotFoundError
-from ebl.fragmentarium.infrastructure.queries import is_in_fragmentarium, join_joins
+from ebl.fragmentarium.infrastructure.queries import (
+    is_in_fragmentarium,
+    join_joins,
+)
 from ebl.transliteration.domain.genre import Genre
 from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 from ebl.corpus.infrastructure.mongo_text_repository_base import (
+    SIGN_NGRAMS_VERSION,
     chapter_not_found,
 )
 from ebl.corpus.infrastructure.mongo_text_repository_query_fragment import (
     MongoTextRepositoryQueryFragment,
 )
 
+SIGN_NGRAM_CANDIDATES_LIMIT = 5000
+
 
 class MongoTextRepositoryQuery(MongoTextRepositoryQueryFragment):
+    def _find_sign_ngram_candidates(
+        self, sign_ngrams: Sequence[str]
+    ) -> Optional[Dict[ObjectId, List[int]]]:
+        if not sign_ngrams or not self._versions.get(SIGN_NGRAMS_VERSION):
+            return None
+
+        postings = list(
+            self._sign_ngrams.find(
+                {"ngrams": {"$all": list(sign_ngrams)}},
+                projection={"_id": False, "chapter": True, "manuscriptId": True},
+            ).limit(SIGN_NGRAM_CANDIDATES_LIMIT + 1)
+        )
+        if len(postings) > SIGN_NGRAM_CANDIDATES_LIMIT:
+            return None
+
+        candidates: Dict[ObjectId, List[int]] = {}
+        for posting in postings:
+            candidates.setdefault(posting["chapter"], []).append(
+                posting["manuscriptId"]
+            )
+        return candidates
+
     def _manuscript_schema(self) -> ManuscriptSchema:
         return ManuscriptSchema(
             context={"provenance_service": self._provenance_service}
@@ -45,6 +75,9 @@ class MongoTextRepositoryQuery(MongoTextRepositoryQueryFragment):
     ) -> Tuple[Sequence[Chapter], int]:
         LIMIT = 30
         mongo_query = {"signs": {"$regex": query.regexp}}
+        candidates = self._find_sign_ngram_candidates(query.sign_ngrams)
+        if candidates is not None:
+            mongo_query["_id"] = {"$in": list(candidates)}
         cursor = self._chapters.aggregate(
             [
                 {"$match": mongo_query},
@@ -155,7 +188,14 @@ class MongoTextRepositoryQuery(MongoTextRepositoryQueryFragment):
 
     def query(self, query: dict) -> CorpusQueryResult:
         if set(query) - {"lemmaOperator"}:
-            matcher = CorpusPatternMatcher(query)
+            matcher = CorpusPatternMatcher(
+                query,
+                (
+                    self._find_sign_ngram_candidates(query.get("signNgrams", []))
+                    if "transliteration" in query
+                    else None
+                ),
+            )
             data = next(
                 self._chapters.aggregate(
                     matcher.build_pipeline(),
@@ -197,7 +237,7 @@ class MongoTextRepositoryQuery(MongoTextRepositoryQueryFragment):
                         {"$project": {"manuscripts": True}},
                         {"$unwind": "$manuscripts"},
                         {"$replaceRoot": {"newRoot": "$manuscripts"}},
-                        *join_joins(),
+                        *join_joins(self._join_members_version.is_current()),
                         *is_in_fragmentarium("museumNumber", "isInFragmentarium"),
                     ]
                 ),
@@ -0,0 +1,10 @@
+from typing import cast
+
+from ebl.app import create_context
+from ebl.corpus.infrastructure.mongo_text_repository import MongoTextRepository
+
+if __name__ == "__main__":
+    repository = cast(MongoTextRepository, create_context().text_repository)
+    repository.create_indexes()
+    count = repository.rebuild_sign_ngrams()
+    print(f"Indexed sign n-grams of {count} chapters.")
@@ -1,5 +1,5 @@
 import argparse
-from functools import reduce
+from functools import cache, reduce
 from multiprocessing import Pool
 from typing import List
 
@@ -7,6 +7,7 @@ import attr
 from tqdm import tqdm
 
 from ebl.app import create_context
+from ebl.context import Context
 from ebl.corpus.application.corpus import Corpus, CorpusDependencies
 from ebl.corpus.domain.chapter import ChapterId
 from ebl.corpus.domain.text import Text, TextId
@@ -52,14 +53,19 @@ class State:
         )
 
 
+@cache
+def create_context_() -> Context:
+    return create_context()
+
+
 def update(number) -> State:
-    context = create_context()
+    context = create_context_()
     corpus = Corpus(
         CorpusDependencies(
             repository=context.text_repository,
             bibliography=context.get_bibliography(),
             changelog=context.changelog,
-            sign_repository=context.sign_repository,
+            sign_repository=context.sign_catalogue,
             parallel_line_injector=context.parallel_line_injector,
             provenance_service=context.provenance_service,
         )
@@ -83,7 +89,7 @@ def get_text_ids() -> List[TextId]:
             repository=context.text_repository,
             bibliography=context.get_bibliography(),
             changelog=context.changelog,
-            sign_repository=context.sign_repository,
+            sign_repository=context.sign_catalogue,
             parallel_line_injector=context.parallel_line_injector,
             provenance_service=context.provenance_service,
         )
@@ -23,9 +23,6 @@ from ebl.corpus.web.texts import (
     TextsAllResource,
 )
 from ebl.corpus.web.unplaced_lines import UnplacedLinesResource
-from ebl.transliteration.application.transliteration_query_factory import (
-    TransliterationQueryFactory,
-)
 
 
 def create_corpus_routes(api: falcon.App, context: Context):
@@ -34,7 +31,7 @@ def create_corpus_routes(api: falcon.App, context: Context):
             repository=context.text_repository,
             bibliography=context.get_bibliography(),
             changelog=context.changelog,
-            sign_repository=context.sign_repository,
+            sign_repository=context.sign_catalogue,
             parallel_line_injector=context.parallel_line_injector,
             provenance_service=context.provenance_service,
         )
@@ -45,7 +42,7 @@ def create_corpus_routes(api: falcon.App, context: Context):
     texts = TextsResource(corpus)
     text = TextResource(corpus)
     text_search = TextSearchResource(
-        corpus, TransliterationQueryFactory(context.sign_repository)
+        corpus, context.get_transliteration_query_factory()
     )
     chapters = ChaptersResource(corpus)
     chapters_display = ChaptersDisplayResource(corpus, context.custom_cache)
@@ -105,21 +105,18 @@ class ChaptersDisplayResource:
         name: str,
     ) -> None:
         chapter_id = create_chapter_id(genre, category, index, stage, name)
-        chapter_id_str = str(chapter_id)
         lines = parse_lines(req.get_param_as_list("lines", default=[]))
         variants = parse_lines(req.get_param_as_list("variants", default=[]))
+        selected_lines = set(lines) if lines and variants else None
 
-        if self._cache.has(chapter_id_str):
-            cached_chapter = self._cache.get(chapter_id_str)
-            resp.media = self._select_lines_and_variants(
-                cached_chapter, lines, variants
+        chapter = self._cache.get_chapter_display(chapter_id, selected_lines)
+        if chapter is None:
+            chapter = ChapterDisplaySchema().dump(
+                self._corpus.find_chapter_for_display(chapter_id)
             )
-        else:
-            chapter = self._corpus.find_chapter_for_display(chapter_id)
-            dump = ChapterDisplaySchema().dump(chapter)
-            self._cache.set(chapter_id_str, dump)
+            self._cache.set_chapter_display(chapter_id, chapter)
 
-            resp.media = self._select_lines_and_variants(dump, lines, variants)
+        resp.media = self._select_lines_and_variants(chapter, lines, variants)
 
 
 class ChaptersByFragmentResource:
@@ -1,5 +1,7 @@
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from typing import Sequence, Tuple
+from typing import List, Mapping, Optional, Sequence, Tuple
 
 import attr
 from PIL import Image
@@ -16,24 +18,41 @@ from ebl.fragmentarium.application.cropped_sign_images_repository import (
 )
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.domain.annotation import (
+    Annotation,
     Annotations,
     AnnotationValueType,
 )
-from ebl.transliteration.domain.at_line import (
-    ColumnAtLine,
-    ObjectAtLine,
-    SurfaceAtLine,
-    SealAtLine,
-)
 from ebl.transliteration.domain.line import Line
 from ebl.transliteration.domain.line_label import LineLabel
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.transliteration.domain.note_line import NoteLine
+from ebl.transliteration.domain.text import LABEL_UPDATES
 from ebl.transliteration.domain.text_line import TextLine
 from ebl.users.domain.user import User
 
 Image.MAX_IMAGE_PIXELS = None  # pyre-ignore[9]
 
+CROP_WORKERS = 4
+CROP_VERSION = "1"
+
+
+def create_crop_hash(photo_hash: str, annotation: Annotation) -> str:
+    geometry = annotation.geometry
+    key = ":".join(
+        map(
+            str,
+            (
+                CROP_VERSION,
+                photo_hash,
+                geometry.x,
+                geometry.y,
+                geometry.width,
+                geometry.height,
+            ),
+        )
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
 
 @attr.attrs(auto_attribs=True, frozen=True)
 class AnnotationsService:
@@ -56,50 +75,78 @@ class AnnotationsService:
     def find(self, number: MuseumNumber) -> Annotations:
         return self._annotations_repository.query_by_museum_number(number)
 
-    def _cropped_image_from_annotations_helper(
-        self,
-        annotations: Annotations,
-        image: Image.Image,
-        labels: Sequence[Tuple[LineLabel, Line]],
-    ) -> Tuple[Annotations, Sequence[CroppedSignImage]]:
-        cropped_sign_images = []
-        updated_cropped_annotations = []
-
-        for annotation in annotations.annotations:
-            label = (
-                labels[annotation.data.path[0]][0].formatted_label
-                if annotation.data.type == AnnotationValueType.HAS_SIGN
-                else ""
-            )
-            cropped_image = annotation.crop_image(image)
-            cropped_sign_image = CroppedSignImage.create(
-                cropped_image, annotations.fragment_number
+    def _crop(
+        self, photo: bytes, annotations: Mapping[str, Annotation], number: MuseumNumber
+    ) -> Sequence[CroppedSignImage]:
+        if not annotations:
+            return []
+        image = Image.open(BytesIO(photo), mode="r")
+        image.load()
+        with ThreadPoolExecutor(CROP_WORKERS) as executor:
+            crops = executor.map(
+                lambda annotation: annotation.crop_image(image), annotations.values()
             )
-            cropped_sign_images.append(cropped_sign_image)
-
-            updated_cropped_annotation = attr.evolve(
-                annotation,
-                cropped_sign=CroppedSign(cropped_sign_image.image_id, label),
-            )
-            updated_cropped_annotations.append(updated_cropped_annotation)
-        return (
-            attr.evolve(annotations, annotations=updated_cropped_annotations),
-            cropped_sign_images,
-        )
+            return [
+                CroppedSignImage.create(crop, number, content_hash)
+                for content_hash, crop in zip(annotations, crops, strict=True)
+            ]
 
     def _cropped_image_from_annotations(
-        self, annotations: Annotations
+        self,
+        annotations: Annotations,
+        content_hashes: Optional[Mapping[str, str]] = None,
     ) -> Tuple[Annotations, Sequence[CroppedSignImage]]:
+        """Crop the annotations whose hash is not in `content_hashes`.
+
+        `content_hashes` maps the ids of existing images to their hashes.
+        The photo is decoded only if something needs to be cropped.
+        """
         fragment = self._fragments_repository.query_by_museum_number(
             annotations.fragment_number
         )
-        fragment_image = self._photos_repository.query_by_file_name(
+        photo = self._photos_repository.query_by_file_name(
             f"{annotations.fragment_number}.jpg"
+        ).read()
+        labels = self.get_labels(fragment.text.lines)
+        photo_hash = hashlib.sha256(photo).hexdigest()
+        image_ids = {
+            content_hash: image_id
+            for image_id, content_hash in (content_hashes or {}).items()
+            if content_hash
+        }
+        hashed_annotations = [
+            (create_crop_hash(photo_hash, annotation), annotation)
+            for annotation in annotations.annotations
+        ]
+        cropped_sign_images = self._crop(
+            photo,
+            {
+                content_hash: annotation
+                for content_hash, annotation in hashed_annotations
+                if content_hash not in image_ids
+            },
+            annotations.fragment_number,
         )
-        image_bytes = fragment_image.read()
-        image = Image.open(BytesIO(image_bytes), mode="r")
-        return self._cropped_image_from_annotations_helper(
-            annotations, image, self.get_labels(fragment.text.lines)
+        image_ids.update(
+            (image.content_hash, image.image_id) for image in cropped_sign_images
+        )
+        updated_cropped_annotations = [
+            attr.evolve(
+                annotation,
+                cropped_sign=CroppedSign(
+                    image_ids[content_hash],
+                    (
+                        labels[annotation.data.path[0]][0].formatted_label
+                        if annotation.data.type == AnnotationValueType.HAS_SIGN
+                        else ""
+                    ),
+                ),
+            )
+            for content_hash, annotation in hashed_annotations
+        ]
+        return (
+            attr.evolve(annotations, annotations=updated_cropped_annotations),
+            cropped_sign_images,
         )
 
     def update(self, annotations: Annotations, user: User) -> Annotations:
@@ -109,21 +156,32 @@ class AnnotationsService:
         _id = str(annotations.fragment_number)
         schema = AnnotationsSchema()
 
-        self._cropped_sign_images_repository.delete_by_fragment_number(
+        content_hashes = self._cropped_sign_images_repository.query_content_hashes(
             annotations.fragment_number
         )
-
         (
             annotations_with_image_ids,
             cropped_sign_images,
-        ) = self._cropped_image_from_annotations(annotations)
-
-        self._annotations_repository.create_or_update(annotations_with_image_ids)
+        ) = self._cropped_image_from_annotations(annotations, content_hashes)
 
         len(cropped_sign_images) and self._cropped_sign_images_repository.create_many(
             cropped_sign_images
         )
 
+        self._annotations_repository.create_or_update(annotations_with_image_ids)
+
+        used_image_ids = {
+            annotation.cropped_sign.image_id
+            for annotation in annotations_with_image_ids.annotations
+            if annotation.cropped_sign is not None
+        }
+        unused_image_ids = [
+            image_id for image_id in content_hashes if image_id not in used_image_ids
+        ]
+        unused_image_ids and self._cropped_sign_images_repository.delete_by_ids(
+            unused_image_ids
+        )
+
         self._changelog.create(
             "annotations",
             user.profile,
@@ -137,35 +195,13 @@ class AnnotationsService:
         # Similar to fragment.text.labels but count EmptyLine and igore NoteLine)
         # https://github.com/ElectronicBabylonianLiterature/ebl-frontend/blob/master/src/fragmentarium/ui/image-annotation/annotation-tool/mapTokensToAnnotationTokens.ts
         current: LineLabel = LineLabel(None, None, None, None, None)
-        labels: Sequence[Tuple[LineLabel, Line]] = []
-
-        handlers = {
-            TextLine: lambda line: (
-                current,
-                [*labels, (current.set_line_number(line.line_number), line)],
-            ),
-            ColumnAtLine: lambda line: (
-                current.set_column(line.column_label),
-                [*labels, (current, line)],
-            ),
-            SurfaceAtLine: lambda line: (
-                current.set_surface(line.surface_label),
-                [*labels, (current, line)],
-            ),
-            ObjectAtLine: lambda line: (
-                current.set_object(line.label),
-                [*labels, (current, line)],
-            ),
-            SealAtLine: lambda line: (
-                current.set_seal(line.number),
-                [*labels, (current, line)],
-            ),
-        }
-
+        labels: List[Tuple[LineLabel, Line]] = []
         for line in lines:
-            if not isinstance(line, NoteLine):
-                if type(line) in handlers:
-                    current, labels = handlers[type(line)](line)
-                else:
-                    current, labels = current, [*labels, (current, line)]
+            line_type = type(line)
+            if line_type is TextLine:
+                labels.append((current.set_line_number(line.line_number), line))
+            elif not isinstance(line, NoteLine):
+                labels.append((current, line))
+                if line_type in LABEL_UPDATES:
+                    current = LABEL_UPDATES[line_type](current, line)
         return labels
@@ -48,17 +48,25 @@ class CroppedAnnotationService:
             )
         return date_cache[fragment_number]
 
-    def _find_cropped_sign_image(
-        self, image_id: str, image_cache: Dict[str, CroppedSignImage]
-    ) -> Optional[CroppedSignImage]:
-        try:
-            if image_id not in image_cache:
-                image_cache[image_id] = self._cropped_sign_image_repository.query_by_id(
-                    image_id
-                )
-            return image_cache[image_id]
-        except Exception:
-            return None
+    def _find_cropped_sign_images(
+        self, annotations: Sequence[Annotations]
+    ) -> Dict[str, CroppedSignImage]:
+        image_ids = list(
+            dict.fromkeys(
+                annotation.cropped_sign.image_id
+                for annotation_group in annotations
+                for annotation in annotation_group.annotations
+                if annotation.cropped_sign is not None
+            )
+        )
+        return (
+            {
+                image.image_id: image
+                for image in self._cropped_sign_image_repository.query_by_ids(image_ids)
+            }
+            if image_ids
+            else {}
+        )
 
     def _build_response(
         self,
@@ -70,7 +78,7 @@ class CroppedAnnotationService:
     ) -> dict:
         response = {
             "fragmentNumber": str(annotations.fragment_number),
-            "image": image.image,
+            "image": image.base64,
             "script": str(annotations.script),
             "label": label,
             "date": date,
@@ -93,15 +101,17 @@ class CroppedAnnotationService:
         cluster_id: Optional[str] = None,
         script_filter: Optional[str] = None,
     ) -> Sequence[dict]:
-        annotations = self._annotations_repository.find_by_sign(
-            sign, centroids_only, include_unclustered, cluster_id, script_filter
-        )
+        annotations = [
+            self._filter_has_sign_annotations(annotation_group)
+            for annotation_group in self._annotations_repository.find_by_sign(
+                sign, centroids_only, include_unclustered, cluster_id, script_filter
+            )
+        ]
+        images = self._find_cropped_sign_images(annotations)
         cropped_image_annotations: List[dict] = []
         date_cache: Dict[str, dict] = {}
-        image_cache: Dict[str, CroppedSignImage] = {}
 
-        for annotation_group in annotations:
-            filtered_annotations = self._filter_has_sign_annotations(annotation_group)
+        for filtered_annotations in annotations:
             date = self._find_fragment_date(filtered_annotations, date_cache)
 
             for annotation in filtered_annotations.annotations:
@@ -109,9 +119,7 @@ class CroppedAnnotationService:
                 if cropped_sign is None:
                     continue
 
-                image = self._find_cropped_sign_image(
-                    cropped_sign.image_id, image_cache
-                )
+                image = images.get(cropped_sign.image_id)
                 if image is None:
                     continue
 
@@ -1,3 +1,4 @@
+import base64
 import uuid
 from typing import NewType
 
@@ -9,21 +10,43 @@ from ebl.transliteration.domain.museum_number import MuseumNumber
 Base64 = NewType("Base64", str)
 
 
+def to_base64(data: bytes) -> Base64:
+    return Base64(base64.b64encode(data).decode("ascii"))
+
+
 @attr.s(auto_attribs=True, frozen=True)
 class CroppedSignImage:
     image_id: str
-    image: Base64
+    image: bytes
     fragment_number: MuseumNumber
+    content_hash: str = ""
+
+    @property
+    def base64(self) -> Base64:
+        return to_base64(self.image)
 
     @classmethod
-    def create(cls, image: Base64, fragment_number: MuseumNumber) -> "CroppedSignImage":
-        return cls(str(uuid.uuid4()), image, fragment_number)
+    def create(
+        cls, image: bytes, fragment_number: MuseumNumber, content_hash: str = ""
+    ) -> "CroppedSignImage":
+        return cls(str(uuid.uuid4()), image, fragment_number, content_hash)
+
+
+class ImageField(fields.Field):
+    """Images are stored as BinData. Older documents hold base64 strings."""
+
+    def _serialize(self, value, attr, obj, **kwargs):
+        return value
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        return base64.b64decode(value) if isinstance(value, str) else bytes(value)
 
 
 class CroppedSignImageSchema(Schema):
     image_id = fields.Str(required=True, data_key="_id")
-    image = fields.Str(required=True)
+    image = ImageField(required=True)
     fragment_number = fields.Str(required=True)
+    content_hash = fields.Str(load_default="", data_key="contentHash")
 
     @post_load
     def make_cropped_sign_image(self, data, **kwargs):
@@ -31,6 +54,7 @@ class CroppedSignImageSchema(Schema):
             image_id=data["image_id"],
             image=data["image"],
             fragment_number=MuseumNumber.of(data["fragment_number"]),
+            content_hash=data["content_hash"],
         )
 
 
@@ -1,19 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import Mapping, Sequence
 
 from ebl.fragmentarium.application.cropped_sign_image import CroppedSignImage
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
 
 class CroppedSignImagesRepository(ABC):
+    @abstractmethod
+    def create_indexes(self) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def query_by_id(self, image_id: str) -> CroppedSignImage:
         raise NotImplementedError
 
+    @abstractmethod
+    def query_by_ids(self, image_ids: Sequence[str]) -> Sequence[CroppedSignImage]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_content_hashes(self, fragment_number: MuseumNumber) -> Mapping[str, str]:
+        """Map the ids of the images of a fragment to their content hashes."""
+        raise NotImplementedError
+
     @abstractmethod
     def create_many(self, cropped_sign_images: Sequence[CroppedSignImage]) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def delete_by_ids(self, image_ids: Sequence[str]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def delete_by_fragment_number(self, fragment_number: MuseumNumber) -> None:
         raise NotImplementedError
@@ -83,6 +83,10 @@ class FragmentRepository(ABC):
     ) -> List[LineToVecEntry]:
         raise NotImplementedError
 
+    @abstractmethod
+    def query_line_to_vec_version(self) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     def query_next_and_previous_folio(
         self, folio_name: str, folio_number: str, number: MuseumNumber
@@ -105,6 +109,12 @@ class FragmentRepository(ABC):
     ) -> Union[QueryResult, FragmentQueryResult]:
         raise NotImplementedError
 
+    @abstractmethod
+    def query_match_count_total(
+        self, query: dict, user_scopes: Sequence[Scope] = ()
+    ) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     def query_latest(self) -> QueryResult:
         raise NotImplementedError
@@ -129,6 +139,12 @@ class FragmentRepository(ABC):
     def retrieve_transliterated_fragments(self, skip: int) -> Sequence[dict]:
         raise NotImplementedError
 
+    @abstractmethod
+    def retrieve_transliterated_fragments_after(
+        self, last_id: Optional[str], limit: int
+    ) -> Sequence[dict]:
+        raise NotImplementedError
+
     @abstractmethod
     def fetch_fragment_signs(self) -> Sequence[dict]:
         raise NotImplementedError
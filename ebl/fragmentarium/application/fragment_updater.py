@@ -7,6 +7,7 @@ from ebl.common.domain.scopes import Scope
 from ebl.files.application.file_repository import FileRepository
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.application.fragment_schema import FragmentSchema
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.domain.archaeology import Archaeology
 from ebl.fragmentarium.domain.fragment import Fragment, Genre, Script
 from ebl.fragmentarium.domain.named_entity import (
@@ -33,12 +34,14 @@ class FragmentUpdater:
         bibliography: Bibliography,
         photos: FileRepository,
         parallel_injector: ParallelLineInjector,
+        line_to_vec_store: Optional[LineToVecStore] = None,
     ):
         self._repository = repository
         self._changelog = changelog
         self._bibliography = bibliography
         self._photos = photos
         self._parallel_injector = parallel_injector
+        self._line_to_vec_store = line_to_vec_store
 
     def update_edition(
         self,
@@ -66,6 +69,7 @@ class FragmentUpdater:
                 else fragment.update_lowest_join_transliteration(transliteration, user)
             )
             self._repository.update_field("transliteration", fragment)
+            self._update_line_to_vec(fragment)
 
         self._create_changelog(user, original_fragment, fragment)
 
@@ -79,6 +83,7 @@ class FragmentUpdater:
 
         self._create_changelog(user, fragment, updated_fragment)
         self._repository.update_field("script", updated_fragment)
+        self._update_line_to_vec(updated_fragment)
 
         return self._create_result(updated_fragment)
 
@@ -176,6 +181,10 @@ class FragmentUpdater:
 
         return self._create_result(updated_fragment)
 
+    def _update_line_to_vec(self, fragment: Fragment) -> None:
+        if self._line_to_vec_store is not None:
+            self._line_to_vec_store.update(fragment)
+
     def _create_result(self, fragment: Fragment) -> Tuple[Fragment, bool]:
         return (
             fragment.set_text(
@@ -0,0 +1,74 @@
+import threading
+from typing import Optional, cast
+
+from ebl.fragmentarium.application.fragment_repository import FragmentRepository
+from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.matches.line_to_vec_corpus import LineToVecCorpus
+from ebl.fragmentarium.domain.fragment import Fragment
+
+
+class LineToVecStore:
+    """Process wide line-to-vec corpus.
+
+    The corpus is loaded on first use and patched in place when a fragment
+    is updated through this process. Writes from other processes bump the
+    line-to-vec version in the repository, which triggers a reload on the
+    next snapshot. A stale corpus is reloaded by one request while the others
+    keep using the previous one.
+    """
+
+    def __init__(self, repository: FragmentRepository):
+        self._repository = repository
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._corpus: Optional[LineToVecCorpus] = None
+        self._version = 0
+
+    def snapshot(self) -> LineToVecCorpus:
+        version = self._repository.query_line_to_vec_version()
+        with self._lock:
+            corpus = self._corpus
+            if corpus is not None and version == self._version:
+                return corpus
+
+        if not self._reload_lock.acquire(blocking=corpus is None):
+            return cast(LineToVecCorpus, corpus)
+        try:
+            return self._reload(version)
+        finally:
+            self._reload_lock.release()
+
+    def _reload(self, version: int) -> LineToVecCorpus:
+        with self._lock:
+            if self._corpus is not None and version == self._version:
+                return self._corpus
+            stale_version = self._version
+
+        corpus = LineToVecCorpus.of(self._repository.query_transliterated_line_to_vec())
+
+        with self._lock:
+            if self._corpus is None or self._version == stale_version:
+                self._corpus = corpus
+                self._version = version
+        return corpus
+
+    def update(self, fragment: Fragment) -> None:
+        if self._corpus is None:
+            return
+
+        version = self._repository.query_line_to_vec_version()
+        with self._lock:
+            if self._corpus is None:
+                return
+
+            self._corpus = (
+                self._corpus.set_entry(
+                    LineToVecEntry(
+                        fragment.number, fragment.script, fragment.line_to_vec
+                    )
+                )
+                if fragment.text.lines
+                else self._corpus.remove_entry(fragment.number)
+            )
+            if version == self._version + 1:
+                self._version = version
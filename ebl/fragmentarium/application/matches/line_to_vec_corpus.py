@@ -0,0 +1,142 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import attr
+
+from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.matches.line_to_vec_score import WEIGHTING
+from ebl.fragmentarium.domain.fragment import Script
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncodings
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+PackedLineToVec = Tuple[bytes, ...]
+
+_WEIGHTS_BY_VALUE = {encoding.value: weight for encoding, weight in WEIGHTING.items()}
+WEIGHTS = bytes(_WEIGHTS_BY_VALUE.get(value, 0) for value in range(256))
+
+
+def pack(line_to_vec: Tuple[LineToVecEncodings, ...]) -> PackedLineToVec:
+    return tuple(bytes(encoding.value for encoding in line) for line in line_to_vec)
+
+
+def _weight(line: bytes) -> int:
+    return sum(line.translate(WEIGHTS))
+
+
+def _longest_overlap(first: bytes, second: bytes, limit: int) -> int:
+    anchor = second[:1]
+    index = first.find(anchor, len(first) - limit)
+    while index != -1:
+        if second.startswith(first[index:]):
+            return len(first) - index
+        index = first.find(anchor, index + 1)
+    return 0
+
+
+def score_packed_lines(first: bytes, second: bytes) -> Tuple[int, int]:
+    """Score two lines as `score` and `score_weighted` do.
+
+    The overlaps considered there are the shorter line contained in the longer
+    one, a suffix of the shorter line matching a prefix of the longer one,
+    and vice versa. Weights are positive, so the longest overlap of each kind
+    is also the heaviest.
+    """
+    shorter, longer = sorted((first, second), key=len)
+    if shorter in longer:
+        return len(shorter), _weight(shorter)
+
+    limit = len(shorter) - 1
+    suffix = _longest_overlap(shorter, longer, limit)
+    prefix = _longest_overlap(longer, shorter, limit)
+    return (
+        max(suffix, prefix),
+        max(
+            _weight(shorter[-suffix:]) if suffix else 0,
+            _weight(shorter[:prefix]),
+        ),
+    )
+
+
+class LineToVecCorpusScore(NamedTuple):
+    index: int
+    score: int
+    score_weighted: int
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class LineToVecCorpus:
+    museum_numbers: Tuple[MuseumNumber, ...] = ()
+    scripts: Tuple[Script, ...] = ()
+    lines: Tuple[PackedLineToVec, ...] = ()
+
+    @staticmethod
+    def of(entries: Iterable[LineToVecEntry]) -> "LineToVecCorpus":
+        entries = list(entries)
+        return LineToVecCorpus(
+            tuple(entry.museum_number for entry in entries),
+            tuple(entry.script for entry in entries),
+            tuple(pack(entry.line_to_vec) for entry in entries),
+        )
+
+    def __len__(self) -> int:
+        return len(self.museum_numbers)
+
+    def set_entry(self, entry: LineToVecEntry) -> "LineToVecCorpus":
+        museum_numbers = list(self.museum_numbers)
+        scripts = list(self.scripts)
+        lines = list(self.lines)
+        try:
+            index = museum_numbers.index(entry.museum_number)
+        except ValueError:
+            museum_numbers.append(entry.museum_number)
+            scripts.append(entry.script)
+            lines.append(pack(entry.line_to_vec))
+        else:
+            scripts[index] = entry.script
+            lines[index] = pack(entry.line_to_vec)
+        return LineToVecCorpus(tuple(museum_numbers), tuple(scripts), tuple(lines))
+
+    def remove_entry(self, museum_number: MuseumNumber) -> "LineToVecCorpus":
+        indexes = [
+            index
+            for index, number in enumerate(self.museum_numbers)
+            if number != museum_number
+        ]
+        return LineToVecCorpus(
+            tuple(self.museum_numbers[index] for index in indexes),
+            tuple(self.scripts[index] for index in indexes),
+            tuple(self.lines[index] for index in indexes),
+        )
+
+    def score(
+        self,
+        candidate: Tuple[LineToVecEncodings, ...],
+        exclude: Optional[MuseumNumber] = None,
+    ) -> List[LineToVecCorpusScore]:
+        packed_candidate = pack(candidate)
+        pair_scores: Dict[Tuple[bytes, bytes], Tuple[int, int]] = {}
+
+        def score_pair(first: bytes, second: bytes) -> Tuple[int, int]:
+            key = (first, second)
+            if key not in pair_scores:
+                pair_scores[key] = score_packed_lines(first, second)
+            return pair_scores[key]
+
+        results = []
+        for index, (museum_number, lines) in enumerate(
+            zip(self.museum_numbers, self.lines, strict=True)
+        ):
+            if museum_number == exclude:
+                continue
+            scores = [
+                score_pair(first, second)
+                for first in packed_candidate
+                for second in lines
+            ]
+            results.append(
+                LineToVecCorpusScore(
+                    index,
+                    max((score for score, _ in scores), default=0),
+                    max((weighted for _, weighted in scores), default=0),
+                )
+            )
+        return results
@@ -8,6 +8,15 @@ from ebl.fragmentarium.domain.line_to_vec_encoding import (
     LineToVecEncodings,
 )
 
+WEIGHTING = {
+    LineToVecEncoding.START: 3,
+    LineToVecEncoding.TEXT_LINE: 1,
+    LineToVecEncoding.SINGLE_RULING: 3,
+    LineToVecEncoding.DOUBLE_RULING: 6,
+    LineToVecEncoding.TRIPLE_RULING: 10,
+    LineToVecEncoding.END: 3,
+}
+
 
 def score(
     seq1: Tuple[LineToVecEncodings, ...], seq2: Tuple[LineToVecEncodings, ...]
@@ -58,15 +67,7 @@ def compute_score(
 
 
 def weight_subsequence(seq_of_seq: List[LineToVecEncodings]) -> int:
-    weighting = {
-        LineToVecEncoding.START: 3,
-        LineToVecEncoding.TEXT_LINE: 1,
-        LineToVecEncoding.SINGLE_RULING: 3,
-        LineToVecEncoding.DOUBLE_RULING: 6,
-        LineToVecEncoding.TRIPLE_RULING: 10,
-        LineToVecEncoding.END: 3,
-    }
     return max(
         sum(elem)
-        for elem in [[weighting[number] for number in seq] for seq in seq_of_seq]
+        for elem in [[WEIGHTING[number] for number in seq] for seq in seq_of_seq]
     )
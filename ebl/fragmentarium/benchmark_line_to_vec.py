@@ -0,0 +1,121 @@
+import argparse
+import random
+import time
+from typing import Callable, List, Sequence
+
+from ebl.fragmentarium.application.fragment_fields_schemas import ScriptSchema
+from ebl.fragmentarium.application.fragment_matcher import (
+    LineToVecRanker,
+    LineToVecRanking,
+)
+from ebl.fragmentarium.application.line_to_vec import LineToVecEntry, LineToVecScore
+from ebl.fragmentarium.application.matches.line_to_vec_corpus import LineToVecCorpus
+from ebl.fragmentarium.application.matches.line_to_vec_score import (
+    score,
+    score_weighted,
+)
+from ebl.fragmentarium.domain.fragment import Script
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.transliteration.application.museum_number_schema import MuseumNumberSchema
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+ENCODINGS = [0, 1, 1, 1, 1, 1, 1, 2, 2, 3, 4, 5]
+
+
+def create_documents(number_of_fragments: int, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    script = ScriptSchema().dump(Script())
+    return [
+        {
+            "museumNumber": MuseumNumberSchema().dump(MuseumNumber("X", str(index))),
+            "script": script,
+            "lineToVec": [
+                [rng.choice(ENCODINGS) for _ in range(rng.randint(1, 30))]
+                for _ in range(rng.randint(1, 3))
+            ],
+        }
+        for index in range(number_of_fragments)
+    ]
+
+
+def load_entries(documents: Sequence[dict]) -> List[LineToVecEntry]:
+    museum_number_schema = MuseumNumberSchema()
+    script_schema = ScriptSchema()
+    return [
+        LineToVecEntry(
+            museum_number_schema.load(document["museumNumber"]),
+            script_schema.load(document["script"]),
+            tuple(
+                LineToVecEncoding.from_list(line_to_vec)
+                for line_to_vec in document["lineToVec"]
+            ),
+        )
+        for document in documents
+    ]
+
+
+def rank_unpacked(
+    documents: Sequence[dict], candidate: LineToVecEntry
+) -> List[List[LineToVecScore]]:
+    scores = []
+    weighted_scores = []
+    for entry in load_entries(documents):
+        if entry.museum_number != candidate.museum_number:
+            scores.append(
+                LineToVecScore(
+                    entry.museum_number,
+                    entry.script,
+                    score(candidate.line_to_vec, entry.line_to_vec),
+                )
+            )
+            weighted_scores.append(
+                LineToVecScore(
+                    entry.museum_number,
+                    entry.script,
+                    score_weighted(candidate.line_to_vec, entry.line_to_vec),
+                )
+            )
+    return [
+        sorted(results, key=lambda item: -item.score)[
+            : LineToVecRanker.NUMBER_OF_RESULTS_TO_RETURN
+        ]
+        for results in [scores, weighted_scores]
+    ]
+
+
+def rank_snapshot(
+    corpus: LineToVecCorpus, candidate: LineToVecEntry
+) -> LineToVecRanking:
+    return LineToVecRanker(
+        corpus, corpus.score(candidate.line_to_vec, candidate.museum_number)
+    ).ranking
+
+
+def measure(rank: Callable[[LineToVecEntry], object], candidates) -> float:
+    start = time.perf_counter()
+    for candidate in candidates:
+        rank(candidate)
+    return (time.perf_counter() - start) / len(candidates)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare line-to-vec ranking latency on synthetic fragments."
+    )
+    parser.add_argument("-f", "--fragments", type=int, default=50000)
+    parser.add_argument("-r", "--requests", type=int, default=3)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    documents = create_documents(args.fragments, args.seed)
+    candidates = load_entries(random.Random(args.seed).sample(documents, args.requests))
+
+    start = time.perf_counter()
+    corpus = LineToVecCorpus.of(load_entries(documents))
+    print(f"Snapshot load: {time.perf_counter() - start:.3f} s")
+
+    before = measure(lambda candidate: rank_unpacked(documents, candidate), candidates)
+    after = measure(lambda candidate: rank_snapshot(corpus, candidate), candidates)
+    print(f"Deserialize and rank per request: {before:.3f} s")
+    print(f"Rank against snapshot: {after:.3f} s")
+    print(f"Speed-up: {before / after:.1f}x")
@@ -1,4 +1,3 @@
-import base64
 import io
 from PIL import Image
 from enum import Enum
@@ -7,7 +6,7 @@ from uuid import uuid4
 
 import attr
 
-from ebl.fragmentarium.application.cropped_sign_image import CroppedSign, Base64
+from ebl.fragmentarium.application.cropped_sign_image import CroppedSign
 from ebl.fragmentarium.domain.fragment import Script
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
@@ -62,7 +61,7 @@ class Annotation:
     cropped_sign: Optional[CroppedSign]
     pca_clustering: Optional[PcaClustering] = None
 
-    def crop_image(self, image: Image.Image) -> Base64:
+    def crop_image(self, image: Image.Image) -> bytes:
         bounding_box = BoundingBox.from_annotations(
             image.size[0], image.size[1], [self]
         )[0]
@@ -78,7 +77,7 @@ class Annotation:
             cropped_image.thumbnail(MAX_SIZE)
         buf = io.BytesIO()
         cropped_image.save(buf, format="PNG")
-        return Base64(base64.b64encode(buf.getvalue()).decode("utf-8"))
+        return buf.getvalue()
 
     @classmethod
     def from_prediction(cls, geometry: Geometry) -> "Annotation":
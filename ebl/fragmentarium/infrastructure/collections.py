@@ -1 +1,4 @@
 JOINS_COLLECTION = "joins"
+JOIN_MEMBERS_COLLECTION = "join_members"
+SIGN_NGRAMS_COLLECTION = "fragment_sign_ngrams"
+QUERY_COUNTS_COLLECTION = "fragment_query_counts"
@@ -1,5 +1,6 @@
-from typing import Sequence
+from typing import Mapping, Sequence
 
+import pymongo
 from pymongo.database import Database
 
 from ebl.fragmentarium.application.cropped_sign_image import CroppedSignImageSchema
@@ -18,6 +19,9 @@ class MongoCroppedSignImagesRepository(CroppedSignImagesRepository):
         self._collection = MongoCollection(database, COLLECTION)
         self._database = database
 
+    def create_indexes(self) -> None:
+        self._collection.create_index([("fragment_number", pymongo.ASCENDING)])
+
     def create_many(self, cropped_sign_images: Sequence[CroppedSignImage]) -> None:
         schema = CroppedSignImageSchema(many=True)
         self._collection.insert_many(schema.dump(cropped_sign_images))
@@ -27,6 +31,23 @@ class MongoCroppedSignImagesRepository(CroppedSignImagesRepository):
             self._collection.find_one({"_id": image_id})
         )
 
+    def query_by_ids(self, image_ids: Sequence[str]) -> Sequence[CroppedSignImage]:
+        return CroppedSignImageSchema(many=True).load(
+            self._collection.find_many({"_id": {"$in": list(image_ids)}})
+        )
+
+    def query_content_hashes(self, fragment_number: MuseumNumber) -> Mapping[str, str]:
+        return {
+            document["_id"]: document.get("contentHash", "")
+            for document in self._collection.find_many(
+                {"fragment_number": str(fragment_number)},
+                projection={"contentHash": True},
+            )
+        }
+
+    def delete_by_ids(self, image_ids: Sequence[str]) -> None:
+        self._database[COLLECTION].delete_many({"_id": {"$in": list(image_ids)}})
+
     def delete_by_fragment_number(self, fragment_number: MuseumNumber) -> None:
         self._database[COLLECTION].delete_many(
             {"fragment_number": str(fragment_number)}
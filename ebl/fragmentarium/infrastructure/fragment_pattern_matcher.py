@@ -28,9 +28,11 @@ class PatternMatcher:
         query: Dict,
         provenance_service: ProvenanceService,
         user_scopes: Sequence[Scope] = (),
+        candidate_ids: Optional[Sequence[str]] = None,
     ):
         self._query = query
         self._scopes = user_scopes
+        self._candidate_ids = candidate_ids
         self._provenance_service = provenance_service
 
         self._lemma_matcher = (
@@ -117,10 +119,16 @@ class PatternMatcher:
             else {}
         )
 
+    def _filter_by_candidates(self) -> Dict:
+        return (
+            {} if self._candidate_ids is None else {"_id": {"$in": self._candidate_ids}}
+        )
+
     def _prefilter(self) -> List[Dict]:
         constraints = {
             "$and": compact(
                 [
+                    self._filter_by_candidates(),
                     number_is(self._query["number"]) if "number" in self._query else {},
                     self._filter_by_genre(),
                     self._filter_by_museum(),
@@ -197,7 +205,7 @@ class PatternMatcher:
             {"$match": {"matchCount": {"$gt": 0}}},
         ]
 
-    def _get_pipeline_components(self) -> List[Dict]:
+    def _match_pipeline(self) -> List[Dict]:
         dispatcher = {
             (True, True): self._merge_pipelines,
             (True, False): self._lemma_matcher.build_pipeline,
@@ -208,7 +216,9 @@ class PatternMatcher:
             isinstance(self._lemma_matcher, LemmaMatcher),
             isinstance(self._sign_matcher, SignMatcher),
         )
+        return dispatcher[key]()
 
+    def _get_pipeline_components(self) -> List[Dict]:
         facet = {
             "items": [
                 *self._sort_by({"_scriptSortKey": 1, "_sortKey": 1}),
@@ -220,10 +230,20 @@ class PatternMatcher:
 
         return [
             *self._prefilter(),
-            *dispatcher[key](),
+            *self._match_pipeline(),
             {"$facet": facet},
             {"$project": result_projection(self._query)},
         ]
 
     def build_pipeline(self) -> List[Dict]:
         return self._get_pipeline_components()
+
+    def build_count_pipeline(self) -> List[Dict]:
+        return [*self._prefilter(), *self._match_pipeline(), *count_pipeline()]
+
+    def build_sample_count_pipeline(self, sample_size: int) -> List[Dict]:
+        """Count the matches in a random sample of the whole collection."""
+        return [
+            {"$sample": {"size": sample_size}},
+            *self.build_count_pipeline(),
+        ]
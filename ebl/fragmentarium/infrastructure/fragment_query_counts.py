@@ -0,0 +1,78 @@
+import datetime
+import hashlib
+import json
+from typing import Optional, Sequence
+
+import pymongo
+from pymongo.database import Database
+
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
+from ebl.common.domain.scopes import Scope
+from ebl.fragmentarium.infrastructure.collections import QUERY_COUNTS_COLLECTION
+
+FRAGMENTS_VERSION = "fragments"
+QUERY_COUNT_TIMEOUT = datetime.timedelta(days=1)
+PAGINATION_FIELDS = frozenset({"limit", "offset", "count"})
+QUERIED_UPDATE_FIELDS = frozenset(
+    {
+        "lemmatization",
+        "genres",
+        "references",
+        "script",
+        "archaeology",
+        "transliteration",
+        "authorized_scopes",
+        "named_entities",
+    }
+)
+
+
+def create_count_key(query: dict, user_scopes: Sequence[Scope]) -> str:
+    normalized = {
+        "query": {
+            key: value for key, value in query.items() if key not in PAGINATION_FIELDS
+        },
+        "scopes": sorted(str(scope) for scope in user_scopes),
+    }
+    return hashlib.sha256(
+        json.dumps(normalized, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
+
+class MongoFragmentQueryCounts:
+    """Exact match counts of fragment queries.
+
+    Counts are stamped with the fragments version, which creating fragments
+    and updating fields in QUERIED_UPDATE_FIELDS increments.
+    """
+
+    def __init__(self, database: Database) -> None:
+        self._collection = database[QUERY_COUNTS_COLLECTION]
+        self._versions = MongoVersionRepository(database)
+
+    def create_indexes(self) -> None:
+        self._collection.create_index(
+            [("createdAt", pymongo.ASCENDING)],
+            expireAfterSeconds=int(QUERY_COUNT_TIMEOUT.total_seconds()),
+        )
+
+    def get_version(self) -> int:
+        return self._versions.get(FRAGMENTS_VERSION)
+
+    def invalidate(self) -> None:
+        self._versions.increment(FRAGMENTS_VERSION)
+
+    def find(self, key: str, version: int) -> Optional[int]:
+        document = self._collection.find_one({"_id": key, "version": version})
+        return None if document is None else document["matchCountTotal"]
+
+    def save(self, key: str, version: int, match_count_total: int) -> None:
+        self._collection.replace_one(
+            {"_id": key},
+            {
+                "version": version,
+                "matchCountTotal": match_count_total,
+                "createdAt": datetime.datetime.now(datetime.timezone.utc),
+            },
+            upsert=True,
+        )
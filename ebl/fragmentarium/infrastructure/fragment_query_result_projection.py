@@ -2,6 +2,8 @@ from typing import Dict, List
 
 EXACT_COUNT = "exact"
 PAGE_COUNT = "page"
+ESTIMATE_COUNT = "estimate"
+NO_COUNT = "none"
 
 
 def count_mode(query: Dict) -> str:
@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from pymongo.database import Database
+
+from ebl.cache.infrastructure.mongo_version_repository import (
+    COLLECTION as VERSIONS_COLLECTION,
+)
+from ebl.fragmentarium.infrastructure.queries import JOIN_MEMBERS_VERSION
+
+DEFAULT_REFRESH_INTERVAL: float = 60
+
+
+class JoinMembersVersion:
+    """The version of the joins the join members were built from.
+
+    Every write to the joins increments `joins` and the members are used while
+    `members` is equal to it. The versions are read from the database at most
+    once per refresh interval.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._versions = database[VERSIONS_COLLECTION]
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._is_current = False
+        self._checked_at: Optional[float] = None
+
+    def is_current(self) -> bool:
+        now = self._clock()
+        with self._lock:
+            if (
+                self._checked_at is None
+                or now - self._checked_at >= self._refresh_interval
+            ):
+                document = self._versions.find_one({"_id": JOIN_MEMBERS_VERSION})
+                self._is_current = document is not None and document.get(
+                    "members"
+                ) == document.get("joins", 0)
+                self._checked_at = now
+            return self._is_current
+
+    def increment_joins(self, members_updated: bool = False) -> None:
+        """Record a write to the joins.
+
+        If the same write was applied to the members, they stay current if
+        they were current before.
+        """
+        if not (
+            members_updated
+            and self._versions.update_one(
+                {"_id": JOIN_MEMBERS_VERSION, "members": {"$exists": True}},
+                {"$inc": {"joins": 1, "members": 1}},
+            ).matched_count
+        ):
+            self._versions.update_one(
+                {"_id": JOIN_MEMBERS_VERSION}, {"$inc": {"joins": 1}}, upsert=True
+            )
+        self._expire()
+
+    def get_joins(self) -> int:
+        document = self._versions.find_one({"_id": JOIN_MEMBERS_VERSION})
+        return 0 if document is None else document.get("joins", 0)
+
+    def set_members(self, joins: int) -> None:
+        self._versions.update_one(
+            {"_id": JOIN_MEMBERS_VERSION},
+            {"$set": {"members": joins}},
+            upsert=True,
+        )
+        self._expire()
+
+    def _expire(self) -> None:
+        with self._lock:
+            self._checked_at = None
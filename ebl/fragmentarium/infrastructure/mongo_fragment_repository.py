@@ -5,6 +5,16 @@ from ebl.fragmentarium.infrastructure.mongo_fragment_repository_create import (
 from ebl.fragmentarium.infrastructure.mongo_fragment_repository_get import (
     MongoFragmentRepositoryGet,
 )
+from ebl.fragmentarium.infrastructure.mongo_fragment_repository_base import (
+    SIGN_NGRAMS_VERSION,
+    stored_atf,
+)
+from ebl.fragmentarium.infrastructure.fragment_query_counts import (
+    QUERIED_UPDATE_FIELDS,
+)
+from ebl.lemmatization.infrastrcuture.lemma_statistics import (
+    FRAGMENT_TOKENS_PROJECTION,
+)
 from ebl.fragmentarium.infrastructure.queries import (
     HAS_TRANSLITERATION,
     fragment_is,
@@ -65,10 +75,54 @@ class MongoFragmentRepository(
                 ("fragments.museumNumber.suffix", pymongo.ASCENDING),
             ]
         )
+        self._join_members.create_index(
+            [
+                ("museumNumber.number", pymongo.ASCENDING),
+                ("museumNumber.prefix", pymongo.ASCENDING),
+                ("museumNumber.suffix", pymongo.ASCENDING),
+            ]
+        )
+        self._join_members.create_index([("joinId", pymongo.ASCENDING)])
+
+    def _create_sign_ngram_indexes(self) -> None:
+        self._sign_ngrams.create_index([("ngrams", pymongo.ASCENDING)])
 
     def create_indexes(self) -> None:
         self._create_fragment_indexes()
         self._create_join_indexes()
+        self._create_sign_ngram_indexes()
+        self._lemma_statistics.create_indexes()
+        self._query_counts.create_indexes()
+
+    def rebuild_sign_ngrams(self) -> int:
+        cursor = self._fragments.find_many({}, projection={"signs": True})
+        count = 0
+        for fragment in cursor:
+            self._update_sign_ngrams(fragment["_id"], fragment.get("signs", ""))
+            count += 1
+        self._versions.increment(SIGN_NGRAMS_VERSION)
+        return count
+
+    def rebuild_join_members(self) -> int:
+        joins = self._join_members_version.get_joins()
+        self._join_members.delete_many({})
+        count = 0
+        for join in self._joins.find_many({}):
+            self._create_join_members(join["_id"], join.get("fragments", []))
+            count += 1
+        self._join_members_version.set_members(joins)
+        return count
+
+    def update_stored_atf(self) -> int:
+        count = 0
+        for fragment in self._fragments.find_many(
+            {"atf": {"$exists": False}}, projection={"text": True}
+        ):
+            self._fragments.update_one(
+                {"_id": fragment["_id"]}, {"$set": {"atf": stored_atf(fragment)}}
+            )
+            count += 1
+        return count
 
     def count_total_fragments(self) -> int:
         return self._fragments.count_documents({})
@@ -120,7 +174,24 @@ class MongoFragmentRepository(
                 f"Unexpected update field {field}, must be one of {','.join(fields_to_update)}"
             )
         query = self._schema(only=fields_to_update[field]).dump(fragment)
+        if "text" in fields_to_update[field]:
+            query["atf"] = fragment.text.atf
+        old = (
+            self._fragments.find_one(
+                fragment_is(fragment), projection=FRAGMENT_TOKENS_PROJECTION
+            )
+            if "text" in fields_to_update[field]
+            else None
+        )
         self._fragments.update_one(
             fragment_is(fragment),
             {"$set": query if query else {field: None}},
         )
+        if field in QUERIED_UPDATE_FIELDS:
+            self._query_counts.invalidate()
+        if old is not None:
+            self._update_lemma_statistics(old, query)
+        if field == "transliteration":
+            self._update_sign_ngrams(str(fragment.number), fragment.signs)
+        if field in {"transliteration", "script"}:
+            self._increment_line_to_vec_version()
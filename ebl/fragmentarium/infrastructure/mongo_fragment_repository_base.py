@@ -1,13 +1,43 @@
 from marshmallow import EXCLUDE
-from typing import Sequence
+from typing import List, Optional, Sequence, cast
 from pymongo.database import Database
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
 from ebl.provenance.application.provenance_service import ProvenanceService
 from ebl.mongo_collection import MongoCollection
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.fragmentarium.application.fragment_schema import FragmentSchema
 from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.transliteration.infrastructure.collections import FRAGMENTS_COLLECTION
-from ebl.fragmentarium.infrastructure.collections import JOINS_COLLECTION
+from ebl.fragmentarium.infrastructure.collections import (
+    JOIN_MEMBERS_COLLECTION,
+    JOINS_COLLECTION,
+    SIGN_NGRAMS_COLLECTION,
+)
+from ebl.fragmentarium.infrastructure.fragment_query_counts import (
+    MongoFragmentQueryCounts,
+)
+from ebl.fragmentarium.infrastructure.join_members import JoinMembersVersion
+from ebl.fragmentarium.infrastructure.queries import (
+    join_joins,
+    museum_number_is,
+)
+from ebl.lemmatization.infrastrcuture.lemma_statistics import (
+    MongoLemmaStatistics,
+    fragment_tokens,
+)
+from ebl.transliteration.application.text_schema import TextSchema
+from ebl.transliteration.domain.sign_ngrams import create_sign_ngrams
+from ebl.transliteration.domain.text import Text
+
+LINE_TO_VEC_VERSION = "lineToVec"
+SIGN_NGRAMS_VERSION = "signNgrams"
+
+
+def stored_atf(fragment: dict) -> str:
+    """Fragments saved before `atf` was stored fall back to loading the text."""
+    if "atf" in fragment:
+        return fragment["atf"]
+    return cast(Text, TextSchema().load(fragment["text"])).atf
 
 
 class MongoFragmentRepositoryBase(FragmentRepository):
@@ -16,7 +46,13 @@ class MongoFragmentRepositoryBase(FragmentRepository):
     ) -> None:
         self._fragments = MongoCollection(database, FRAGMENTS_COLLECTION)
         self._joins = MongoCollection(database, JOINS_COLLECTION)
+        self._join_members = database[JOIN_MEMBERS_COLLECTION]
+        self._join_members_version = JoinMembersVersion(database)
+        self._sign_ngrams = MongoCollection(database, SIGN_NGRAMS_COLLECTION)
         self._photo_files = MongoCollection(database, "photos.files")
+        self._versions = MongoVersionRepository(database)
+        self._lemma_statistics = MongoLemmaStatistics(database)
+        self._query_counts = MongoFragmentQueryCounts(database)
         self._provenance_service = provenance_service
 
     def _schema(self, **kwargs):
@@ -24,5 +60,48 @@ class MongoFragmentRepositoryBase(FragmentRepository):
             context={"provenance_service": self._provenance_service}, **kwargs
         )
 
+    def _increment_line_to_vec_version(self) -> None:
+        self._versions.increment(LINE_TO_VEC_VERSION)
+
+    def _update_sign_ngrams(self, number: str, signs: str) -> None:
+        self._sign_ngrams.replace_one(
+            {"_id": number, "ngrams": sorted(create_sign_ngrams(signs))},
+            upsert=True,
+        )
+
+    def _update_lemma_statistics(
+        self, old: Optional[dict], new: Optional[dict]
+    ) -> None:
+        self._lemma_statistics.update(fragment_tokens(old), fragment_tokens(new))
+
+    def _create_join_members(self, join_id, fragments: Sequence[dict]) -> None:
+        if fragments:
+            self._join_members.insert_many(
+                [
+                    {
+                        **fragment,
+                        "joinId": join_id,
+                        "position": position,
+                        "isInFragmentarium": fragment.get("museumNumber") is not None
+                        and self._fragments.exists(
+                            museum_number_is(fragment["museumNumber"])
+                        ),
+                    }
+                    for position, fragment in enumerate(fragments)
+                ]
+            )
+
+    def _set_join_members_in_fragmentarium(
+        self, museum_numbers: Sequence[dict]
+    ) -> None:
+        if museum_numbers:
+            self._join_members.update_many(
+                {"$or": [museum_number_is(number) for number in museum_numbers]},
+                {"$set": {"isInFragmentarium": True}},
+            )
+
+    def _join_joins(self) -> List[dict]:
+        return join_joins(self._join_members_version.is_current())
+
     def _map_fragments(self, cursor) -> Sequence[Fragment]:
         return self._schema(unknown=EXCLUDE, many=True).load(cursor)
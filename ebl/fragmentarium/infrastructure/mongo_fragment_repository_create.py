@@ -6,37 +6,59 @@ from ebl.fragmentarium.application.joins_schema import JoinSchema
 from ebl.fragmentarium.infrastructure.mongo_fragment_repository_base import (
     MongoFragmentRepositoryBase,
 )
+from ebl.lemmatization.infrastrcuture.lemma_statistics import fragment_tokens
 
 
 class MongoFragmentRepositoryCreate(MongoFragmentRepositoryBase):
     def create(self, fragment, sort_key=None):
-        return self._fragments.insert_one(
+        data = self._schema(exclude=["joins"]).dump(fragment)
+        id_ = self._fragments.insert_one(
             {
                 "_id": str(fragment.number),
-                **self._schema(exclude=["joins"]).dump(fragment),
+                **data,
+                "atf": fragment.text.atf,
                 **({} if sort_key is None else {"_sortKey": sort_key}),
             }
         )
+        self._update_sign_ngrams(str(fragment.number), fragment.signs)
+        self._update_lemma_statistics(None, data)
+        self._set_join_members_in_fragmentarium([data["museumNumber"]])
+        self._increment_line_to_vec_version()
+        self._query_counts.invalidate()
+        return id_
 
     def create_many(self, fragments: Sequence[Fragment]) -> Sequence[str]:
         schema = self._schema(exclude=["joins"])
-        return self._fragments.insert_many(
-            [
-                {"_id": str(fragment.number), **schema.dump(fragment)}
-                for fragment in fragments
-            ]
+        documents = [
+            {
+                "_id": str(fragment.number),
+                **schema.dump(fragment),
+                "atf": fragment.text.atf,
+            }
+            for fragment in fragments
+        ]
+        ids = self._fragments.insert_many(documents)
+        for fragment in fragments:
+            self._update_sign_ngrams(str(fragment.number), fragment.signs)
+        self._lemma_statistics.update(
+            [], (token for document in documents for token in fragment_tokens(document))
         )
+        self._set_join_members_in_fragmentarium(
+            [document["museumNumber"] for document in documents]
+        )
+        self._increment_line_to_vec_version()
+        self._query_counts.invalidate()
+        return ids
 
     def create_join(self, joins: Sequence[Sequence[Join]]) -> None:
-        self._joins.insert_one(
+        fragments = [
             {
-                "fragments": [
-                    {
-                        **JoinSchema(exclude=["is_in_fragmentarium"]).dump(join),
-                        "group": index,
-                    }
-                    for index, group in enumerate(joins)
-                    for join in group
-                ]
+                **JoinSchema(exclude=["is_in_fragmentarium"]).dump(join),
+                "group": index,
             }
-        )
+            for index, group in enumerate(joins)
+            for join in group
+        ]
+        join_id = self._joins.insert_one({"fragments": fragments})
+        self._create_join_members(join_id, fragments)
+        self._join_members_version.increment_joins(members_updated=True)
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 from marshmallow import EXCLUDE
 from pymongo.collation import Collation
@@ -16,15 +16,23 @@ from ebl.fragmentarium.application.fragment_query_summary_schema import (
 from ebl.fragmentarium.domain.archaeology import ExcavationNumber
 from ebl.fragmentarium.domain.fragment_query_summary import FragmentQueryResult
 from ebl.fragmentarium.infrastructure.mongo_fragment_repository_base import (
+    SIGN_NGRAMS_VERSION,
     MongoFragmentRepositoryBase,
+    stored_atf,
 )
 from ebl.transliteration.application.museum_number_schema import MuseumNumberSchema
 from ebl.fragmentarium.domain.fragment_pager_info import FragmentPagerInfo
 from ebl.fragmentarium.infrastructure.fragment_pattern_matcher import PatternMatcher
+from ebl.fragmentarium.infrastructure.fragment_query_counts import create_count_key
+from ebl.fragmentarium.infrastructure.fragment_query_result_projection import (
+    ESTIMATE_COUNT,
+    EXACT_COUNT,
+    NO_COUNT,
+    count_mode,
+)
 from ebl.fragmentarium.infrastructure.queries import (
     HAS_TRANSLITERATION,
     aggregate_latest,
-    join_joins,
     join_findspots,
     aggregate_by_traditional_references,
 )
@@ -38,6 +46,21 @@ from ebl.fragmentarium.infrastructure.mongo_fragment_repository_get_extended imp
 from ebl.transliteration.domain.atf import DEFAULT_ATF_PARSER_VERSION
 
 RETRIEVE_ALL_LIMIT = 1000
+RETRIEVE_ALL_PROJECTION = {
+    "folios": 0,
+    "lineToVec": 0,
+    "authorizedScops": 0,
+    "references": 0,
+    "uncuratedReferences": 0,
+    "genreLegacy": 0,
+    "legacyJoins": 0,
+    "legacyScript": 0,
+    "_sortKey": 0,
+}
+SIGN_NGRAM_CANDIDATES_LIMIT = 5000
+ESTIMATE_SAMPLE_SIZE = 2000
+ESTIMATE_MIN_SAMPLED_MATCHES = 100
+QUERY_COLLATION = Collation(locale="en", numericOrdering=True, alternate="shifted")
 FRAGMENT_QUERY_SUMMARY_PROJECTION = {
     "_id": True,
     "accession": True,
@@ -192,6 +215,13 @@ def fragment_lemma_pipeline(clean_values: List[str]) -> List[dict]:
     ]
 
 
+def _page_match_count_lower_bound(query: dict, data: Optional[dict]) -> int:
+    """Every fragment before the page matched at least once."""
+    items = (data or {}).get("items", [])
+    page_total = sum(item.get("matchCount", 0) for item in items)
+    return query.get("offset", 0) + page_total if items else 0
+
+
 def aggregate_counts() -> List[dict]:
     return [
         {
@@ -358,7 +388,7 @@ class MongoFragmentRepositoryGetBase(MongoFragmentRepositoryBase):
                 ),
                 *join_findspots(),
                 *join_reference_documents(),
-                *join_joins(),
+                *self._join_joins(),
             ]
         )
         try:
@@ -425,24 +455,149 @@ class MongoFragmentRepositoryGetBase(MongoFragmentRepositoryBase):
     def query(
         self, query: dict, user_scopes: Sequence[Scope] = ()
     ) -> Union[QueryResult, FragmentQueryResult]:
-        cursor = (
-            self._fragments.aggregate(
-                PatternMatcher(
-                    query, self._provenance_service, user_scopes
-                ).build_pipeline(),
-                collation=Collation(
-                    locale="en", numericOrdering=True, alternate="shifted"
+        if not set(query) - {"lemmaOperator"}:
+            return (
+                FragmentQueryResult.create_empty()
+                if "limit" in query
+                else load_query_result(iter([]))
+            )
+        candidate_ids = self._find_sign_ngram_candidates(query)
+        if "limit" not in query:
+            return load_query_result(
+                self._aggregate_query(
+                    PatternMatcher(
+                        query, self._provenance_service, user_scopes, candidate_ids
+                    ).build_pipeline()
+                )
+            )
+        if count_mode(query) not in {EXACT_COUNT, ESTIMATE_COUNT}:
+            return self._load_fragment_query_result(
+                next(
+                    self._aggregate_query(
+                        PatternMatcher(
+                            query, self._provenance_service, user_scopes, candidate_ids
+                        ).build_pipeline()
+                    ),
+                    None,
+                )
+            )
+        return self._query_with_cached_count(query, user_scopes, candidate_ids)
+
+    def _query_with_cached_count(
+        self,
+        query: dict,
+        user_scopes: Sequence[Scope],
+        candidate_ids: Optional[List[str]],
+    ) -> FragmentQueryResult:
+        key = create_count_key(query, user_scopes)
+        version = self._query_counts.get_version()
+        cached = self._query_counts.find(key, version)
+
+        if cached is None and count_mode(query) == EXACT_COUNT:
+            data = next(
+                self._aggregate_query(
+                    PatternMatcher(
+                        query, self._provenance_service, user_scopes, candidate_ids
+                    ).build_pipeline()
                 ),
-                allowDiskUse=True,
+                None,
+            )
+            self._query_counts.save(
+                key, version, (data or {}).get("matchCountTotal", 0)
             )
-            if set(query) - {"lemmaOperator"}
-            else iter([])
+            return self._load_fragment_query_result(data)
+
+        matcher = PatternMatcher(
+            {**query, "count": NO_COUNT},
+            self._provenance_service,
+            user_scopes,
+            candidate_ids,
         )
-        return (
-            self._load_fragment_query_result(next(cursor, None))
-            if "limit" in query
-            else load_query_result(cursor)
+        data = next(self._aggregate_query(matcher.build_pipeline()), None)
+        total, is_exact = (
+            (cached, True)
+            if cached is not None
+            else self._estimate_match_count_total(
+                matcher, candidate_ids is not None, key, version
+            )
         )
+        if not is_exact:
+            total = max(total, _page_match_count_lower_bound(query, data))
+        return self._load_fragment_query_result(
+            {
+                **(data or {}),
+                "matchCountTotal": total,
+                "isMatchCountTotalExact": is_exact,
+            }
+        )
+
+    def _estimate_match_count_total(
+        self, matcher: PatternMatcher, has_candidates: bool, key: str, version: int
+    ) -> Tuple[int, bool]:
+        """Sample the collection unless counting exactly is cheap.
+
+        Sign n-gram candidates already bound the number of fragments to match.
+        Samples with too few matches say little about the total, so these
+        queries are counted exactly as well.
+        """
+        total_documents = self._fragments.estimated_document_count()
+        if has_candidates or total_documents <= ESTIMATE_SAMPLE_SIZE:
+            return self._count_matches(matcher, key, version), True
+        sampled = self._aggregate_match_count_total(
+            matcher.build_sample_count_pipeline(ESTIMATE_SAMPLE_SIZE)
+        )
+        if sampled < ESTIMATE_MIN_SAMPLED_MATCHES:
+            return self._count_matches(matcher, key, version), True
+        return round(sampled * total_documents / ESTIMATE_SAMPLE_SIZE), False
+
+    def _count_matches(self, matcher: PatternMatcher, key: str, version: int) -> int:
+        total = self._aggregate_match_count_total(matcher.build_count_pipeline())
+        self._query_counts.save(key, version, total)
+        return total
+
+    def _aggregate_match_count_total(self, pipeline: List[dict]) -> int:
+        return next(self._aggregate_query(pipeline), {}).get("matchCountTotal", 0)
+
+    def _aggregate_query(self, pipeline: List[dict]) -> Iterator[dict]:
+        return self._fragments.aggregate(
+            pipeline, collation=QUERY_COLLATION, allowDiskUse=True
+        )
+
+    def query_match_count_total(
+        self, query: dict, user_scopes: Sequence[Scope] = ()
+    ) -> int:
+        key = create_count_key(query, user_scopes)
+        version = self._query_counts.get_version()
+        cached = self._query_counts.find(key, version)
+        if cached is not None:
+            return cached
+        return self._count_matches(
+            PatternMatcher(
+                query,
+                self._provenance_service,
+                user_scopes,
+                self._find_sign_ngram_candidates(query),
+            ),
+            key,
+            version,
+        )
+
+    def _find_sign_ngram_candidates(self, query: dict) -> Optional[List[str]]:
+        sign_ngrams = query.get("signNgrams")
+        if (
+            "transliteration" not in query
+            or not sign_ngrams
+            or not self._versions.get(SIGN_NGRAMS_VERSION)
+        ):
+            return None
+
+        candidates = [
+            document["_id"]
+            for document in self._sign_ngrams.find_many(
+                {"ngrams": {"$all": sign_ngrams}}, projection={"_id": True}
+            ).limit(SIGN_NGRAM_CANDIDATES_LIMIT + 1)
+        ]
+        return None if len(candidates) > SIGN_NGRAM_CANDIDATES_LIMIT else candidates
 
     def query_latest(self) -> QueryResult:
         return load_query_result(
@@ -481,25 +636,50 @@ class MongoFragmentRepositoryGetBase(MongoFragmentRepositoryBase):
                     "$match": HAS_TRANSLITERATION
                     | {"authorizedScopes": {"$exists": False}}
                 },
-                {
-                    "$project": {
-                        "folios": 0,
-                        "lineToVec": 0,
-                        "authorizedScops": 0,
-                        "references": 0,
-                        "uncuratedReferences": 0,
-                        "genreLegacy": 0,
-                        "legacyJoins": 0,
-                        "legacyScript": 0,
-                        "_sortKey": 0,
-                    }
-                },
+                {"$project": RETRIEVE_ALL_PROJECTION},
                 {"$skip": skip},
                 {"$limit": RETRIEVE_ALL_LIMIT},
             ]
         )
         return list(fragments)
 
+    def retrieve_transliterated_fragments_after(
+        self, last_id: Optional[str], limit: int
+    ) -> Sequence[dict]:
+        fragments = list(
+            self._fragments.aggregate(
+                [
+                    {
+                        "$match": HAS_TRANSLITERATION
+                        | {"authorizedScopes": {"$exists": False}}
+                        | ({} if last_id is None else {"_id": {"$gt": last_id}})
+                    },
+                    {"$sort": {"_id": 1}},
+                    {"$limit": limit},
+                    {"$project": RETRIEVE_ALL_PROJECTION},
+                    {
+                        "$set": {
+                            "text": {
+                                "$cond": [
+                                    {"$eq": [{"$type": "$atf"}, "missing"]},
+                                    "$text",
+                                    "$$REMOVE",
+                                ]
+                            }
+                        }
+                    },
+                ]
+            )
+        )
+        photos = set(self._find_fragment_query_photo_filenames(fragments))
+        for fragment in fragments:
+            fragment["atf"] = stored_atf(fragment)
+            fragment.pop("text", None)
+            fragment["hasPhoto"] = (
+                fragment_photo_filename(fragment["museumNumber"]) in photos
+            )
+        return fragments
+
     def collect_lemmas(self, number: MuseumNumber):
         fragment = self.query_by_museum_number(number)
         clean_values = list(
@@ -510,6 +690,8 @@ class MongoFragmentRepositoryGetBase(MongoFragmentRepositoryBase):
                 if token.lemmatizable
             }
         )
+        if self._lemma_statistics.is_built():
+            return self._lemma_statistics.find_most_common(clean_values)
         return {
             element["_id"]: max(
                 element["lemmatizations"], key=lambda entry: entry["count"]
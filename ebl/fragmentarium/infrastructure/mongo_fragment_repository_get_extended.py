@@ -7,6 +7,7 @@ from ebl.common.domain.scopes import Scope
 from ebl.errors import NotFoundError
 from ebl.fragmentarium.application.fragment_info_schema import FragmentInfoSchema
 from ebl.fragmentarium.infrastructure.mongo_fragment_repository_base import (
+    LINE_TO_VEC_VERSION,
     MongoFragmentRepositoryBase,
 )
 from ebl.fragmentarium.application.fragment_fields_schemas import ScriptSchema
@@ -86,11 +87,15 @@ class MongoFragmentRepositoryGetExtended(MongoFragmentRepositoryBase):
         )
 
     def query_transliterated_line_to_vec(self) -> List[LineToVecEntry]:
-        cursor = self._fragments.find_many(HAS_TRANSLITERATION, {"text": False})
+        cursor = self._fragments.find_many(
+            HAS_TRANSLITERATION, projection=["museumNumber", "script", "lineToVec"]
+        )
+        museum_number_schema = MuseumNumberSchema()
+        script_schema = ScriptSchema()
         return [
             LineToVecEntry(
-                MuseumNumberSchema().load(fragment["museumNumber"]),
-                ScriptSchema().load(fragment["script"]),
+                museum_number_schema.load(fragment["museumNumber"]),
+                script_schema.load(fragment["script"]),
                 tuple(
                     LineToVecEncoding.from_list(line_to_vec)
                     for line_to_vec in fragment["lineToVec"]
@@ -99,6 +104,9 @@ class MongoFragmentRepositoryGetExtended(MongoFragmentRepositoryBase):
             for fragment in cursor
         ]
 
+    def query_line_to_vec_version(self) -> int:
+        return self._versions.get(LINE_TO_VEC_VERSION)
+
     def query_by_transliterated_not_revised_by_other(
         self, user_scopes: Sequence[Scope] = ()
     ):
@@ -5,19 +5,23 @@ from ebl.fragmentarium.domain.archaeology import ExcavationNumber
 
 from ebl.fragmentarium.domain.fragment import Fragment
 from ebl.fragmentarium.domain.record import RecordType
-from ebl.fragmentarium.infrastructure.collections import JOINS_COLLECTION
+from ebl.fragmentarium.infrastructure.collections import (
+    JOIN_MEMBERS_COLLECTION,
+    JOINS_COLLECTION,
+)
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.transliteration.infrastructure.collections import (
     FRAGMENTS_COLLECTION,
     FINDSPOTS_COLLECTION,
 )
-from ebl.transliteration.infrastructure.queries import query_number_is
+from ebl.transliteration.infrastructure.queries import build_query, query_number_is
 
 HAS_TRANSLITERATION: dict = {"text.lines.type": {"$exists": True}}
 NUMBER_OF_NEEDS_REVISION: int = 20
 PATH_OF_THE_PIONEERS_MAX_UNCURATED_REFERENCES: int = 10
 LATEST_TRANSLITERATION_LIMIT: int = 50
 LATEST_TRANSLITERATION_LINE_LIMIT: int = 3
+JOIN_MEMBERS_VERSION = "joinMembers"
 
 
 def fragment_photo_filename_expression() -> Dict:
@@ -306,7 +310,9 @@ def is_in_fragmentarium(local_field: str, as_: str) -> List[dict]:
     ]
 
 
-def join_joins() -> List[dict]:
+def join_joins(indexed: bool = False) -> List[dict]:
+    if indexed:
+        return join_join_members()
     return [
         {
             "$lookup": {
@@ -372,6 +378,71 @@ def join_joins() -> List[dict]:
     ]
 
 
+def museum_number_is(serialized: dict) -> dict:
+    return build_query("museumNumber", serialized, False)
+
+
+def join_join_members() -> List[dict]:
+    return [
+        {
+            "$lookup": {
+                "from": JOIN_MEMBERS_COLLECTION,
+                "localField": "museumNumber.number",
+                "foreignField": "museumNumber.number",
+                "let": {"number": "$museumNumber"},
+                "pipeline": [
+                    {
+                        "$match": {
+                            "$expr": {
+                                "$and": [
+                                    {
+                                        "$eq": [
+                                            "$museumNumber.prefix",
+                                            "$$number.prefix",
+                                        ]
+                                    },
+                                    {
+                                        "$eq": [
+                                            "$museumNumber.suffix",
+                                            "$$number.suffix",
+                                        ]
+                                    },
+                                ]
+                            }
+                        }
+                    },
+                    {"$limit": 1},
+                    {
+                        "$lookup": {
+                            "from": JOIN_MEMBERS_COLLECTION,
+                            "localField": "joinId",
+                            "foreignField": "joinId",
+                            "as": "fragments",
+                        }
+                    },
+                    {"$unwind": "$fragments"},
+                    {"$replaceRoot": {"newRoot": "$fragments"}},
+                    {"$sort": {"position": 1}},
+                    {"$group": {"_id": "$group", "fragments": {"$push": "$$ROOT"}}},
+                    {
+                        "$unset": [
+                            "fragments._id",
+                            "fragments.joinId",
+                            "fragments.group",
+                            "fragments.position",
+                        ]
+                    },
+                    {"$sort": {"_id": 1}},
+                    {"$group": {"_id": None, "fragments": {"$push": "$fragments"}}},
+                ],
+                "as": "joins",
+            }
+        },
+        {"$set": {"joins": {"$first": "$joins"}}},
+        {"$set": {"joins": "$joins.fragments"}},
+    ]
+
+
 def join_findspots() -> List[dict]:
     return [
         {
@@ -1,5 +1,5 @@
 import argparse
-from functools import reduce
+from functools import cache, reduce
 from multiprocessing import Pool
 from typing import List
 
@@ -14,9 +14,12 @@ from ebl.fragmentarium.application.transliteration_update_factory import (
     TransliterationUpdateFactory,
 )
 from ebl.fragmentarium.domain.fragment import Fragment
+from ebl.transliteration.domain.atf_parsers.lark_parser import (
+    ParsedLineCacheStatistics,
+    parsed_line_cache_statistics,
+)
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.lemmatization.domain.lemmatization import LemmatizationError
-from ebl.signs.infrastructure.memoizing_sign_repository import MemoizingSignRepository
 from ebl.transliteration.domain.transliteration_error import TransliterationError
 
 from ebl.users.domain.user import ApiUser
@@ -51,6 +54,8 @@ class State:
     invalid_fragment_query: int = 0
     updated: int = 0
     errors: List[str] = attr.ib(factory=list)
+    parsed_line_hits: int = 0
+    parsed_line_misses: int = 0
 
     def add_updated(self) -> None:
         self.updated += 1
@@ -63,6 +68,12 @@ class State:
         else:
             self._add_error(error, fragment)
 
+    def add_parsed_lines(
+        self, before: ParsedLineCacheStatistics, after: ParsedLineCacheStatistics
+    ) -> None:
+        self.parsed_line_hits += after.hits - before.hits
+        self.parsed_line_misses += after.misses - before.misses
+
     def add_querying_error(self, error: Exception, number: str) -> None:
         self.invalid_fragment_query += 1
         self.errors.append(f"{number}\t\t{error}")
@@ -87,6 +98,8 @@ class State:
         self.errors.append(f"{fragment.number}\t\t{error}")
 
     def to_tsv(self) -> str:
+        parsed_lines = self.parsed_line_hits + self.parsed_line_misses
+        hit_rate = self.parsed_line_hits / parsed_lines if parsed_lines else 0.0
         return "\n".join(
             [
                 *self.errors,
@@ -94,6 +107,7 @@ class State:
                 f"# Invalid ATF: {self.invalid_atf}",
                 f"# Invalid lemmas: {self.invalid_lemmas}",
                 f"# Invalid fragment querys: {self.invalid_fragment_query}",
+                f"# Parsed line cache hit rate: {hit_rate:.1%} of {parsed_lines}",
             ]
         )
 
@@ -104,6 +118,8 @@ class State:
             self.invalid_fragment_query + other.invalid_fragment_query,
             self.updated + other.updated,
             self.errors + other.errors,
+            self.parsed_line_hits + other.parsed_line_hits,
+            self.parsed_line_misses + other.parsed_line_misses,
         )
 
 
@@ -113,6 +129,7 @@ def update(number: MuseumNumber) -> State:
     transliteration_factory = context.get_transliteration_update_factory()
     updater = context.get_fragment_updater()
     state = State()
+    statistics = parsed_line_cache_statistics()
     try:
         fragment = fragment_repository.query_by_museum_number(number)
         try:
@@ -122,16 +139,14 @@ def update(number: MuseumNumber) -> State:
             state.add_error(error, fragment)
     except Exception as error:
         state.add_querying_error(error, str(number))
+    state.add_parsed_lines(statistics, parsed_line_cache_statistics())
 
     return state
 
 
+@cache
 def create_context_() -> Context:
-    context = create_context()
-    context = attr.evolve(
-        context, sign_repository=MemoizingSignRepository(context.sign_repository)
-    )
-    return context
+    return create_context()
 
 
 if __name__ == "__main__":
@@ -145,7 +160,7 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    numbers = find_transliterated(create_context_().fragment_repository)
+    numbers = find_transliterated(create_context().fragment_repository)
 
     with Pool(processes=args.workers) as pool:
         states = tqdm(pool.imap_unordered(update, numbers), total=len(numbers))
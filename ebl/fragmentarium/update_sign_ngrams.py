@@ -0,0 +1,12 @@
+from typing import cast
+
+from ebl.app import create_context
+from ebl.fragmentarium.infrastructure.mongo_fragment_repository import (
+    MongoFragmentRepository,
+)
+
+if __name__ == "__main__":
+    repository = cast(MongoFragmentRepository, create_context().fragment_repository)
+    repository.create_indexes()
+    count = repository.rebuild_sign_ngrams()
+    print(f"Indexed sign n-grams of {count} fragments.")
@@ -0,0 +1,11 @@
+from typing import cast
+
+from ebl.app import create_context
+from ebl.fragmentarium.infrastructure.mongo_fragment_repository import (
+    MongoFragmentRepository,
+)
+
+if __name__ == "__main__":
+    repository = cast(MongoFragmentRepository, create_context().fragment_repository)
+    count = repository.update_stored_atf()
+    print(f"Stored the ATF of {count} fragments.")
@@ -22,10 +22,12 @@ from ebl.fragmentarium.web.fragment_pager import make_fragment_pager_resource
 from ebl.fragmentarium.web.fragment_search import FragmentSearch
 from ebl.fragmentarium.web.fragments import (
     FragmentAuthorizedScopesResource,
+    FragmentsQueryCountResource,
     FragmentsQueryResource,
     FragmentsResource,
     FragmentsListResource,
     FragmentsRetrieveAllResource,
+    FragmentsExportResource,
 )
 from ebl.fragmentarium.web.fragment_signs_resources import (
     make_latest_additions_resource,
@@ -56,6 +58,7 @@ from ebl.fragmentarium.web.colophons import ColophonResource, ColophonNamesResou
 def create_fragmentarium_routes(api: falcon.App, context: Context):
     context.fragment_repository.create_indexes()
     context.annotations_repository.create_indexes()
+    context.cropped_sign_images_repository.create_indexes()
 
     provenance_service = context.provenance_service
     fragmentarium = Fragmentarium(context.fragment_repository)
@@ -96,13 +99,16 @@ def create_fragmentarium_routes(api: falcon.App, context: Context):
     fragments_retrieve_all = FragmentsRetrieveAllResource(
         context.fragment_repository, context.photo_repository, context.realia_repository
     )
+    fragments_export = FragmentsExportResource(
+        context.fragment_repository, context.realia_repository
+    )
     fragment_genre = FragmentGenreResource(updater, dto_factory)
     fragment_script = FragmentScriptResource(updater, dto_factory)
     fragment_date = FragmentDateResource(updater, dto_factory)
     fragment_dates_in_text = FragmentDatesInTextResource(updater, dto_factory)
 
     fragment_matcher = FragmentMatcherResource(
-        FragmentMatcher(context.fragment_repository)
+        FragmentMatcher(context.fragment_repository, context.line_to_vec_store)
     )
     fragment_search = FragmentSearch(
         fragmentarium,
@@ -113,6 +119,9 @@ def create_fragmentarium_routes(api: falcon.App, context: Context):
     fragment_query = FragmentsQueryResource(
         context.fragment_repository, context.get_transliteration_query_factory()
     )
+    fragment_query_count = FragmentsQueryCountResource(
+        context.fragment_repository, context.get_transliteration_query_factory()
+    )
     afo_register_fragments_query = AfoRegisterFragmentsQueryResource(
         context.fragment_repository, finder
     )
@@ -158,6 +167,7 @@ def create_fragmentarium_routes(api: falcon.App, context: Context):
     routes = [
         ("/fragments", fragment_search),
         ("/fragments/retrieve-all", fragments_retrieve_all),
+        ("/fragments/export", fragments_export),
         ("/fragments/{number}/match", fragment_matcher),
         ("/fragments/{number}/genres", fragment_genre),
         ("/fragments/{number}/script", fragment_script),
@@ -182,6 +192,7 @@ def create_fragmentarium_routes(api: falcon.App, context: Context):
         ("/fragments/{number}/pager/{folio_name}/{folio_number}", folio_pager),
         ("/folios/{name}/{number}", folios),
         ("/fragments/query", fragment_query),
+        ("/fragments/query-count", fragment_query_count),
         ("/fragments/query-by-traditional-references", afo_register_fragments_query),
         ("/fragments/latest", latest_additions_query),
         ("/fragments/all", all_fragments),
@@ -1,4 +1,6 @@
-from typing import List, cast
+import base64
+import json
+from typing import Iterator, List, Optional, cast
 
 import falcon
 from falcon import Request, Response
@@ -43,6 +45,19 @@ from ebl.transliteration.domain.text import Text
 from ebl.users.domain.user import User
 from ebl.users.web.require_scope import require_fragment_read_scope
 
+EXPORT_PAGE_SIZE = 1000
+
+
+def encode_resume_token(last_id: str) -> str:
+    return base64.urlsafe_b64encode(last_id.encode("utf-8")).decode("ascii")
+
+
+def decode_resume_token(token: str) -> str:
+    try:
+        return base64.urlsafe_b64decode(token.encode("ascii")).decode("utf-8")
+    except (ValueError, UnicodeError) as error:
+        raise DataError(f"Resume token '{token}' is not valid.") from error
+
 
 def _parse_fragment_query(parameters, *parsers):
     for parser in parsers:
@@ -86,7 +101,10 @@ class FragmentsRetrieveAllResource:
         # to improve performance we don't serialize the complete Fragment in fragment_repository
         # because we would have to deserialize it again here to return it to client
         for fragment in fragments:
-            fragment["atf"] = cast(Text, TextSchema().load(fragment["text"])).atf
+            fragment["atf"] = (
+                fragment.get("atf")
+                or cast(Text, TextSchema().load(fragment["text"])).atf
+            )
             dict.pop(fragment, "text")
             number = MuseumNumberSchema().load(fragment["museumNumber"])
             fragment["hasPhoto"] = self._photos.query_if_file_exists(f"{number}.jpg")
@@ -97,6 +115,48 @@ class FragmentsRetrieveAllResource:
         resp.media = {"totalCount": total_count, "fragments": fragments_}
 
 
+class FragmentsExportResource:
+    """Stream every transliterated fragment as NDJSON in `_id` order.
+
+    Each record carries a `resumeToken`; passing it back continues the export
+    after that fragment.
+    """
+
+    def __init__(
+        self,
+        repository: FragmentRepository,
+        realia_repository: RealiaRepository,
+        page_size: int = EXPORT_PAGE_SIZE,
+    ):
+        self._repo = repository
+        self._realia_repository = realia_repository
+        self._page_size = page_size
+
+    def on_get(self, req: Request, resp: Response):
+        token = req.params.get("resumeToken")
+        last_id = None if token is None else decode_resume_token(token)
+        resp.content_type = "application/x-ndjson"
+        resp.stream = self._export(last_id)
+
+    def _export(self, last_id: Optional[str]) -> Iterator[bytes]:
+        while True:
+            fragments = self._repo.retrieve_transliterated_fragments_after(
+                last_id, self._page_size
+            )
+            info_by_realia_id = resolve_realia_info_map(
+                fragments, self._realia_repository
+            )
+            for fragment in fragments:
+                last_id = fragment["_id"]
+                fragment["realiaInfo"] = RealiaInfoSchema(many=True).dump(
+                    document_realia_info(fragment, info_by_realia_id)
+                )
+                fragment["resumeToken"] = encode_resume_token(last_id)
+                yield (json.dumps(fragment, ensure_ascii=False) + "\n").encode("utf-8")
+            if len(fragments) < self._page_size:
+                return
+
+
 class FragmentsResource:
     def __init__(self, finder: FragmentFinder, dto_factory: FragmentDtoFactory):
         self._finder = finder
@@ -129,11 +189,11 @@ class FragmentsQueryResource:
         self._repository = repository
         self._transliteration_query_factory = transliteration_query_factory
 
-    def on_get(self, req: Request, resp: Response):
+    def _parse_query(self, req: Request) -> dict:
         parameters = {
             key: value for key, value in req.params.items() if key != "paginationIndex"
         }
-        query = _parse_fragment_query(
+        return _parse_fragment_query(
             parameters,
             parse_transliteration(self._transliteration_query_factory),
             parse_lemmas,
@@ -143,20 +203,33 @@ class FragmentsQueryResource:
             parse_integer_field("limit"),
             parse_non_negative_integer_field("offset"),
         )
+
+    def on_get(self, req: Request, resp: Response):
+        query = self._parse_query(req)
         schema = (
             FragmentQueryResultSchema(include_count_metadata=True)
             if "limit" in query
             else QueryResultSchema(include_count_metadata=True)
         )
 
-        resp.media = schema.dump(
-            self._repository.query(
-                query,
-                cast(User, req.context["user"]).get_scopes(
-                    prefix="read:", suffix="-fragments"
-                ),
+        resp.media = schema.dump(self._repository.query(query, _get_read_scopes(req)))
+
+
+class FragmentsQueryCountResource(FragmentsQueryResource):
+    """The exact total of a query, for clients showing an estimate first."""
+
+    def on_get(self, req: Request, resp: Response):
+        resp.media = {
+            "matchCountTotal": self._repository.query_match_count_total(
+                self._parse_query(req), _get_read_scopes(req)
             )
-        )
+        }
+
+
+def _get_read_scopes(req: Request) -> List[Scope]:
+    return cast(User, req.context["user"]).get_scopes(
+        prefix="read:", suffix="-fragments"
+    )
 
 
 class FragmentAuthorizedScopesResource:
@@ -1,6 +1,9 @@
 import argparse
-from typing import cast, Iterable
+from collections import defaultdict
+from multiprocessing import Pool
+from typing import Dict, List, Mapping, Optional, Sequence, cast
 from pymongo import MongoClient
+from pymongo.database import Database
 from gridfs import GridFS
 import os
 from PIL import Image
@@ -10,6 +13,11 @@ from tqdm import tqdm
 
 from ebl.fragmentarium.application.fragment_finder import ThumbnailSize
 
+PHOTOS = "photos"
+THUMBNAILS = "thumbnails"
+
+_database: Optional[Database] = None
+
 
 def resize(original: Image.Image, size: ThumbnailSize):
     width = size.value
@@ -20,6 +28,83 @@ def resize(original: Image.Image, size: ThumbnailSize):
     return resized
 
 
+def thumbnail_filename(filename: str, size: ThumbnailSize) -> str:
+    name, extension = os.path.splitext(filename)
+    return f"{name}_{size.value}{extension}"
+
+
+def create_thumbnail_images(data: bytes) -> Dict[ThumbnailSize, bytes]:
+    """Decode the original once and encode every size from it."""
+    original = Image.open(io.BytesIO(data))
+    original.draft(None, (max(size.value for size in ThumbnailSize), 1))
+    original.load()
+    thumbnails = {}
+    for size in ThumbnailSize:
+        with io.BytesIO() as stream:
+            resize(original, size).save(stream, format="jpeg")
+            thumbnails[size] = stream.getvalue()
+    return thumbnails
+
+
+def source_metadata(photo: Mapping) -> dict:
+    return {
+        "originalUploadDate": photo.get("uploadDate"),
+        "originalMd5": photo.get("md5"),
+    }
+
+
+def is_up_to_date(photo: Mapping, thumbnails: Sequence[Mapping]) -> bool:
+    metadata = source_metadata(photo)
+    return any(
+        {key: (thumbnail.get("metadata") or {}).get(key) for key in metadata}
+        == metadata
+        for thumbnail in thumbnails
+    )
+
+
+def find_outdated_photos(database: Database) -> List[str]:
+    thumbnails = defaultdict(list)
+    for thumbnail in database[f"{THUMBNAILS}.files"].find(
+        {}, projection=["filename", "metadata"]
+    ):
+        thumbnails[thumbnail["filename"]].append(thumbnail)
+    return [
+        photo["filename"]
+        for photo in database[f"{PHOTOS}.files"].find(
+            {}, projection=["filename", "uploadDate", "md5"]
+        )
+        if not all(
+            is_up_to_date(
+                photo, thumbnails[thumbnail_filename(photo["filename"], size)]
+            )
+            for size in ThumbnailSize
+        )
+    ]
+
+
+def update_thumbnails(database: Database, filename: str) -> None:
+    """Put the new thumbnails before deleting the old ones.
+
+    The previous thumbnails stay available until the new ones are stored.
+    """
+    photo = GridFS(database, PHOTOS).find_one({"filename": filename})
+    if photo is None:
+        return
+    thumbnails = GridFS(database, THUMBNAILS)
+    metadata = source_metadata(
+        {"uploadDate": photo.upload_date, "md5": getattr(photo, "md5", None)}
+    )
+    for size, data in create_thumbnail_images(photo.read()).items():
+        name = thumbnail_filename(filename, size)
+        new_id = thumbnails.put(
+            data, content_type="image/jpeg", filename=name, metadata=metadata
+        )
+        for old_thumbnail in thumbnails.find(
+            {"filename": name, "_id": {"$ne": new_id}}
+        ):
+            thumbnails.delete(old_thumbnail._id)
+
+
 def clear_thumbnails(collection) -> None:
     all_thumbnails = list(collection.find())
     for old_thumbnail in tqdm(
@@ -28,24 +113,35 @@ def clear_thumbnails(collection) -> None:
         collection.delete(old_thumbnail._id)
 
 
-def create_thumbnails(collection, originals: list, size: ThumbnailSize):
-    for item in tqdm(
-        originals,
-        desc=f"Creating {size.name.lower()} thumbnails",
-        total=len(originals),
-    ):
-        filename, extension = os.path.splitext(item.filename)
-        original = Image.open(item)
-        thumbnail = resize(original, size)
+def get_database() -> Database:
+    client = MongoClient(os.environ["MONGODB_URI"])
+    return client.get_database(os.environ["MONGODB_DB"])
 
-        with io.BytesIO() as stream:
-            thumbnail.save(stream, format="jpeg")
-            stream.seek(0)
-            collection.put(
-                stream,
-                content_type="image/jpeg",
-                filename=f"{filename}_{size.value}{extension}",
+
+def _initialize_worker() -> None:
+    global _database
+    _database = get_database()
+
+
+def _update_thumbnails(filename: str) -> Optional[str]:
+    try:
+        update_thumbnails(cast(Database, _database), filename)
+        return None
+    except Exception as error:
+        return f"{filename}: {error}"
+
+
+def create_thumbnails(filenames: Sequence[str], workers: int) -> List[str]:
+    with Pool(processes=workers, initializer=_initialize_worker) as pool:
+        return [
+            error
+            for error in tqdm(
+                pool.imap_unordered(_update_thumbnails, filenames),
+                desc="Creating thumbnails",
+                total=len(filenames),
             )
+            if error is not None
+        ]
 
 
 if __name__ == "__main__":
@@ -56,26 +152,28 @@ if __name__ == "__main__":
         )
     )
     parser.add_argument(
-        "command", default="update", nargs="?", choices=["update", "clear"]
+        "command",
+        default="update",
+        nargs="?",
+        choices=["update", "rebuild", "clear"],
+        help="update only creates thumbnails for new or changed photos",
     )
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count())
     args = parser.parse_args()
 
-    client = MongoClient(os.environ["MONGODB_URI"])
-    database = client.get_database(os.environ["MONGODB_DB"])
-
-    original_photos_collection = GridFS(database, "photos")
-    originals = list(cast(Iterable, original_photos_collection.find()))
-
-    thumbnail_collection = GridFS(database, "thumbnails")
+    database = get_database()
 
-    if args.command == "update":
-        clear_thumbnails(thumbnail_collection)
-
-        print("Generating thumbnails...")
-        for size in ThumbnailSize:
-            create_thumbnails(thumbnail_collection, originals, size)
-        print("Done.")
-
-    elif args.command == "clear":
-        clear_thumbnails(thumbnail_collection)
+    if args.command == "clear":
+        clear_thumbnails(GridFS(database, THUMBNAILS))
         print("Done.")
+    else:
+        filenames = (
+            find_outdated_photos(database)
+            if args.command == "update"
+            else database[f"{PHOTOS}.files"].distinct("filename")
+        )
+        print(f"Generating thumbnails for {len(filenames)} photos...")
+        errors = create_thumbnails(filenames, args.workers)
+        for error in errors:
+            print(error)
+        print(f"Done. {len(errors)} errors.")
@@ -0,0 +1,122 @@
+from collections import Counter
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+from pymongo import ASCENDING, DESCENDING, UpdateOne
+from pymongo.database import Database
+
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
+
+LEMMA_STATISTICS_COLLECTION = "lemma_statistics"
+LEMMA_STATISTICS_VERSION = "lemmaStatistics"
+
+FRAGMENT_TOKENS_PROJECTION = {
+    f"text.lines.content.{field}": True
+    for field in ("cleanValue", "normalized", "uniqueLemma")
+}
+CHAPTER_TOKENS_PROJECTION = {
+    f"lines.variants.{path}.{field}": True
+    for path in ("reconstruction", "manuscripts.line.content")
+    for field in ("cleanValue", "normalized", "uniqueLemma")
+}
+
+Key = Tuple[str, Optional[bool], Tuple[str, ...]]
+
+
+def fragment_tokens(fragment: Optional[dict]) -> Iterator[dict]:
+    for line in ((fragment or {}).get("text") or {}).get("lines", []):
+        yield from line.get("content") or []
+
+
+def chapter_tokens(chapter: Optional[dict]) -> Iterator[dict]:
+    for line in (chapter or {}).get("lines", []):
+        for variant in line.get("variants", []):
+            yield from variant.get("reconstruction") or []
+            for manuscript in variant.get("manuscripts", []):
+                yield from (manuscript.get("line") or {}).get("content") or []
+
+
+def count_lemmas(tokens: Iterable[dict]) -> Counter:
+    return Counter(
+        (token["cleanValue"], token.get("normalized"), tuple(token["uniqueLemma"]))
+        for token in tokens
+        if token.get("uniqueLemma") and "cleanValue" in token
+    )
+
+
+def key_query(key: Key) -> dict:
+    clean_value, normalized, unique_lemma = key
+    return {
+        "cleanValue": clean_value,
+        "normalized": normalized,
+        "uniqueLemma": list(unique_lemma),
+    }
+
+
+class MongoLemmaStatistics:
+    def __init__(self, database: Database) -> None:
+        self._collection = database[LEMMA_STATISTICS_COLLECTION]
+        self._versions = MongoVersionRepository(database)
+
+    def create_indexes(self) -> None:
+        self._collection.create_index(
+            [
+                ("cleanValue", ASCENDING),
+                ("normalized", ASCENDING),
+                ("count", DESCENDING),
+            ]
+        )
+
+    def is_built(self) -> bool:
+        return bool(self._versions.get(LEMMA_STATISTICS_VERSION))
+
+    def update(self, old_tokens: Iterable[dict], new_tokens: Iterable[dict]) -> None:
+        difference = count_lemmas(new_tokens)
+        difference.subtract(count_lemmas(old_tokens))
+        changes = {key: delta for key, delta in difference.items() if delta}
+        if changes:
+            self._collection.bulk_write(
+                [
+                    UpdateOne(key_query(key), {"$inc": {"count": delta}}, upsert=True)
+                    for key, delta in changes.items()
+                ],
+                ordered=False,
+            )
+            removed = [key for key, delta in changes.items() if delta < 0]
+            if removed:
+                self._collection.delete_many(
+                    {
+                        "$or": [key_query(key) for key in removed],
+                        "count": {"$lte": 0},
+                    }
+                )
+
+    def rebuild(self, tokens: Iterable[dict]) -> int:
+        counts = count_lemmas(tokens)
+        self._collection.delete_many({})
+        if counts:
+            self._collection.insert_many(
+                [{**key_query(key), "count": count} for key, count in counts.items()]
+            )
+        self._versions.increment(LEMMA_STATISTICS_VERSION)
+        return len(counts)
+
+    def query(self, clean_value: str, is_normalized: bool) -> Sequence[Sequence[str]]:
+        return [
+            document["uniqueLemma"]
+            for document in self._collection.find(
+                {"cleanValue": clean_value, "normalized": is_normalized}
+            ).sort([("count", DESCENDING), ("uniqueLemma", ASCENDING)])
+        ]
+
+    def find_most_common(self, clean_values: Sequence[str]) -> Dict[str, Sequence[str]]:
+        counts: Counter = Counter()
+        for document in self._collection.find(
+            {"cleanValue": {"$in": list(clean_values)}}
+        ):
+            counts[(document["cleanValue"], tuple(document["uniqueLemma"]))] += (
+                document["count"]
+            )
+        most_common: Dict[str, Sequence[str]] = {}
+        for (clean_value, unique_lemma), _ in counts.most_common():
+            most_common.setdefault(clean_value, list(unique_lemma))
+        return most_common
@@ -1,9 +1,18 @@
+from itertools import chain
 from typing import List, Sequence
 
 from ebl.dictionary.domain.word import WordId
 from ebl.lemmatization.application.suggestion_finder import LemmaRepository
 from ebl.lemmatization.domain.lemmatization import Lemma
+from ebl.lemmatization.infrastrcuture.lemma_statistics import (
+    CHAPTER_TOKENS_PROJECTION,
+    FRAGMENT_TOKENS_PROJECTION,
+    MongoLemmaStatistics,
+    chapter_tokens,
+    fragment_tokens,
+)
 from ebl.mongo_collection import MongoCollection
+from ebl.transliteration.infrastructure.collections import CHAPTERS_COLLECTION
 
 COLLECTION = "fragments"
 
@@ -65,10 +74,38 @@ def aggregate_lemmas(word: str, is_normalized: bool) -> List[dict]:
 class MongoLemmaRepository(LemmaRepository):
     def __init__(self, database):
         self._collection = MongoCollection(database, COLLECTION)
+        self._chapters = MongoCollection(database, CHAPTERS_COLLECTION)
+        self._statistics = MongoLemmaStatistics(database)
 
     def query_lemmas(self, word: str, is_normalized: bool) -> Sequence[Lemma]:
+        if self._statistics.is_built():
+            return [
+                [WordId(unique_lemma) for unique_lemma in result]
+                for result in self._statistics.query(word, is_normalized)
+            ]
         cursor = self._collection.aggregate(aggregate_lemmas(word, is_normalized))
         return [
             [WordId(unique_lemma) for unique_lemma in result["_id"]]
             for result in cursor
         ]
+
+    def rebuild_statistics(self) -> int:
+        self._statistics.create_indexes()
+        return self._statistics.rebuild(
+            chain(
+                (
+                    token
+                    for fragment in self._collection.find_many(
+                        {}, projection=FRAGMENT_TOKENS_PROJECTION
+                    )
+                    for token in fragment_tokens(fragment)
+                ),
+                (
+                    token
+                    for chapter in self._chapters.find_many(
+                        {}, projection=CHAPTER_TOKENS_PROJECTION
+                    )
+                    for token in chapter_tokens(chapter)
+                ),
+            )
+        )
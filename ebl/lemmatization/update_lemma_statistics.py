@@ -0,0 +1,11 @@
+from typing import cast
+
+from ebl.app import create_context
+from ebl.lemmatization.infrastrcuture.mongo_suggestions_finder import (
+    MongoLemmaRepository,
+)
+
+if __name__ == "__main__":
+    repository = cast(MongoLemmaRepository, create_context().lemma_repository)
+    count = repository.rebuild_statistics()
+    print(f"Counted {count} lemmatizations.")
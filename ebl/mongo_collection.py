@@ -102,6 +102,9 @@ class MongoCollection:
     def count_documents(self, query) -> int:
         return self.__get_collection().count_documents(query)
 
+    def estimated_document_count(self) -> int:
+        return self.__get_collection().estimated_document_count()
+
     def create_index(self, index, **kwargs):
         return self.__get_collection().create_index(index, **kwargs)
 
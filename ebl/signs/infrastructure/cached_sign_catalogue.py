@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import attr
+
+from ebl.errors import NotFoundError
+from ebl.transliteration.application.sign_repository import SignRepository
+from ebl.transliteration.domain.sign import Sign, SignName
+
+DEFAULT_REFRESH_INTERVAL: float = 60
+DEFAULT_MAX_AGE: float = 60 * 60
+
+
+def _add(index: Dict, key, name: SignName) -> None:
+    names = index.setdefault(key, [])
+    if name not in names:
+        names.append(name)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class SignIndex:
+    signs: Dict[SignName, Sign] = attr.ib(factory=dict)
+    values: Dict[Tuple[str, Optional[int]], List[SignName]] = attr.ib(factory=dict)
+    lists: Dict[Tuple[str, str], List[SignName]] = attr.ib(factory=dict)
+    logograms: Dict[str, List[SignName]] = attr.ib(factory=dict)
+
+    @staticmethod
+    def of(signs: Iterable[Sign]) -> "SignIndex":
+        index = SignIndex()
+        for sign in signs:
+            index.signs[sign.name] = sign
+            for value in sign.values:
+                _add(index.values, (value.value, value.sub_index), sign.name)
+            for record in sign.lists:
+                _add(index.lists, (record.name, record.number), sign.name)
+            for logogram in sign.logograms:
+                for word_id in logogram.word_id:
+                    _add(index.logograms, word_id, sign.name)
+        return index
+
+    def find_all(self, names: Sequence[SignName]) -> Sequence[Sign]:
+        return [self.signs[name] for name in names]
+
+
+class CachedSignCatalogue(SignRepository):
+    """Signs indexed in memory.
+
+    The index is reloaded when the signs version changes and, because sign
+    imports and restores do not change the version, after max_age seconds.
+    """
+
+    def __init__(
+        self,
+        delegate: SignRepository,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        self._delegate = delegate
+        self._refresh_interval = refresh_interval
+        self._max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._index: Optional[SignIndex] = None
+        self._version = 0
+        self._checked_at = 0.0
+        self._loaded_at = 0.0
+
+    @property
+    def index(self) -> SignIndex:
+        now = self._clock()
+        index = self._index
+        if index is not None and now - self._checked_at < self._refresh_interval:
+            return index
+
+        with self._lock:
+            version = self._delegate.query_version()
+            if (
+                self._index is None
+                or version != self._version
+                or now - self._loaded_at >= self._max_age
+            ):
+                self._index = SignIndex.of(self._delegate.find_many({}))
+                self._version = version
+                self._loaded_at = now
+            self._checked_at = now
+            return self._index
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._index = None
+
+    def create(self, sign: Sign) -> str:
+        name = self._delegate.create(sign)
+        self.refresh()
+        return name
+
+    def find(self, name: SignName) -> Sign:
+        try:
+            return self.index.signs[name]
+        except KeyError as error:
+            raise NotFoundError(f"Sign {name} not found.") from error
+
+    def find_many(self, query, *args, **kwargs) -> Sequence[Sign]:
+        return self._delegate.find_many(query, *args, **kwargs)
+
+    def search(self, reading: str, sub_index: Optional[int] = None) -> Optional[Sign]:
+        index = self.index
+        names = index.values.get((reading, sub_index))
+        return index.signs[names[0]] if names else None
+
+    def search_all(self, reading: str, sub_index: int) -> Sequence[Sign]:
+        index = self.index
+        return index.find_all(index.values.get((reading, sub_index), []))
+
+    def search_by_lists_name(self, name: str, number: str) -> Sequence[Sign]:
+        index = self.index
+        return index.find_all(index.lists.get((name, number), []))
+
+    def search_by_lemma(self, word_id: str) -> Sequence[Sign]:
+        index = self.index
+        return index.find_all(index.logograms.get(word_id, []))
+
+    def search_by_id(self, query: str) -> Sequence[Sign]:
+        return self._delegate.search_by_id(query)
+
+    def search_include_homophones(self, reading: str) -> Sequence[Sign]:
+        return self._delegate.search_include_homophones(reading)
+
+    def search_composite_signs(
+        self, reading: str, sub_index: Optional[int] = None
+    ) -> Sequence[Sign]:
+        return self._delegate.search_composite_signs(reading, sub_index)
+
+    def list_all_signs(self) -> Sequence[str]:
+        return self._delegate.list_all_signs()
+
+    def query_version(self) -> int:
+        return self._delegate.query_version()
@@ -21,6 +21,7 @@ class MemoizingSignRepository(SignRepository):
         self._search_by_lists_name = pydash.memoize(delegate.search_by_lists_name)
         self._search_by_lemma = pydash.memoize(delegate.search_by_lemma)
         self._list_all_signs = pydash.memoize(delegate.list_all_signs)
+        self._query_version = delegate.query_version
 
     def create(self, sign: Sign) -> str:
         return self._create(sign)
@@ -56,3 +57,6 @@ class MemoizingSignRepository(SignRepository):
 
     def list_all_signs(self) -> Sequence[str]:
         return self._list_all_signs()
+
+    def query_version(self) -> int:
+        return self._query_version()
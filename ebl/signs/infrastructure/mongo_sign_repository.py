@@ -3,6 +3,7 @@ from typing import List, Optional, Tuple, cast, Sequence, Dict, Iterable
 
 from marshmallow import EXCLUDE, Schema, fields, post_dump, post_load
 from pymongo.database import Database
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
 from ebl.transliteration.domain.enclosure_tokens import Determinative
 from ebl.errors import NotFoundError
 from ebl.mongo_collection import MongoCollection
@@ -20,6 +21,7 @@ from ebl.transliteration.application.museum_number_schema import MuseumNumberSch
 from ebl.transliteration.domain.atf_parsers.lark_parser import parse_atf_lark
 
 COLLECTION = "signs"
+SIGNS_VERSION = "signs"
 
 
 class SignListRecordSchema(Schema):
@@ -159,9 +161,15 @@ class SignDtoSchema(SignSchema):
 class MongoSignRepository(SignRepository):
     def __init__(self, database: Database):
         self._collection = MongoCollection(database, COLLECTION)
+        self._versions = MongoVersionRepository(database)
 
     def create(self, sign: Sign) -> str:
-        return self._collection.insert_one(SignSchema().dump(sign))
+        id_ = self._collection.insert_one(SignSchema().dump(sign))
+        self._versions.increment(SIGNS_VERSION)
+        return id_
+
+    def query_version(self) -> int:
+        return self._versions.get(SIGNS_VERSION)
 
     def find_many(self, query, *args, **kwargs) -> Sequence[Sign]:
         data = self._collection.find_many(query, *args, **kwargs)
@@ -385,19 +393,59 @@ class MongoSignRepository(SignRepository):
         )
 
     def _find_unicode(
-        self, values_indexes: Iterable[Tuple[str, int]]
-    ) -> Iterable[Dict[str, List[int]]]:
-        for value, sub_index in values_indexes:
-            if value == "whitespace":
-                yield {"unicode": [9999]}
-            else:
-                query = {
-                    "values": {"$elemMatch": {"value": value, "subIndex": sub_index}}
-                }
-                yield from self._collection.find_many(query, {"_id": 0, "unicode": 1})
+        self, values_indexes: Iterable[Tuple[str, Optional[int]]]
+    ) -> Dict[Tuple[str, Optional[int]], List[Dict[str, List[int]]]]:
+        pairs = {
+            value_index
+            for value_index in values_indexes
+            if value_index[0] != "whitespace"
+        }
+        unicode: Dict[Tuple[str, Optional[int]], List[Dict[str, List[int]]]] = {
+            value_index: [] for value_index in pairs
+        }
+        if pairs:
+            cursor = self._collection.find_many(
+                {
+                    "$or": [
+                        {"values": {"$elemMatch": {"value": value, "subIndex": index}}}
+                        for value, index in pairs
+                    ]
+                },
+                {"_id": 0, "unicode": 1, "values.value": 1, "values.subIndex": 1},
+            )
+            for sign in cursor:
+                for value_index in {
+                    (value["value"], value.get("subIndex")) for value in sign["values"]
+                } & pairs:
+                    unicode[value_index].append(
+                        {"unicode": sign["unicode"]} if "unicode" in sign else {}
+                    )
+        return unicode
 
     def get_unicode_from_atf(self, line: str) -> List[Dict[str, List[int]]]:
-        text = parse_atf_lark(f"1. {line}")
-        values_indexes = self._extract_words_subIndexes(text)
-        line_query_result = list(self._find_unicode(values_indexes))
-        return line_query_result[:-1]
+        return self.get_unicode_from_atf_lines([line])[0]
+
+    def get_unicode_from_atf_lines(
+        self, lines: Sequence[str]
+    ) -> List[List[Dict[str, List[int]]]]:
+        lines_values_indexes = [
+            list(self._extract_words_subIndexes(parse_atf_lark(f"1. {line}")))
+            for line in lines
+        ]
+        unicode = self._find_unicode(
+            value_index
+            for values_indexes in lines_values_indexes
+            for value_index in values_indexes
+        )
+        return [
+            [
+                result
+                for value_index in values_indexes
+                for result in (
+                    [{"unicode": [9999]}]
+                    if value_index[0] == "whitespace"
+                    else unicode[value_index]
+                )
+            ][:-1]
+            for values_indexes in lines_values_indexes
+        ]
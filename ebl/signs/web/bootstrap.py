@@ -10,10 +10,12 @@ from ebl.signs.web.signs import (
     SignsListResource,
     SignsOrderResource,
     TransliterationResource,
+    TransliterationLinesResource,
 )
 from ebl.signs.web.cropped_annotations import (
     CroppedAnnotationsResource,
     ClusterCroppedAnnotationsResource,
+    CroppedSignImageResource,
 )
 
 
@@ -30,15 +32,21 @@ def create_signs_routes(api: falcon.App, context: Context):
 
     signs_images = CroppedAnnotationsResource(cropped_service)
     cluster_images = ClusterCroppedAnnotationsResource(cropped_service)
+    cropped_sign_image = CroppedSignImageResource(
+        context.cropped_sign_images_repository
+    )
 
     atf_parser = TransliterationResource(context.sign_repository)
+    atf_lines_parser = TransliterationLinesResource(context.sign_repository)
     signs_all = SignsListResource(context.sign_repository)
 
     api.add_route("/signs", signs_search)
     api.add_route("/signs/{sign_name}", signs)
     api.add_route("/signs/{sign_name}/images", signs_images)
     api.add_route("/signs/{sign_name}/images/cluster/{cluster_id}", cluster_images)
+    api.add_route("/cropped-sign-images/{image_id}", cropped_sign_image)
 
     api.add_route("/signs/all", signs_all)
     api.add_route("/signs/{sign_name}/{sort_era}", ordered_signs)
+    api.add_route("/signs/transliteration", atf_lines_parser)
     api.add_route("/signs/transliteration/{line}", atf_parser)
@@ -1,10 +1,14 @@
 import falcon
 from falcon import Request, Response
 
+from ebl.cache.application.cache import DAILY_TIMEOUT, cache_control
 from ebl.common.domain.period import Period
 from ebl.fragmentarium.application.cropped_annotations_service import (
     CroppedAnnotationService,
 )
+from ebl.fragmentarium.application.cropped_sign_images_repository import (
+    CroppedSignImagesRepository,
+)
 
 ABBREV_TO_NAME = {period.value[1]: period.value[0] for period in Period}
 
@@ -51,3 +55,16 @@ class ClusterCroppedAnnotationsResource:
             script_filter=script_filter,
         )
         resp.media = cropped_signs
+
+
+class CroppedSignImageResource:
+    def __init__(self, cropped_sign_images_repository: CroppedSignImagesRepository):
+        self._cropped_sign_images_repository = cropped_sign_images_repository
+
+    @cache_control(["public", f"max-age={DAILY_TIMEOUT}"])
+    def on_get(self, req: Request, resp: Response, image_id: str):
+        image = self._cropped_sign_images_repository.query_by_id(image_id)
+        resp.content_type = "image/png"
+        resp.data = image.image
+        if image.content_hash:
+            resp.etag = image.content_hash
@@ -1,6 +1,8 @@
 import base64
 import attr
 from cairosvg import svg2png
+from marshmallow import Schema, fields
+from ebl.marshmallowschema import validate
 from ebl.signs.infrastructure.mongo_sign_repository import SignDtoSchema
 from ebl.transliteration.application.sign_repository import SignRepository
 
@@ -51,3 +53,16 @@ class TransliterationResource:
 
     def on_get(self, req, resp, line):
         resp.media = self.sign_repository.get_unicode_from_atf(line)
+
+
+class TransliterationLinesSchema(Schema):
+    lines = fields.List(fields.String(), required=True)
+
+
+class TransliterationLinesResource:
+    def __init__(self, signs: SignRepository):
+        self.sign_repository = signs
+
+    @validate(TransliterationLinesSchema())
+    def on_post(self, req, resp):
+        resp.media = self.sign_repository.get_unicode_from_atf_lines(req.media["lines"])
@@ -1,17 +1,21 @@
 from alignment.vocabulary import Vocabulary
 from hamcrest import assert_that, has_properties, contains_exactly
+import pytest
 
 from ebl.alignment.application.align import align, align_pair
 from ebl.alignment.domain.sequence import NamedSequence
 from ebl.alignment.domain.scoring import match
 
 
-def test_align_pair() -> None:
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_align_pair(vectorized) -> None:
+    if vectorized:
+        pytest.importorskip("numpy")
     vocabulary = Vocabulary()
     sequence_1 = NamedSequence.of_signs("name1", "ABZ001", vocabulary)
     sequence_2 = NamedSequence.of_signs("name2", "ABZ001", vocabulary)
 
-    result = align_pair(sequence_1, sequence_2, vocabulary)
+    result = align_pair(sequence_1, sequence_2, vocabulary, vectorized)
 
     assert result.score == match
     assert result.a == sequence_1
@@ -19,13 +23,18 @@ def test_align_pair() -> None:
     assert len(result.alignments) == 1
 
 
-def test_align() -> None:
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_align(vectorized) -> None:
+    if vectorized:
+        pytest.importorskip("numpy")
     vocabulary = Vocabulary()
     sequence_1 = NamedSequence.of_signs("name1", "ABZ001", vocabulary)
     sequence_2 = NamedSequence.of_signs("name2", "ABZ001", vocabulary)
     sequence_3 = NamedSequence.of_signs("name3", "ABZ002", vocabulary)
 
-    result = align([(sequence_1, sequence_3), (sequence_1, sequence_2)], vocabulary)
+    result = align(
+        [(sequence_1, sequence_3), (sequence_1, sequence_2)], vocabulary, vectorized
+    )
 
     assert_that(
         result,
@@ -0,0 +1,163 @@
+import csv
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import ebl.alignment.align_fragmentarium as align_fragmentarium
+from ebl.alignment.align_fragmentarium import (
+    FIELDNAMES,
+    ChapterSigns,
+    chunk,
+    create_kmer_index,
+    read_checkpoint,
+    remove_unfinished_rows,
+    run,
+    shortlist_chapters,
+)
+from ebl.alignment.domain.sequence import make_sequence
+from ebl.tests.factories.corpus import ChapterFactory, TextFactory
+from ebl.tests.factories.fragment import FragmentFactory
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+FIRST = MuseumNumber("X", "1")
+SECOND = MuseumNumber("X", "2")
+THIRD = MuseumNumber("X", "3")
+
+
+def row(number: MuseumNumber) -> dict:
+    return {"fragment": str(number), "manuscript": "A", "score": 100}
+
+
+def read_rows(path) -> list:
+    with open(path, encoding="utf-8", newline="") as file:
+        return [
+            {key: value for key, value in row.items() if value}
+            for row in csv.DictReader(file)
+        ]
+
+
+def write_rows(path, rows) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def fake_align_chunk(numbers):
+    return numbers, [row(number) for number in numbers], 0.0
+
+
+def test_shortlist_chapters():
+    text = TextFactory.build()
+    chapter = ChapterFactory.build()
+    chapters = [
+        ChapterSigns(
+            text,
+            chapter,
+            [
+                ("A", make_sequence("ABZ001 ABZ002 ABZ003 ABZ004")),
+                ("B", make_sequence("ABZ005 ABZ006 ABZ007")),
+                ("C", make_sequence("ABZ002 ABZ003 ABZ004\nABZ008")),
+            ],
+        ),
+        ChapterSigns(text, chapter, [("D", make_sequence("ABZ009 ABZ010 ABZ011"))]),
+    ]
+    fragment = FragmentFactory.build(signs="ABZ002 ABZ003 ABZ004")
+
+    assert shortlist_chapters(fragment, chapters, create_kmer_index(chapters), 1) == [
+        ChapterSigns(
+            text,
+            chapter,
+            [
+                ("A", make_sequence("ABZ001 ABZ002 ABZ003 ABZ004")),
+                ("C", make_sequence("ABZ002 ABZ003 ABZ004\nABZ008")),
+            ],
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [
+        (2, [[FIRST, SECOND], [THIRD]]),
+        (3, [[FIRST, SECOND, THIRD]]),
+        (5, [[FIRST, SECOND, THIRD]]),
+    ],
+)
+def test_chunk(size, expected):
+    assert list(chunk([FIRST, SECOND, THIRD], size)) == expected
+
+
+def test_read_checkpoint(tmp_path):
+    path = tmp_path / "alignment.csv.done"
+    path.write_text("X.1\n\nX.2\nX.", encoding="utf-8")
+
+    assert read_checkpoint(str(path)) == {"X.1", "X.2", "X."}
+
+
+def test_read_checkpoint_missing(tmp_path):
+    assert read_checkpoint(str(tmp_path / "missing")) == set()
+
+
+def test_remove_unfinished_rows(tmp_path):
+    path = tmp_path / "alignment.csv"
+    write_rows(path, [row(FIRST), row(SECOND), row(FIRST)])
+
+    remove_unfinished_rows(str(path), {"X.1"})
+
+    assert read_rows(path) == [
+        {"fragment": "X.1", "manuscript": "A", "score": "100"},
+        {"fragment": "X.1", "manuscript": "A", "score": "100"},
+    ]
+
+
+def test_run(tmp_path, monkeypatch):
+    monkeypatch.setattr(align_fragmentarium, "align_chunk", fake_align_chunk)
+    output = tmp_path / "alignment.csv"
+    checkpoint = tmp_path / "alignment.csv.done"
+
+    with ThreadPoolExecutor() as executor:
+        run(
+            executor,
+            chunk([FIRST, SECOND, THIRD], 2),
+            3,
+            str(output),
+            str(checkpoint),
+            False,
+        )
+
+    assert sorted(row["fragment"] for row in read_rows(output)) == [
+        "X.1",
+        "X.2",
+        "X.3",
+    ]
+    assert read_checkpoint(str(checkpoint)) == {"X.1", "X.2", "X.3"}
+
+
+def test_run_resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(align_fragmentarium, "align_chunk", fake_align_chunk)
+    output = tmp_path / "alignment.csv"
+    checkpoint = tmp_path / "alignment.csv.done"
+    write_rows(output, [row(FIRST), row(SECOND)])
+    checkpoint.write_text("X.1\n", encoding="utf-8")
+    done = read_checkpoint(str(checkpoint))
+
+    with ThreadPoolExecutor() as executor:
+        run(
+            executor,
+            chunk(
+                [
+                    number
+                    for number in [FIRST, SECOND, THIRD]
+                    if str(number) not in done
+                ],
+                2,
+            ),
+            2,
+            str(output),
+            str(checkpoint),
+            True,
+        )
+
+    assert [row["fragment"] for row in read_rows(output)] == ["X.1", "X.2", "X.3"]
+    assert read_checkpoint(str(checkpoint)) == {"X.1", "X.2", "X.3"}
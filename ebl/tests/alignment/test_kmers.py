@@ -0,0 +1,35 @@
+from ebl.alignment.domain.kmers import KmerIndex, create_kmers
+
+
+def test_create_kmers() -> None:
+    assert create_kmers(["ABZ001", "#", "ABZ002", "ABZ003", "ABZ004"], 3) == {
+        ("ABZ001", "ABZ002", "ABZ003"),
+        ("ABZ002", "ABZ003", "ABZ004"),
+    }
+
+
+def test_create_kmers_with_variants() -> None:
+    assert create_kmers(["ABZ001", "ABZ002/ABZ003"], 2) == {
+        ("ABZ001", "ABZ002"),
+        ("ABZ001", "ABZ003"),
+    }
+
+
+def test_create_kmers_too_short() -> None:
+    assert create_kmers(["ABZ001", "ABZ002"], 3) == frozenset()
+
+
+def test_shortlist() -> None:
+    index = KmerIndex.of(
+        [
+            ("first", ["ABZ001", "ABZ002", "ABZ003", "ABZ004"]),
+            ("second", ["ABZ002", "ABZ003", "ABZ004", "ABZ005"]),
+            ("third", ["ABZ006", "ABZ007", "ABZ008"]),
+        ],
+        2,
+    )
+    signs = ["ABZ001", "ABZ002", "ABZ003", "ABZ004"]
+
+    assert index.count_shared(signs) == {"first": 3, "second": 2}
+    assert index.shortlist(signs) == {"first", "second"}
+    assert index.shortlist(signs, 3) == {"first"}
@@ -1,7 +1,23 @@
+from random import Random
+
+from alignment.sequence import Sequence
+from alignment.sequencealigner import GlobalSequenceAligner
 from alignment.vocabulary import Vocabulary
 import pytest
 
-from ebl.alignment.domain.scoring import EblScoring
+from ebl.alignment.domain.sequence import UNCLEAR_OR_UNKNOWN_SIGN
+from ebl.alignment.domain.scoring import (
+    EblScoring,
+    break_match,
+    break_mismatch,
+    common_mismatch,
+    is_curated,
+    is_variant,
+    match,
+    mismatch,
+    x_match,
+    x_mismatch,
+)
 
 
 @pytest.mark.parametrize(
@@ -36,3 +52,78 @@ def test_gap_start() -> None:
 def test_gap_xtension(element, expected) -> None:
     vocabulary = Vocabulary()
     assert EblScoring(vocabulary).gapExtension(vocabulary.encode(element)) == expected
+
+
+class ReferenceScoring(EblScoring):
+    def __init__(self, vocabulary: Vocabulary):
+        super().__init__(vocabulary)
+        self.x = vocabulary.encode(UNCLEAR_OR_UNKNOWN_SIGN)
+
+    def __call__(self, firstElement, secondElement) -> int:
+        first = self.vocabulary.decode(firstElement)
+        second = self.vocabulary.decode(secondElement)
+        if firstElement == self.line_break or secondElement == self.line_break:
+            return break_match if firstElement == secondElement else break_mismatch
+        if firstElement == self.x or secondElement == self.x:
+            return x_match if firstElement == secondElement else x_mismatch
+        if is_curated(first, second):
+            return common_mismatch
+        if is_variant(first, second):
+            return max(
+                self(
+                    self.vocabulary.encode(first_part),
+                    self.vocabulary.encode(second_part),
+                )
+                for first_part in first.split("/")
+                for second_part in second.split("/")
+            )
+        return match if firstElement == secondElement else mismatch
+
+
+SIGNS = [
+    "ABZ001",
+    "ABZ002",
+    "ABZ545",
+    "ABZ354",
+    "ABZ597",
+    "#",
+    "X",
+    "ABZ001/ABZ545",
+    "ABZ003/ABZ597",
+    "ABZ002/#",
+]
+
+
+def test_scoring_parity() -> None:
+    vocabulary = Vocabulary()
+    elements = [vocabulary.encode(sign) for sign in SIGNS]
+    scoring = EblScoring(vocabulary)
+    reference = ReferenceScoring(vocabulary)
+
+    for _ in range(2):
+        for first in elements:
+            for second in elements:
+                assert scoring(first, second) == reference(first, second)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_alignment_parity(seed) -> None:
+    random = Random(seed)
+    vocabulary = Vocabulary()
+    first, second = (
+        vocabulary.encodeSequence(
+            Sequence(random.choices(SIGNS, k=random.randint(1, 30)))
+        )
+        for _ in range(2)
+    )
+
+    def align(scoring):
+        score, alignments = GlobalSequenceAligner(scoring, True).align(
+            first, second, backtrace=True
+        )
+        return score, [
+            (alignment.score, str(vocabulary.decodeSequenceAlignment(alignment)))
+            for alignment in alignments
+        ]
+
+    assert align(EblScoring(vocabulary)) == align(ReferenceScoring(vocabulary))
@@ -0,0 +1,176 @@
+from random import Random
+
+from alignment.sequence import Sequence
+from alignment.sequencealigner import GlobalSequenceAligner
+from alignment.vocabulary import Vocabulary
+import pytest
+
+from ebl.alignment.domain.scoring import EblScoring, gap_extension, gap_start, match
+from ebl.alignment.domain.sequence import make_sequence
+
+pytest.importorskip("numpy")
+
+from ebl.alignment.domain.vectorized_aligner import (  # noqa: E402
+    VectorizedAligner,
+    substitution_table,
+)
+
+SIGNS = [
+    "ABZ001",
+    "ABZ002",
+    "ABZ545",
+    "ABZ354",
+    "ABZ597",
+    "#",
+    "X",
+    "ABZ001/ABZ545",
+    "ABZ003/ABZ597",
+    "ABZ002/#",
+]
+
+
+def encode(vocabulary: Vocabulary, signs: str):
+    return vocabulary.encodeSequence(make_sequence(signs))
+
+
+def random_pair(vocabulary: Vocabulary, seed: int):
+    random = Random(seed)
+    return tuple(
+        vocabulary.encodeSequence(
+            Sequence(random.choices(SIGNS, k=random.randint(1, 30)))
+        )
+        for _ in range(2)
+    )
+
+
+def reference_score(scoring: EblScoring, first: list, second: list) -> int:
+    """Cell by cell affine gap alignment with free end gaps."""
+    m, n = len(first), len(second)
+    minimum = -(10**9)
+    best = [[0] * (n + 1) for _ in range(m + 1)]
+    gap_in_first = [[minimum] * (n + 1) for _ in range(m + 1)]
+    gap_in_second = [[minimum] * (n + 1) for _ in range(m + 1)]
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            a = first[i - 1]
+            b = second[j - 1]
+            gap_in_second[i][j] = (
+                best[i - 1][j]
+                if j == n
+                else max(
+                    best[i - 1][j] + scoring.gapStart(a),
+                    gap_in_second[i - 1][j] + scoring.gapExtension(a),
+                )
+            )
+            gap_in_first[i][j] = (
+                best[i][j - 1]
+                if i == m
+                else max(
+                    best[i][j - 1] + scoring.gapStart(b),
+                    gap_in_first[i][j - 1] + scoring.gapExtension(b),
+                )
+            )
+            best[i][j] = max(
+                best[i - 1][j - 1] + scoring(a, b),
+                gap_in_first[i][j],
+                gap_in_second[i][j],
+            )
+    return best[m][n]
+
+
+def test_substitution_table() -> None:
+    vocabulary = Vocabulary()
+    elements = [vocabulary.encode(sign) for sign in [*SIGNS, "ABZ354", "ABZ003"]]
+    scoring = EblScoring(vocabulary)
+
+    assert substitution_table(scoring, elements, elements[::-1]).tolist() == [
+        [scoring(first, second) for second in elements[::-1]] for first in elements
+    ]
+
+
+@pytest.mark.parametrize(
+    "first,second,expected",
+    [
+        ("ABZ001", "ABZ001", match),
+        ("ABZ001", "ABZ002", 0),
+        ("ABZ001 ABZ002 ABZ003", "ABZ002", match),
+        (
+            "ABZ001 ABZ002 ABZ003 ABZ004",
+            "ABZ001 ABZ004",
+            2 * match + gap_start + gap_extension,
+        ),
+        (
+            "ABZ001 ABZ004",
+            "ABZ001 ABZ002 ABZ003 ABZ004",
+            2 * match + gap_start + gap_extension,
+        ),
+    ],
+)
+def test_score(first, second, expected) -> None:
+    vocabulary = Vocabulary()
+    aligner = VectorizedAligner(EblScoring(vocabulary))
+
+    assert (
+        aligner.align(encode(vocabulary, first), encode(vocabulary, second)) == expected
+    )
+
+
+def test_alignment() -> None:
+    vocabulary = Vocabulary()
+    aligner = VectorizedAligner(EblScoring(vocabulary))
+
+    score, [alignment] = aligner.align(
+        encode(vocabulary, "ABZ005 ABZ001 ABZ002 ABZ003 ABZ004"),
+        encode(vocabulary, "ABZ001 ABZ004 ABZ006"),
+        backtrace=True,
+    )
+
+    assert alignment.score == score
+    assert str(vocabulary.decodeSequenceAlignment(alignment)) == (
+        "ABZ001 ABZ002 ABZ003 ABZ004\nABZ001 -      -      ABZ004"
+    )
+
+
+def test_empty() -> None:
+    vocabulary = Vocabulary()
+    aligner = VectorizedAligner(EblScoring(vocabulary))
+
+    score, [alignment] = aligner.align(
+        vocabulary.encodeSequence(Sequence([])),
+        encode(vocabulary, "ABZ001"),
+        backtrace=True,
+    )
+
+    assert score == 0
+    assert len(alignment) == 0
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_reference_parity(seed) -> None:
+    vocabulary = Vocabulary()
+    first, second = random_pair(vocabulary, seed)
+    scoring = EblScoring(vocabulary)
+
+    score, [alignment] = VectorizedAligner(scoring).align(first, second, backtrace=True)
+
+    assert score == reference_score(scoring, list(first), list(second))
+    assert alignment.score == score
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_parity(seed) -> None:
+    vocabulary = Vocabulary()
+    first, second = random_pair(vocabulary, seed)
+
+    expected_score, expected = GlobalSequenceAligner(
+        EblScoring(vocabulary), True
+    ).align(first, second, backtrace=True)
+    score, [alignment] = VectorizedAligner(EblScoring(vocabulary)).align(
+        first, second, backtrace=True
+    )
+
+    assert score == expected_score
+    assert alignment.scores == expected[0].scores
+    assert str(vocabulary.decodeSequenceAlignment(alignment)) == str(
+        vocabulary.decodeSequenceAlignment(expected[0])
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Optional, Sequence
+from typing import Any, Mapping, Optional, Sequence
 
 from ebl.bibliography.application.bibliography_repository import BibliographyRepository
 from ebl.bibliography.application.lookup_reservation import LookupReservationOperation
@@ -51,6 +51,12 @@ class FakeBibliographyRepository(BibliographyRepository):
     def query_by_ids(self, ids: Sequence[str]) -> Sequence[Any]:
         raise NotImplementedError
 
+    def query_by_citation_keys(self, citation_keys: Sequence[str]) -> Mapping[str, Any]:
+        raise NotImplementedError
+
+    def query_by_aliases(self, aliases: Sequence[str]) -> Mapping[str, Any]:
+        raise NotImplementedError
+
     def update(self, entry: Any) -> None:
         raise NotImplementedError
 
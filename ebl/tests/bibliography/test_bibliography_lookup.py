@@ -234,3 +234,78 @@ def test_find_rejects_redirect_chain_over_max_depth(
 
     with pytest.raises(DuplicateError, match="maximum depth"):
         bibliography.find(deprecated_entries[0]["id"])
+
+
+def test_find_all(bibliography, bibliography_repository, when):
+    entry = BibliographyEntryFactory.build(id="ENTRY_ID")
+    cited_entry = BibliographyEntryFactory.build(citationKey="miccadei2002")
+    aliased_entry = BibliographyEntryFactory.build()
+    canonical_entry = BibliographyEntryFactory.build(id="CANONICAL_ID")
+    deprecated_entry = BibliographyEntryFactory.build(
+        id="DUPLICATE_ID", deprecated=True, redirectTo=canonical_entry["id"]
+    )
+    ids = ["ENTRY_ID", "miccadei2002", "DUPLICATE_ID", "legacy-id", "ENTRY_ID"]
+    unresolved = ["miccadei2002", "legacy-id"]
+    when(bibliography_repository).query_by_ids(
+        ["ENTRY_ID", "miccadei2002", "DUPLICATE_ID", "legacy-id"]
+    ).thenReturn([entry, deprecated_entry])
+    when(bibliography_repository).query_by_citation_keys(unresolved).thenReturn(
+        {"miccadei2002": cited_entry}
+    )
+    when(bibliography_repository).query_by_aliases(["legacy-id"]).thenReturn(
+        {"legacy-id": aliased_entry}
+    )
+    when(bibliography_repository).query_by_ids(["CANONICAL_ID"]).thenReturn(
+        [canonical_entry]
+    )
+
+    assert bibliography.find_all(ids) == {
+        "ENTRY_ID": entry,
+        "miccadei2002": cited_entry,
+        "DUPLICATE_ID": canonical_entry,
+        "legacy-id": aliased_entry,
+    }
+    verify(bibliography_repository, times=0).query_by_id(...)
+
+
+def test_find_all_not_found(bibliography, bibliography_repository, when):
+    ids = ["MISSING_ID"]
+    when(bibliography_repository).query_by_ids(ids).thenReturn([])
+    when(bibliography_repository).query_by_citation_keys(ids).thenReturn({})
+    when(bibliography_repository).query_by_aliases(ids).thenReturn({})
+
+    with pytest.raises(NotFoundError, match="MISSING_ID"):
+        bibliography.find_all(ids)
+
+
+def test_find_all_rejects_missing_redirect_target(
+    bibliography, bibliography_repository, when
+):
+    deprecated_entry = BibliographyEntryFactory.build(
+        id="DUPLICATE_ID", deprecated=True, redirectTo="MISSING_ID"
+    )
+    when(bibliography_repository).query_by_ids(["DUPLICATE_ID"]).thenReturn(
+        [deprecated_entry]
+    )
+    when(bibliography_repository).query_by_ids(["MISSING_ID"]).thenReturn([])
+
+    with pytest.raises(NotFoundError, match="redirect target"):
+        bibliography.find_all(["DUPLICATE_ID"])
+
+
+def test_find_all_rejects_redirect_chain_over_max_depth(
+    bibliography, bibliography_repository, when
+):
+    deprecated_entries = [
+        BibliographyEntryFactory.build(
+            id=f"DUPLICATE_{index}",
+            deprecated=True,
+            redirectTo=f"DUPLICATE_{index + 1}",
+        )
+        for index in range(MAX_REDIRECT_DEPTH + 1)
+    ]
+    for entry in deprecated_entries:
+        when(bibliography_repository).query_by_ids([entry["id"]]).thenReturn([entry])
+
+    with pytest.raises(DuplicateError, match="maximum depth"):
+        bibliography.find_all([deprecated_entries[0]["id"]])
@@ -187,6 +187,60 @@ def test_find_by_conflicting_normalized_alias(bibliography_repository):
         bibliography_repository.query_by_alias("D'Agostino")
 
 
+def test_find_by_citation_keys(
+    database, bibliography_repository, create_mongo_bibliography_entry
+):
+    bibliography_entry = BibliographyEntryFactory.build(citationKey="miccadei2002")
+    database[COLLECTION].insert_one(create_mongo_bibliography_entry(bibliography_entry))
+
+    assert bibliography_repository.query_by_citation_keys(
+        ["miccadei2002", "not found"]
+    ) == {"miccadei2002": bibliography_entry}
+
+
+def test_find_by_ambiguous_citation_keys(bibliography_repository):
+    for id_ in ["Q30000001", "Q30000002"]:
+        bibliography_repository.create(
+            BibliographyEntryFactory.build(id=id_, citationKey="miccadei2002")
+        )
+
+    with pytest.raises(DuplicateError):
+        bibliography_repository.query_by_citation_keys(["miccadei2002"])
+
+
+def test_find_by_aliases(
+    database, bibliography_repository, create_mongo_bibliography_entry
+):
+    first_entry = BibliographyEntryFactory.build(
+        aliases=[{"value": "Leipzig/ABC 123", "normalizedValue": "leipzig-abc-123"}]
+    )
+    second_entry = BibliographyEntryFactory.build(
+        aliases=[{"value": "legacy", "normalizedValue": "legacy"}]
+    )
+    database[COLLECTION].insert_many(
+        [
+            create_mongo_bibliography_entry(first_entry),
+            create_mongo_bibliography_entry(second_entry),
+        ]
+    )
+
+    assert bibliography_repository.query_by_aliases(
+        ["Leipzig ABC 123", "legacy", "not found"]
+    ) == {"Leipzig ABC 123": first_entry, "legacy": second_entry}
+
+
+def test_find_by_ambiguous_aliases(bibliography_repository):
+    for id_ in ["Q30000001", "Q30000002"]:
+        bibliography_repository.create(
+            BibliographyEntryFactory.build(
+                id=id_, aliases=[{"value": "legacy", "normalizedValue": "legacy"}]
+            )
+        )
+
+    with pytest.raises(DuplicateError):
+        bibliography_repository.query_by_aliases(["legacy"])
+
+
 def test_entry_not_found(bibliography_repository):
     with pytest.raises(NotFoundError):
         bibliography_repository.query_by_id("not found")
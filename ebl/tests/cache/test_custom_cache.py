@@ -1,6 +1,12 @@
 from mockito import verify
 
-from ebl.cache.application.custom_cache import ChapterCache
+from ebl.cache.application.custom_cache import (
+    CHAPTER_CACHE_VERSION,
+    ChapterCache,
+    compress_chapter,
+    decompress_chapter,
+)
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
 from ebl.tests.factories.corpus import ChapterFactory
 from ebl.corpus.domain.chapter import ChapterId
 
@@ -46,3 +52,99 @@ def test_custom_cache_delete_chapter(mongo_cache_repository, when):
     when(mongo_cache_repository).delete_all(pattern).thenReturn(None)
     custom_cache.delete_chapter(chapter_id)
     verify(mongo_cache_repository, 1).delete_all(pattern)
+
+
+CHAPTER_DISPLAY = {"id": "chapter", "lines": [{"number": 1}, {"number": 2}]}
+
+
+def test_compress_chapter():
+    item = compress_chapter(CHAPTER_DISPLAY)
+
+    assert decompress_chapter(item) == CHAPTER_DISPLAY
+    assert decompress_chapter(item, {1}) == {
+        "id": "chapter",
+        "lines": [None, {"number": 2}],
+    }
+
+
+def test_chapter_display(mongo_cache_repository, database):
+    chapter_id = ChapterFactory.build().id_
+    custom_cache = ChapterCache(
+        mongo_cache_repository, MongoVersionRepository(database)
+    )
+
+    assert custom_cache.get_chapter_display(chapter_id) is None
+
+    custom_cache.set_chapter_display(chapter_id, CHAPTER_DISPLAY)
+
+    assert custom_cache.get_chapter_display(chapter_id) == CHAPTER_DISPLAY
+    assert custom_cache.statistics.local.hits == 1
+
+
+def test_chapter_display_from_mongo(mongo_cache_repository, database):
+    chapter_id = ChapterFactory.build().id_
+    ChapterCache(
+        mongo_cache_repository, MongoVersionRepository(database)
+    ).set_chapter_display(chapter_id, CHAPTER_DISPLAY)
+    custom_cache = ChapterCache(
+        mongo_cache_repository, MongoVersionRepository(database)
+    )
+
+    assert custom_cache.get_chapter_display(chapter_id, {0}) == {
+        "id": "chapter",
+        "lines": [{"number": 1}, None],
+    }
+    assert custom_cache.statistics.mongo_hits == 1
+
+
+class Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+def test_delete_chapter_invalidates_chapter_display(mongo_cache_repository, database):
+    chapter_id = ChapterFactory.build().id_
+    versions = MongoVersionRepository(database)
+    clock = Clock()
+    custom_cache = ChapterCache(mongo_cache_repository, versions)
+    other_cache = ChapterCache(mongo_cache_repository, versions, clock=clock)
+    custom_cache.set_chapter_display(chapter_id, CHAPTER_DISPLAY)
+    other_cache.get_chapter_display(chapter_id)
+
+    custom_cache.delete_chapter(chapter_id)
+    clock.time = 60
+
+    assert other_cache.get_chapter_display(chapter_id) is None
+
+
+def test_delete_chapter_invalidates_own_chapter_display(
+    mongo_cache_repository, database
+):
+    chapter_id = ChapterFactory.build().id_
+    custom_cache = ChapterCache(
+        mongo_cache_repository, MongoVersionRepository(database)
+    )
+    custom_cache.set_chapter_display(chapter_id, CHAPTER_DISPLAY)
+
+    custom_cache.delete_chapter(chapter_id)
+
+    assert custom_cache.get_chapter_display(chapter_id) is None
+
+
+def test_chapter_version_is_checked_once_per_refresh_interval(
+    mongo_cache_repository, database
+):
+    chapter_id = ChapterFactory.build().id_
+    versions = MongoVersionRepository(database)
+    clock = Clock()
+    custom_cache = ChapterCache(mongo_cache_repository, versions, clock=clock)
+    custom_cache.set_chapter_display(chapter_id, CHAPTER_DISPLAY)
+
+    versions.increment(CHAPTER_CACHE_VERSION)
+    clock.time = 59
+    custom_cache.get_chapter_display(chapter_id)
+
+    assert custom_cache.statistics.local.hits == 1
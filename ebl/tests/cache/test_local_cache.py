@@ -0,0 +1,51 @@
+from ebl.cache.application.local_cache import LocalCache, LocalCacheStatistics
+
+
+def test_get_and_set() -> None:
+    cache = LocalCache(max_bytes=10)
+
+    assert cache.get("a", 1) is None
+
+    cache.set("a", "value", 5, 1)
+
+    assert cache.get("a", 1) == "value"
+    assert cache.statistics == LocalCacheStatistics(1, 1, 0, 1, 5)
+
+
+def test_evicts_least_recently_used() -> None:
+    cache = LocalCache(max_bytes=10)
+    cache.set("a", "a", 4, 1)
+    cache.set("b", "b", 4, 1)
+    cache.get("a", 1)
+
+    cache.set("c", "c", 4, 1)
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) == "a"
+    assert cache.get("c", 1) == "c"
+    assert cache.statistics.evictions == 1
+    assert cache.statistics.bytes == 8
+
+
+def test_does_not_store_oversized_entries() -> None:
+    cache = LocalCache(max_bytes=10)
+    cache.set("a", "a", 11, 1)
+
+    assert cache.get("a", 1) is None
+    assert cache.statistics.size == 0
+
+
+def test_version_change_clears_entries() -> None:
+    cache = LocalCache(max_bytes=10)
+    cache.set("a", "a", 4, 1)
+
+    assert cache.get("a", 2) is None
+    assert cache.statistics.bytes == 0
+
+
+def test_delete() -> None:
+    cache = LocalCache(max_bytes=10)
+    cache.set("a", "a", 4, 1)
+    cache.delete("a")
+
+    assert cache.get("a", 1) is None
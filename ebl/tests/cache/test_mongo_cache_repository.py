@@ -12,6 +12,21 @@ def test_set(database, mongo_cache_repository) -> None:
     assert inserted_text == {"data": "data"}
 
 
+def test_set_replaces(database, mongo_cache_repository) -> None:
+    mongo_cache_repository.set("test", {"data": "data"})
+    mongo_cache_repository.set("test", {"data": "new data"})
+
+    assert database[CACHE_COLLECTION].count_documents({"cache_key": "test"}) == 1
+    assert mongo_cache_repository.get("test") == {"data": "new data"}
+
+
+def test_set_with_timeout(database, mongo_cache_repository) -> None:
+    mongo_cache_repository.set("test", {"data": "data"}, 60)
+
+    assert "expiresAt" in database[CACHE_COLLECTION].find_one({"cache_key": "test"})
+    assert mongo_cache_repository.get("test") == {"data": "data"}
+
+
 def test_has(database, mongo_cache_repository) -> None:
     database[CACHE_COLLECTION].insert_one({"cache_key": "test", "data": "data"})
     assert mongo_cache_repository.has("test") is True
@@ -55,7 +70,6 @@ def test_delete_all(database, mongo_cache_repository) -> None:
 def test_create_indexes(database, mongo_cache_repository) -> None:
     mongo_cache_repository.create_indexes()
 
-    assert [("cache_key", 1)] in [
-        index["key"]
-        for index in database[CACHE_COLLECTION].index_information().values()
-    ]
+    indexes = database[CACHE_COLLECTION].index_information().values()
+    assert [("cache_key", 1)] in [index["key"] for index in indexes]
+    assert [("expiresAt", 1)] in [index["key"] for index in indexes]
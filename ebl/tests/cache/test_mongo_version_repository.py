@@ -0,0 +1,23 @@
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
+
+VERSIONS_COLLECTION = "versions"
+
+
+def test_get_missing(database) -> None:
+    assert MongoVersionRepository(database).get("test") == 0
+
+
+def test_get(database) -> None:
+    database[VERSIONS_COLLECTION].insert_one({"_id": "test", "version": 3})
+    assert MongoVersionRepository(database).get("test") == 3
+
+
+def test_increment(database) -> None:
+    repository = MongoVersionRepository(database)
+
+    assert repository.increment("test") == 1
+    assert repository.increment("test") == 2
+    assert database[VERSIONS_COLLECTION].find_one({"_id": "test"}) == {
+        "_id": "test",
+        "version": 2,
+    }
@@ -52,7 +52,7 @@ def test_parse_non_negative_integer_field_negative():
         parse({"offset": "-1"})
 
 
-@pytest.mark.parametrize("count", ["exact", "none", "page"])
+@pytest.mark.parametrize("count", ["exact", "estimate", "none", "page"])
 def test_parse_count(count):
     assert parse_count({"count": count}) == {"count": count}
 
@@ -116,6 +116,13 @@ def test_parse_transliteration(sign_repository):
             factory.create(line).regexp
             for line in PARAMS["transliteration"].splitlines()
         ],
+        "signNgrams": sorted(
+            {
+                ngram
+                for line in PARAMS["transliteration"].splitlines()
+                for ngram in factory.create(line).sign_ngrams
+            }
+        ),
     }
 
 
@@ -137,4 +144,11 @@ def test_pipeline(sign_repository):
             factory.create(line).regexp
             for line in PARAMS["transliteration"].splitlines()
         ],
+        "signNgrams": sorted(
+            {
+                ngram
+                for line in PARAMS["transliteration"].splitlines()
+                for ngram in factory.create(line).sign_ngrams
+            }
+        ),
     }
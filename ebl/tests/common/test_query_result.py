@@ -1,3 +1,5 @@
+import pytest
+
 from ebl.common.query.query_result import QueryResult
 from ebl.common.query.query_schemas import QueryResultSchema
 
@@ -16,4 +18,20 @@ def test_query_result_schema_can_include_count_metadata():
         "matchCountTotal": 0,
         "isMatchCountTotalExact": True,
         "hasNextPage": None,
+        "countMode": "exact",
     }
+
+
+@pytest.mark.parametrize(
+    "result,count_mode",
+    [
+        (QueryResult([], 3, False), "estimate"),
+        (QueryResult([], None, False), "none"),
+        (QueryResult([], None, False, True), "page"),
+    ],
+)
+def test_query_result_schema_tells_count_mode(result, count_mode):
+    assert (
+        QueryResultSchema(include_count_metadata=True).dump(result)["countMode"]
+        == count_mode
+    )
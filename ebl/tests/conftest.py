@@ -26,6 +26,7 @@ from ebl.bibliography.application.serialization import create_object_entry
 from ebl.bibliography.infrastructure.bibliography import MongoBibliographyRepository
 from ebl.cache.application.custom_cache import ChapterCache
 from ebl.cache.infrastructure.mongo_cache_repository import MongoCacheRepository
+from ebl.cache.infrastructure.mongo_version_repository import MongoVersionRepository
 from ebl.changelog import Changelog
 from ebl.corpus.application.corpus import Corpus, CorpusDependencies
 from ebl.corpus.infrastructure.mongo_text_repository import MongoTextRepository
@@ -39,6 +40,7 @@ from ebl.fragmentarium.application.fragment_finder import FragmentFinder, Thumbn
 from ebl.fragmentarium.application.fragment_matcher import FragmentMatcher
 from ebl.fragmentarium.application.fragment_updater import FragmentUpdater
 from ebl.fragmentarium.application.fragmentarium import Fragmentarium
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.application.transliteration_update_factory import (
     TransliterationUpdateFactory,
 )
@@ -58,12 +60,16 @@ from ebl.fragmentarium.infrastructure.mongo_findspot_repository import (
 from ebl.lemmatization.infrastrcuture.mongo_suggestions_finder import (
     MongoLemmaRepository,
 )
+from ebl.signs.infrastructure.cached_sign_catalogue import CachedSignCatalogue
 from ebl.signs.infrastructure.mongo_sign_repository import (
     MongoSignRepository,
     SignSchema,
 )
 from ebl.tests.factories.bibliography import BibliographyEntryFactory
 from ebl.transliteration.application.parallel_line_injector import ParallelLineInjector
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+)
 from ebl.transliteration.domain import atf
 from ebl.transliteration.domain.at_line import ColumnAtLine, SurfaceAtLine, ObjectAtLine
 from ebl.transliteration.domain.labels import ColumnLabel, SurfaceLabel, ObjectLabel
@@ -518,6 +524,7 @@ def context(
     user,
     parallel_line_injector,
     mongo_cache_repository,
+    database,
 ) -> ebl.context.Context:
     return ebl.context.Context(
         ebl_ai_client=ebl_ai_client,
@@ -542,8 +549,13 @@ def context(
         findspot_repository=findspot_repository,
         realia_repository=realia_repository,
         cache=Cache({"CACHE_TYPE": "null"}),
-        custom_cache=ChapterCache(mongo_cache_repository),
+        custom_cache=ChapterCache(
+            mongo_cache_repository, MongoVersionRepository(database)
+        ),
         parallel_line_injector=parallel_line_injector,
+        line_to_vec_store=LineToVecStore(fragment_repository),
+        transliteration_query_cache=TransliterationQueryCache(sign_repository),
+        sign_catalogue=CachedSignCatalogue(sign_repository, refresh_interval=0),
     )
 
 
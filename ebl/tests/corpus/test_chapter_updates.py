@@ -0,0 +1,109 @@
+import bson
+import pytest
+
+from ebl.corpus.infrastructure.chapter_updates import (
+    create_chapter_update,
+    create_update_guard,
+    get_update_size,
+)
+
+
+def manuscript_line(content: str) -> dict:
+    return {"manuscriptId": 1, "line": {"content": [content]}}
+
+
+def chapter(*manuscript_lines: dict, **fields) -> dict:
+    return {
+        "manuscripts": [{"id": 1}],
+        "lines": [
+            {
+                "number": "1",
+                "variants": [
+                    {"reconstruction": ["kur"], "manuscripts": list(manuscript_lines)}
+                ],
+            },
+            {"number": "2", "variants": []},
+        ],
+        "signs": ["KUR"],
+        "parserVersion": "1",
+        **fields,
+    }
+
+
+OLD = chapter(manuscript_line("a"), manuscript_line("b"))
+
+
+@pytest.mark.parametrize(
+    "new,expected",
+    [
+        (OLD, {}),
+        (
+            chapter(manuscript_line("a"), manuscript_line("c")),
+            {"lines.0.variants.0.manuscripts.1": manuscript_line("c")},
+        ),
+        (
+            chapter(manuscript_line("a")),
+            {"lines.0.variants.0.manuscripts": [manuscript_line("a")]},
+        ),
+        (
+            chapter(manuscript_line("a"), manuscript_line("b"), signs=["KUR", "A"]),
+            {"signs": ["KUR", "A"]},
+        ),
+        (
+            chapter(manuscript_line("a"), manuscript_line("b"), parserVersion="2"),
+            {"parserVersion": "2"},
+        ),
+        (
+            chapter(manuscript_line("a"), manuscript_line("b"), lines=[]),
+            {"lines": []},
+        ),
+    ],
+)
+def test_create_chapter_update(new, expected) -> None:
+    assert create_chapter_update(OLD, new) == expected
+
+
+def test_create_chapter_update_changed_fields() -> None:
+    new = chapter(manuscript_line("a"), manuscript_line("b"))
+    new["lines"][0]["variants"][0]["reconstruction"] = ["mat"]
+    new["lines"][1]["number"] = "3"
+
+    assert create_chapter_update(OLD, new) == {
+        "lines.0.variants.0.reconstruction": ["mat"],
+        "lines.1.number": "3",
+    }
+
+
+def test_create_chapter_update_changed_keys() -> None:
+    new = chapter(manuscript_line("a"), manuscript_line("b"))
+    new["lines"][1]["translation"] = []
+
+    assert create_chapter_update(OLD, new) == {"lines.1": new["lines"][1]}
+
+
+def test_create_chapter_update_missing_field() -> None:
+    old = {key: value for key, value in OLD.items() if key != "signs"}
+
+    assert create_chapter_update(old, OLD) == {"signs": OLD["signs"]}
+
+
+def test_create_update_guard() -> None:
+    update = {
+        "lines.0.variants.0.manuscripts.1": manuscript_line("c"),
+        "lines.1.number": "3",
+        "signs": ["KUR", "A"],
+        "parserVersion": "2",
+    }
+
+    assert create_update_guard(OLD, update) == {
+        "lines": {"$size": 2},
+        "lines.0.variants": {"$size": 1},
+        "lines.0.variants.0.manuscripts": {"$size": 2},
+    }
+
+
+def test_get_update_size() -> None:
+    update = {"signs": ["KUR"]}
+
+    assert get_update_size(update) == len(bson.encode({"$set": update}))
+    assert get_update_size({}) == 0
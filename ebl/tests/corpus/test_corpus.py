@@ -4,13 +4,12 @@ from typing import Any, cast
 import attr
 import pytest
 from ebl.corpus.application.id_schemas import TextIdSchema
-from ebl.corpus.application.corpus import Corpus
+from ebl.corpus.application.corpus import Corpus, dump_changed_lines
 
 from ebl.corpus.application.lemmatization import (
     ChapterLemmatization,
     LineVariantLemmatization,
 )
-from ebl.corpus.application.schemas import ChapterSchema
 from ebl.corpus.domain.alignment import Alignment, ManuscriptLineAlignment
 from ebl.corpus.domain.chapter_display import ChapterDisplay
 from ebl.corpus.domain.dictionary_line import DictionaryLine
@@ -36,7 +35,6 @@ from ebl.transliteration.domain.text_line import TextLine
 from ebl.transliteration.domain.tokens import Joiner, LanguageShift, ValueToken
 from ebl.transliteration.domain.word_tokens import AbstractWord, Word
 
-
 CHAPTERS_COLLECTION = "chapters"
 TEXT = TextFactory.build()
 CHAPTER = ChapterFactory.build(text_id=TEXT.id)
@@ -86,17 +84,17 @@ def importing_lines_dependencies(
 
 
 def expect_bibliography(bibliography, when) -> None:
+    documents = {}
     for manuscript in CHAPTER.manuscripts:
         for reference in manuscript.references:
-            (when(bibliography).find(reference.id).thenReturn(reference.document))
+            documents[reference.id] = reference.document
         for old_siglum in manuscript.old_sigla:
-            (when(bibliography)).find(old_siglum.reference.id).thenReturn(
-                old_siglum.reference.document
-            )
+            documents[old_siglum.reference.id] = old_siglum.reference.document
+    when(bibliography).find_all(...).thenReturn(documents)
 
 
 def expect_invalid_references(bibliography, when) -> None:
-    when(bibliography).find(...).thenRaise(NotFoundError())
+    when(bibliography).find_all(...).thenRaise(NotFoundError())
 
 
 def expect_signs(signs, sign_repository) -> None:
@@ -119,14 +117,12 @@ def expect_chapter_update(
     when(text_repository).update(CHAPTER.id_, updated_chapter).thenReturn(
         updated_chapter
     )
+    old_dict, new_dict = dump_changed_lines(old_chapter, updated_chapter)
     when(changelog).create(
         CHAPTERS_COLLECTION,
         user.profile,
-        {**ChapterSchema().dump(old_chapter), "_id": old_chapter.id_.to_tuple()},
-        {
-            **ChapterSchema().dump(updated_chapter),
-            "_id": updated_chapter.id_.to_tuple(),
-        },
+        {**old_dict, "_id": old_chapter.id_.to_tuple()},
+        {**new_dict, "_id": updated_chapter.id_.to_tuple()},
     ).thenReturn()
 
 
@@ -300,7 +296,7 @@ def test_find_chapter_raises_exception_if_references_not_found(
     when(text_repository).find_chapter(CHAPTER.id_).thenReturn(
         CHAPTER_WITHOUT_DOCUMENTS
     )
-    when(bibliography).find(...).thenRaise(NotFoundError())
+    when(bibliography).find_all(...).thenRaise(NotFoundError())
 
     with pytest.raises(Defect):
         corpus.find_chapter(CHAPTER.id_)
@@ -181,6 +181,7 @@ CHAPTER_WITH_SIGNS: Chapter = ChapterFactory.build(
         ("ma šu\nba", [2, 3], [1, 0]),
     ],
 )
+@pytest.mark.parametrize("indexed", [False, True])
 def test_query_chapter_signs(
     client,
     text_repository,
@@ -189,10 +190,13 @@ def test_query_chapter_signs(
     transliteration,
     expected_lines,
     expected_variants,
+    indexed,
 ):
     for sign in signs:
         sign_repository.create(sign)
     text_repository.create_chapter(CHAPTER_WITH_SIGNS)
+    if indexed:
+        text_repository.rebuild_sign_ngrams()
 
     result = client.simulate_get(
         "/corpus/query",
@@ -25,10 +25,14 @@ from ebl.tests.factories.corpus import (
     UncertainFragmentAttestationFactory,
 )
 from ebl.tests.factories.fragment import FragmentFactory
+from ebl.transliteration.domain.atf import Surface
 from ebl.transliteration.domain.genre import Genre
+from ebl.transliteration.domain.labels import SurfaceLabel
 from ebl.transliteration.domain.line_number import LineNumber
+from ebl.transliteration.domain.markup import StringPart
 from ebl.transliteration.domain.museum_number import MuseumNumber
 from ebl.transliteration.domain.normalized_akkadian import AkkadianWord
+from ebl.transliteration.domain.note_line import NoteLine
 from ebl.transliteration.domain.sign_tokens import Reading
 from ebl.transliteration.domain.text_id import TextId
 from ebl.transliteration.domain.text_line import TextLine
@@ -40,6 +44,7 @@ from ebl.transliteration.application.signs_visitor import SignsVisitor
 TEXTS_COLLECTION = "texts"
 CHAPTERS_COLLECTION = "chapters"
 JOINS_COLLECTION = "joins"
+SIGN_NGRAMS_COLLECTION = "chapter_sign_ngrams"
 MANUSCRIPT_ID = 1
 MUSEUM_NUMBER = MuseumNumber("X", "1")
 UNCERTAIN_FRAGMENT = MuseumNumber("X", "2")
@@ -310,6 +315,70 @@ def test_updating_chapter(database, text_repository) -> None:
     assert text_repository.find_chapter(CHAPTER.id_) == updated_chapter
 
 
+def test_updating_chapter_line(database, text_repository) -> None:
+    line = CHAPTER.lines[0]
+    variant = attr.evolve(line.variants[0], note=None, intertext=(), parallel_lines=())
+    updated_chapter = attr.evolve(
+        CHAPTER, lines=(attr.evolve(line, variants=(variant,)), *CHAPTER.lines[1:])
+    )
+    when_chapter_in_collection(database)
+
+    text_repository.update(CHAPTER.id_, updated_chapter)
+
+    assert text_repository.find_chapter(CHAPTER.id_) == updated_chapter
+
+
+def test_updating_chapter_rewrites_concurrently_removed_variant(
+    monkeypatch, database, text_repository
+) -> None:
+    line = CHAPTER.lines[0]
+    variant = line.variants[0]
+    removed_variant = attr.evolve(
+        variant,
+        manuscripts=tuple(
+            attr.evolve(manuscript, labels=(SurfaceLabel.from_label(Surface.REVERSE),))
+            for manuscript in variant.manuscripts
+        ),
+    )
+    read_chapter = attr.evolve(
+        CHAPTER,
+        lines=(
+            attr.evolve(line, variants=(variant, removed_variant)),
+            *CHAPTER.lines[1:],
+        ),
+    )
+    updated_chapter = attr.evolve(
+        CHAPTER,
+        lines=(
+            attr.evolve(
+                line,
+                variants=(
+                    variant,
+                    attr.evolve(
+                        removed_variant, note=NoteLine((StringPart("new note"),))
+                    ),
+                ),
+            ),
+            *CHAPTER.lines[1:],
+        ),
+    )
+    when_chapter_in_collection(database)
+    find_one = text_repository._chapters.find_one
+
+    def find_read_chapter(query, *args, **kwargs):
+        return {
+            **find_one(query, *args, **kwargs),
+            "lines": ChapterSchema().dump(read_chapter)["lines"],
+        }
+
+    monkeypatch.setattr(text_repository._chapters, "find_one", find_read_chapter)
+
+    text_repository.update(CHAPTER.id_, updated_chapter)
+    monkeypatch.undo()
+
+    assert text_repository.find_chapter(CHAPTER.id_) == updated_chapter
+
+
 def test_updating_non_existing_chapter_raises_exception(text_repository):
     with pytest.raises(NotFoundError):
         text_repository.update(CHAPTER.id_, CHAPTER)
@@ -335,6 +404,50 @@ def test_query_by_transliteration(
     assert result == (expected, len(expected))
 
 
+def test_query_by_transliteration_with_sign_ngrams(
+    text_repository, sign_repository, signs
+) -> None:
+    for sign in signs:
+        sign_repository.create(sign)
+    text_repository.create_chapter(CHAPTER_FILTERED_QUERY)
+    text_repository.rebuild_sign_ngrams()
+
+    for string, expected in [("NU\nKU", [CHAPTER_FILTERED_QUERY]), ("UD", [])]:
+        assert text_repository.query_by_transliteration(
+            TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository)),
+            0,
+        ) == (expected, len(expected))
+
+
+def test_find_sign_ngram_candidates(database, text_repository) -> None:
+    text_repository.create_chapter(CHAPTER)
+
+    assert text_repository._find_sign_ngram_candidates(["KU"]) is None
+
+    text_repository.rebuild_sign_ngrams()
+    chapter = database[CHAPTERS_COLLECTION].find_one({})["_id"]
+
+    assert text_repository._find_sign_ngram_candidates(["KU"]) == {
+        chapter: [MANUSCRIPT_ID]
+    }
+    assert text_repository._find_sign_ngram_candidates(["KU", "UD"]) == {}
+
+    text_repository.update(CHAPTER.id_, attr.evolve(CHAPTER, signs=("UD",)))
+
+    assert text_repository._find_sign_ngram_candidates(["KU"]) == {}
+
+
+def test_update_keeps_sign_ngrams_if_signs_are_unchanged(
+    database, text_repository
+) -> None:
+    text_repository.create_chapter(CHAPTER)
+    postings = list(database[SIGN_NGRAMS_COLLECTION].find({}))
+
+    text_repository.update(CHAPTER.id_, attr.evolve(CHAPTER, parser_version="updated"))
+
+    assert list(database[SIGN_NGRAMS_COLLECTION].find({})) == postings
+
+
 def make_dictionary_line(text: Text, chapter: Chapter, lemma: str) -> DictionaryLine:
     line = chapter.lines[0]
     return DictionaryLine(
@@ -481,6 +594,19 @@ def test_query_manuscripts_with_joins_by_chapter(database, text_repository) -> N
     ]
 
 
+def test_query_manuscripts_with_join_members_by_chapter(
+    database, text_repository, fragment_repository
+) -> None:
+    when_chapter_in_collection(database)
+    join = Join(MUSEUM_NUMBER)
+    fragment_repository.create_join([[join]])
+    fragment_repository.rebuild_join_members()
+
+    assert text_repository.query_manuscripts_with_joins_by_chapter(CHAPTER.id_) == [
+        attr.evolve(CHAPTER.manuscripts[0], joins=Joins(((join,),)))
+    ]
+
+
 def test_query_corpus_by_manuscripts(database, text_repository) -> None:
     when_text_in_collection(database, text=attr.evolve(TEXT, references=()))
     when_chapter_in_collection(database)
@@ -48,12 +48,14 @@ def query_result_of(
     match_count_total: Optional[int],
     is_match_count_total_exact: bool = True,
     has_next_page: Optional[bool] = None,
+    count_mode: str = "exact",
 ) -> Dict:
     return {
         "items": items,
         "matchCountTotal": match_count_total,
         "isMatchCountTotalExact": is_match_count_total_exact,
         "hasNextPage": has_next_page,
+        "countMode": count_mode,
     }
 
 
@@ -8,6 +8,7 @@ from ebl.transliteration.domain.transliteration_query import TransliterationQuer
 
 COLLECTION = "fragments"
 JOINS_COLLECTION = "joins"
+JOIN_MEMBERS_COLLECTION = "join_members"
 SCHEMA = FragmentSchema()
 
 
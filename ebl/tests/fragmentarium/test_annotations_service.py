@@ -4,7 +4,7 @@ from itertools import zip_longest
 from ebl.ebl_ai_client import EblAiClient
 from ebl.fragmentarium.application.annotations_schema import AnnotationsSchema
 from ebl.fragmentarium.application.annotations_service import AnnotationsService
-from ebl.fragmentarium.application.cropped_sign_image import Base64, CroppedSignImage
+from ebl.fragmentarium.application.cropped_sign_image import CroppedSignImage
 from ebl.fragmentarium.domain.annotation import Annotations
 from ebl.tests.conftest import create_test_photo
 from ebl.tests.factories.annotation import (
@@ -109,7 +109,6 @@ def test_update(
     cropped_sign_images_repository,
     when,
     user,
-    changelog,
     text_with_labels,
 ):
     fragment_number = MuseumNumber("K", "1")
@@ -128,45 +127,35 @@ def test_update(
     when(annotations_repository).query_by_museum_number(fragment_number).thenReturn(
         old_annotations
     )
-    image = create_test_photo("K.2")
     when(fragment_repository).query_by_museum_number(fragment_number).thenReturn(
         fragment
     )
     (
         when(photo_repository)
         .query_by_file_name(f"{annotations.fragment_number}.jpg")
-        .thenReturn(image)
+        .thenReturn(create_test_photo("K.2"), create_test_photo("K.2"))
     )
-
-    expected_cropped_sign_image = CroppedSignImage(
-        "test-id", Base64("test-image"), fragment_number
+    cropped_sign_images_repository.create_many(
+        [CroppedSignImage("unused-id", b"image", fragment_number, "unused-hash")]
     )
-    annotation_cropped_sign = attr.evolve(
-        annotation,
-        cropped_sign=CroppedSignFactory.build(
-            image_id="test-id",
-            label="i",
-        ),
+
+    result = annotations_service.update(annotations, user)
+
+    [image_id] = cropped_sign_images_repository.query_content_hashes(fragment_number)
+    assert result == attr.evolve(
+        annotations,
+        annotations=[
+            attr.evolve(
+                annotation,
+                cropped_sign=CroppedSignFactory.build(image_id=image_id, label="i"),
+            )
+        ],
     )
-    expected_annotations = attr.evolve(
-        annotations, annotations=[annotation_cropped_sign]
+    assert cropped_sign_images_repository.query_by_id(image_id).image.startswith(
+        b"\x89PNG"
     )
-    when(CroppedSignImage).create(...).thenReturn(expected_cropped_sign_image)
-
-    when(cropped_sign_images_repository).delete_by_fragment_number(
-        fragment_number
-    ).thenReturn()
-    when(annotations_repository).create_or_update(expected_annotations).thenReturn()
-    when(cropped_sign_images_repository).create_many(
-        [expected_cropped_sign_image]
-    ).thenReturn()
-    schema = AnnotationsSchema()
-    when(changelog).create(
-        "annotations",
-        user.profile,
-        {"_id": str(fragment_number), **schema.dump(old_annotations)},
-        {"_id": str(fragment_number), **schema.dump(expected_annotations)},
-    ).thenReturn()
 
-    result = annotations_service.update(annotations, user)
-    assert result == expected_annotations
+    assert annotations_service.update(annotations, user) == result
+    assert list(
+        cropped_sign_images_repository.query_content_hashes(fragment_number)
+    ) == [image_id]
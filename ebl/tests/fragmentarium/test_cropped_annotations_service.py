@@ -13,8 +13,8 @@ from ebl.fragmentarium.application.cropped_annotations_service import (
     CroppedAnnotationService,
 )
 from ebl.fragmentarium.application.cropped_sign_image import (
-    Base64,
     CroppedSignImage,
+    to_base64,
 )
 from ebl.tests.factories.annotation import (
     AnnotationFactory,
@@ -53,15 +53,13 @@ def test_find_annotations_by_sign(
         "test-sign", False, False, None, None
     ).thenReturn([annotations])
 
-    when(cropped_sign_images_repository).query_by_id(image_id_1).thenReturn(
-        CroppedSignImage(
-            image_id_1, Base64("test-base64-1"), annotations.fragment_number
-        )
-    )
-    when(cropped_sign_images_repository).query_by_id(image_id_2).thenReturn(
-        CroppedSignImage(
-            image_id_2, Base64("test-base64-2"), annotations.fragment_number
-        )
+    when(cropped_sign_images_repository).query_by_ids(
+        [image_id_1, image_id_2]
+    ).thenReturn(
+        [
+            CroppedSignImage(image_id_1, b"image 1", annotations.fragment_number),
+            CroppedSignImage(image_id_2, b"image 2", annotations.fragment_number),
+        ]
     )
 
     fragment_number = annotations.fragment_number
@@ -69,7 +67,7 @@ def test_find_annotations_by_sign(
 
     expected_1 = {
         "fragmentNumber": str(fragment_number),
-        "image": Base64("test-base64-1"),
+        "image": to_base64(b"image 1"),
         "script": str(annotations.script),
         "label": annotation[0].cropped_sign.label,
         "date": DateSchema().dump(fragment.date),
@@ -78,7 +76,7 @@ def test_find_annotations_by_sign(
     }
     expected_2 = {
         "fragmentNumber": str(fragment_number),
-        "image": Base64("test-base64-2"),
+        "image": to_base64(b"image 2"),
         "script": str(annotations.script),
         "label": annotation[1].cropped_sign.label,
         "date": DateSchema().dump(fragment.date),
@@ -123,8 +121,8 @@ def test_find_annotations_by_sign_includes_pca_clustering(
     when(annotations_repository).find_by_sign(
         "test-sign", False, False, None, None
     ).thenReturn([annotations])
-    when(cropped_sign_images_repository).query_by_id(image_id).thenReturn(
-        CroppedSignImage(image_id, Base64("test-base64"), annotations.fragment_number)
+    when(cropped_sign_images_repository).query_by_ids([image_id]).thenReturn(
+        [CroppedSignImage(image_id, b"image", annotations.fragment_number)]
     )
 
     result = service.find_annotations_by_sign("test-sign")
@@ -156,8 +154,8 @@ def test_find_annotations_by_sign_omits_pca_clustering_when_missing(
     when(annotations_repository).find_by_sign(
         "test-sign", False, False, None, None
     ).thenReturn([annotations])
-    when(cropped_sign_images_repository).query_by_id(image_id).thenReturn(
-        CroppedSignImage(image_id, Base64("test-base64"), annotations.fragment_number)
+    when(cropped_sign_images_repository).query_by_ids([image_id]).thenReturn(
+        [CroppedSignImage(image_id, b"image", annotations.fragment_number)]
     )
 
     result = service.find_annotations_by_sign("test-sign")
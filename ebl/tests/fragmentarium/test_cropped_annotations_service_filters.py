@@ -12,10 +12,7 @@ from ebl.fragmentarium.application.fragment_repository import FragmentRepository
 from ebl.fragmentarium.application.cropped_annotations_service import (
     CroppedAnnotationService,
 )
-from ebl.fragmentarium.application.cropped_sign_image import (
-    Base64,
-    CroppedSignImage,
-)
+from ebl.fragmentarium.application.cropped_sign_image import CroppedSignImage
 from ebl.tests.factories.annotation import (
     AnnotationFactory,
     AnnotationsWithScriptFactory,
@@ -100,16 +97,12 @@ def test_find_annotations_by_sign_deduplicates_fetch_date_and_image_lookups(when
     when(fragment_repository).fetch_date(annotations.fragment_number).thenReturn(
         fragment.date
     )
-    when(cropped_sign_images_repository).query_by_id(shared_image_id).thenReturn(
-        CroppedSignImage(
-            shared_image_id,
-            Base64("shared-base64"),
-            annotations.fragment_number,
-        )
+    when(cropped_sign_images_repository).query_by_ids([shared_image_id]).thenReturn(
+        [CroppedSignImage(shared_image_id, b"shared", annotations.fragment_number)]
     )
 
     result = service.find_annotations_by_sign("test-sign")
 
     assert len(result) == 2
     verify(fragment_repository, times=1).fetch_date(annotations.fragment_number)
-    verify(cropped_sign_images_repository, times=1).query_by_id(shared_image_id)
+    verify(cropped_sign_images_repository, times=1).query_by_ids([shared_image_id])
@@ -1,7 +1,7 @@
 from ebl.fragmentarium.application.cropped_sign_image import (
     CroppedSignImage,
-    Base64,
     CroppedSignImageSchema,
+    to_base64,
 )
 from ebl.fragmentarium.infrastructure.cropped_sign_images_repository import (
     MongoCroppedSignImagesRepository,
@@ -15,9 +15,9 @@ def test_delete_by_fragment_number(database):
     fragment_number_2 = MuseumNumber("K", "2")
 
     images = [
-        CroppedSignImage("image1", Base64("data1"), fragment_number_1),
-        CroppedSignImage("image2", Base64("data2"), fragment_number_1),
-        CroppedSignImage("image3", Base64("data3"), fragment_number_2),
+        CroppedSignImage("image1", b"data1", fragment_number_1),
+        CroppedSignImage("image2", b"data2", fragment_number_1),
+        CroppedSignImage("image3", b"data3", fragment_number_2),
     ]
 
     repository.create_many(images)
@@ -37,16 +37,65 @@ def test_delete_by_fragment_number(database):
     assert remaining_doc["_id"] == "image3"
 
 
+def test_query_by_ids(database):
+    repository = MongoCroppedSignImagesRepository(database)
+    fragment_number = MuseumNumber("K", "1")
+    images = [
+        CroppedSignImage("image1", b"data1", fragment_number, "hash1"),
+        CroppedSignImage("image2", b"data2", fragment_number, "hash2"),
+    ]
+    repository.create_many(images)
+
+    assert repository.query_by_ids(["image1", "image2", "missing"]) == images
+    document = database["cropped_sign_images"].find_one({"_id": "image1"})
+    assert document["image"] == b"data1"
+
+
+def test_query_legacy_base64_image(database):
+    database["cropped_sign_images"].insert_one(
+        {"_id": "image1", "image": to_base64(b"data1"), "fragment_number": "K.1"}
+    )
+    repository = MongoCroppedSignImagesRepository(database)
+
+    assert repository.query_by_id("image1") == CroppedSignImage(
+        "image1", b"data1", MuseumNumber("K", "1")
+    )
+
+
+def test_query_content_hashes_and_delete_by_ids(database):
+    repository = MongoCroppedSignImagesRepository(database)
+    fragment_number = MuseumNumber("K", "1")
+    repository.create_many(
+        [
+            CroppedSignImage("image1", b"data1", fragment_number, "hash1"),
+            CroppedSignImage("image2", b"data2", fragment_number, "hash2"),
+            CroppedSignImage("image3", b"data3", MuseumNumber("K", "2"), "hash3"),
+        ]
+    )
+
+    assert repository.query_content_hashes(fragment_number) == {
+        "image1": "hash1",
+        "image2": "hash2",
+    }
+
+    repository.delete_by_ids(["image1"])
+
+    assert repository.query_content_hashes(fragment_number) == {"image2": "hash2"}
+
+
 def test_cropped_sign_image_schema_with_fragment_number():
     fragment_number = MuseumNumber("BM", "12345")
-    image = CroppedSignImage("test-id", Base64("test-data"), fragment_number)
+    image = CroppedSignImage("test-id", b"test-data", fragment_number, "hash")
     schema = CroppedSignImageSchema()
 
     dumped = schema.dump(image)
-    expected = {"_id": "test-id", "image": "test-data", "fragment_number": "BM.12345"}
+    expected = {
+        "_id": "test-id",
+        "image": b"test-data",
+        "fragment_number": "BM.12345",
+        "contentHash": "hash",
+    }
     assert dumped == expected
 
     loaded = schema.load(expected)
-    assert loaded.image_id == "test-id"
-    assert loaded.image == "test-data"
-    assert loaded.fragment_number == fragment_number
+    assert loaded == image
@@ -1,12 +1,17 @@
 from ebl.common.domain.period import Period
 from ebl.fragmentarium.application.fragment_matcher import (
-    sort_scores_to_list,
+    FragmentMatcher,
     LineToVecRanking,
 )
 from ebl.fragmentarium.application.line_to_vec import LineToVecScore, LineToVecEntry
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
 from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
 from ebl.transliteration.domain.museum_number import MuseumNumber
-from ebl.tests.factories.fragment import FragmentFactory, ScriptFactory
+from ebl.tests.factories.fragment import (
+    FragmentFactory,
+    ScriptFactory,
+    TransliteratedFragmentFactory,
+)
 
 
 def test_find(fragment_repository, when, fragment_matcher):
@@ -20,20 +25,6 @@ def test_find(fragment_repository, when, fragment_matcher):
 SCRIPT = ScriptFactory.build(period=Period.NEO_ASSYRIAN)
 
 
-def test_sort_scores_to_list():
-    score = [
-        LineToVecScore(MuseumNumber.of("X.1"), SCRIPT, 4),
-        LineToVecScore(MuseumNumber.of("X.2"), SCRIPT, 12),
-        LineToVecScore(MuseumNumber.of("X.3"), SCRIPT, 2),
-    ]
-
-    assert sort_scores_to_list(score) == [
-        LineToVecScore(MuseumNumber.of("X.2"), SCRIPT, 12),
-        LineToVecScore(MuseumNumber.of("X.1"), SCRIPT, 4),
-        LineToVecScore(MuseumNumber.of("X.3"), SCRIPT, 2),
-    ]
-
-
 def test_line_to_vec(fragment_matcher, when):
     parameters = "BM.11"
     fragment_1_line_to_vec = (LineToVecEncoding.from_list([1, 2, 1, 1]),)
@@ -94,3 +85,25 @@ def test_empty_line_to_vec(fragment_matcher, when):
         )
     )
     assert fragment_matcher.rank_line_to_vec(parameters) == LineToVecRanking([], [])
+
+
+def test_line_to_vec_with_store(fragment_repository):
+    fragment_1 = FragmentFactory.build(
+        number=MuseumNumber.of("BM.11"),
+        line_to_vec=(LineToVecEncoding.from_list([1, 2, 1, 1]),),
+        script=SCRIPT,
+    )
+    fragment_2 = TransliteratedFragmentFactory.build(
+        number=MuseumNumber.of("X.1"),
+        line_to_vec=(LineToVecEncoding.from_list([2, 1, 1]),),
+        script=SCRIPT,
+    )
+    fragment_repository.create_many([fragment_1, fragment_2])
+    fragment_matcher = FragmentMatcher(
+        fragment_repository, LineToVecStore(fragment_repository)
+    )
+
+    assert fragment_matcher.rank_line_to_vec("BM.11") == LineToVecRanking(
+        [LineToVecScore(MuseumNumber.of("X.1"), SCRIPT, 3)],
+        [LineToVecScore(MuseumNumber.of("X.1"), SCRIPT, 5)],
+    )
@@ -0,0 +1,42 @@
+from ebl.common.domain.scopes import Scope
+from ebl.fragmentarium.infrastructure.fragment_query_counts import (
+    MongoFragmentQueryCounts,
+    create_count_key,
+)
+
+
+def test_count_key_ignores_pagination():
+    assert create_count_key(
+        {"transliteration": ["kur"], "limit": 10, "offset": 20, "count": "exact"}, []
+    ) == create_count_key({"transliteration": ["kur"]}, [])
+
+
+def test_count_key_depends_on_query_and_scopes():
+    query = {"transliteration": ["kur"]}
+
+    assert create_count_key(query, []) != create_count_key(
+        {"transliteration": ["ku"]}, []
+    )
+    assert create_count_key(query, []) != create_count_key(
+        query, [Scope.READ_CAIC_FRAGMENTS]
+    )
+
+
+def test_save_and_find(database):
+    counts = MongoFragmentQueryCounts(database)
+    version = counts.get_version()
+
+    counts.save("key", version, 42)
+
+    assert counts.find("key", version) == 42
+    assert counts.find("other", version) is None
+
+
+def test_invalidate(database):
+    counts = MongoFragmentQueryCounts(database)
+    version = counts.get_version()
+    counts.save("key", version, 42)
+
+    counts.invalidate()
+
+    assert counts.find("key", counts.get_version()) is None
@@ -176,3 +176,29 @@ def test_fragment_query_count_page_without_limit_has_no_next_page():
         "isMatchCountTotalExact": {"$literal": False},
         "hasNextPage": {"$literal": False},
     }
+
+
+def test_fragment_query_count_estimate_omits_exact_count_facet():
+    pipeline = PatternMatcher(
+        {"transliteration": ["kur₂"], "limit": 10, "count": "estimate"}, None
+    ).build_pipeline()
+
+    assert "count" not in _facet(pipeline)
+    assert _result_projection(pipeline)["matchCountTotal"] == {"$literal": None}
+
+
+def test_fragment_query_count_pipeline_has_no_items():
+    matcher = PatternMatcher({"transliteration": ["kur₂"], "limit": 10}, None)
+
+    pipeline = matcher.build_count_pipeline()
+
+    assert not any("$facet" in stage for stage in pipeline)
+    assert pipeline[-1] == {"$project": {"_id": False, "matchCountTotal": True}}
+
+
+def test_fragment_query_sample_count_pipeline_samples_first():
+    matcher = PatternMatcher({"transliteration": ["kur₂"], "limit": 10}, None)
+
+    pipeline = matcher.build_sample_count_pipeline(100)
+
+    assert pipeline == [{"$sample": {"size": 100}}, *matcher.build_count_pipeline()]
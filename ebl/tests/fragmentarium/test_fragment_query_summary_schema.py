@@ -188,6 +188,7 @@ def test_fragment_query_result_schema_roundtrip_and_compatibility():
         "matchCountTotal": 7,
         "isMatchCountTotalExact": True,
         "hasNextPage": None,
+        "countMode": "exact",
     }
 
 
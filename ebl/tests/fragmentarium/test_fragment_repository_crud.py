@@ -6,14 +6,17 @@ from ebl.fragmentarium.application.fragment_schema import FragmentSchema
 from ebl.fragmentarium.application.joins_schema import JoinSchema
 from ebl.fragmentarium.domain.fragment import Script
 from ebl.fragmentarium.domain.joins import Join, Joins
+from ebl.fragmentarium.infrastructure.join_members import JoinMembersVersion
 from ebl.tests.factories.bibliography import ReferenceFactory
 from ebl.tests.factories.fragment import (
     FragmentFactory,
     JoinFactory,
     LemmatizedFragmentFactory,
+    TransliteratedFragmentFactory,
 )
 from ebl.tests.fragmentarium.fragment_repository_test_helpers import (
     COLLECTION,
+    JOIN_MEMBERS_COLLECTION,
     JOINS_COLLECTION,
 )
 from ebl.transliteration.domain.line_number import LineNumber
@@ -29,7 +32,7 @@ def test_create(database, fragment_repository):
     assert fragment_id == str(fragment.number)
     assert database[COLLECTION].find_one(
         {"_id": fragment_id}, projection={"_id": False}
-    ) == FragmentSchema(exclude=["joins"]).dump(fragment)
+    ) == {**FragmentSchema(exclude=["joins"]).dump(fragment), "atf": fragment.text.atf}
 
 
 def test_create_many(database, fragment_repository):
@@ -40,7 +43,10 @@ def test_create_many(database, fragment_repository):
         assert str(fragment.number) in fragment_ids
         assert database[COLLECTION].find_one(
             {"_id": str(fragment.number)}, projection={"_id": False}
-        ) == FragmentSchema(exclude=["joins"]).dump(fragment)
+        ) == {
+            **FragmentSchema(exclude=["joins"]).dump(fragment),
+            "atf": fragment.text.atf,
+        }
 
 
 def test_create_indexes(database, fragment_repository):
@@ -89,6 +95,70 @@ def test_create_join(database, fragment_repository):
     }
 
 
+def test_create_join_members(database, fragment_repository):
+    first_join = Join(MuseumNumber("X", "1"))
+    second_join = Join(MuseumNumber("X", "2"))
+    fragment_repository.create(FragmentFactory.build(number=first_join.museum_number))
+
+    fragment_repository.create_join([[first_join], [second_join]])
+
+    def members():
+        return [
+            (
+                member["museumNumber"]["number"],
+                member["group"],
+                member["isInFragmentarium"],
+            )
+            for member in database[JOIN_MEMBERS_COLLECTION].find().sort("position")
+        ]
+
+    assert members() == [("1", 0, True), ("2", 1, False)]
+
+    fragment_repository.create(FragmentFactory.build(number=second_join.museum_number))
+
+    assert members() == [("1", 0, True), ("2", 1, True)]
+
+
+def test_query_by_museum_number_with_join_members(database, fragment_repository):
+    first_join = Join(MuseumNumber("X", "1"), is_in_fragmentarium=True)
+    second_join = Join(MuseumNumber("X", "2"), is_in_fragmentarium=False)
+    third_join = Join(MuseumNumber("X", "3"), is_in_fragmentarium=False)
+    fragment = LemmatizedFragmentFactory.build(
+        number=first_join.museum_number,
+        joins=Joins(((first_join, third_join), (second_join,))),
+    )
+    database[COLLECTION].insert_one(FragmentSchema(exclude=["joins"]).dump(fragment))
+    fragment_repository.create_join([[first_join, third_join], [second_join]])
+
+    assert fragment_repository.rebuild_join_members() == 1
+    assert fragment_repository.query_by_museum_number(fragment.number) == fragment
+
+
+def test_query_by_museum_number_with_imported_joins(database, fragment_repository):
+    first_join = Join(MuseumNumber("X", "1"), is_in_fragmentarium=True)
+    second_join = Join(MuseumNumber("X", "2"), is_in_fragmentarium=False)
+    fragment = LemmatizedFragmentFactory.build(
+        number=first_join.museum_number,
+        joins=Joins(((first_join,), (second_join,))),
+    )
+    database[COLLECTION].insert_one(FragmentSchema(exclude=["joins"]).dump(fragment))
+    fragment_repository.rebuild_join_members()
+    database[JOINS_COLLECTION].insert_one(
+        {
+            "fragments": [
+                {
+                    **JoinSchema(exclude=["is_in_fragmentarium"]).dump(join),
+                    "group": index,
+                }
+                for index, join in enumerate([first_join, second_join])
+            ]
+        }
+    )
+    JoinMembersVersion(database).increment_joins()
+
+    assert fragment_repository.query_by_museum_number(fragment.number) == fragment
+
+
 @pytest.mark.parametrize("number", ["IM.123", "IM.*"])
 def test_query_by_museum_number(database, fragment_repository, number):
     fragments = {
@@ -208,3 +278,42 @@ def test_query_by_parallel_line_exists(database, fragment_repository):
 def test_fragment_not_found(fragment_repository):
     with pytest.raises(NotFoundError):
         fragment_repository.query_by_museum_number(MuseumNumber("unknown", "id"))
+
+
+def test_retrieve_transliterated_fragments_after(
+    database, fragment_repository, photo_repository
+):
+    fragments = [
+        TransliteratedFragmentFactory.build(
+            number=MuseumNumber("K", str(index)), authorized_scopes=None
+        )
+        for index in range(1, 4)
+    ]
+    fragment_repository.create_many(fragments)
+    legacy_fragment = TransliteratedFragmentFactory.build(
+        number=MuseumNumber("K", "4"), authorized_scopes=None
+    )
+    database[COLLECTION].insert_one(
+        {
+            "_id": str(legacy_fragment.number),
+            **FragmentSchema(exclude=["joins"]).dump(legacy_fragment),
+        }
+    )
+
+    first_page = fragment_repository.retrieve_transliterated_fragments_after(None, 2)
+    second_page = fragment_repository.retrieve_transliterated_fragments_after(
+        first_page[-1]["_id"], 2
+    )
+
+    assert [fragment["_id"] for fragment in [*first_page, *second_page]] == [
+        "K.1",
+        "K.2",
+        "K.3",
+        "K.4",
+    ]
+    assert [fragment["atf"] for fragment in [*first_page, *second_page]] == [
+        fragment.text.atf for fragment in [*fragments, legacy_fragment]
+    ]
+    assert [fragment["hasPhoto"] for fragment in first_page] == [True, True]
+    assert second_page[0]["hasPhoto"] is False
+    assert all("text" not in fragment for fragment in [*first_page, *second_page])
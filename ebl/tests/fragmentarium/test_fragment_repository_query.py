@@ -10,6 +10,7 @@ from ebl.errors import NotFoundError
 from ebl.fragmentarium.application.fragment_query_summary_schema import (
     FragmentQueryResultSchema,
 )
+from ebl.common.query.parameter_parser import parse_transliteration
 from ebl.tests.factories.bibliography import ReferenceFactory
 from ebl.tests.factories.fragment import FragmentFactory, TransliteratedFragmentFactory
 from ebl.tests.fragmentarium.fragment_query_test_helpers import query_item_of
@@ -20,6 +21,9 @@ from ebl.tests.fragmentarium.fragment_repository_test_helpers import (
 )
 from ebl.common.domain.period import Period
 from ebl.fragmentarium.domain.fragment import Script
+from ebl.transliteration.application.transliteration_query_factory import (
+    TransliterationQueryFactory,
+)
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
 
@@ -146,6 +150,64 @@ def test_query_fragmentarium_transliteration(
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "string,expected_lines",
+    [
+        ("DIŠ UD", [1]),
+        ("KU", [0]),
+        ("MI DIŠ\nU BA MA", [1, 2]),
+        ("IGI UD", []),
+    ],
+)
+def test_query_fragmentarium_transliteration_with_sign_ngrams(
+    string, expected_lines, fragment_repository, sign_repository, signs
+):
+    for sign in signs:
+        sign_repository.create(sign)
+
+    transliterated_fragment = TransliteratedFragmentFactory.build()
+    fragment_repository.create_many([transliterated_fragment, FragmentFactory.build()])
+    fragment_repository.rebuild_sign_ngrams()
+
+    parse = parse_transliteration(TransliterationQueryFactory(sign_repository))
+    query = parse({"transliteration": string})
+    match_count = len(expected_lines) - (len(query["transliteration"]) > 1)
+    expected = (
+        QueryResultSchema().load(
+            {
+                "items": [
+                    query_item_of(transliterated_fragment, expected_lines, match_count)
+                ],
+                "matchCountTotal": match_count,
+            }
+        )
+        if expected_lines
+        else QueryResult.create_empty()
+    )
+
+    assert fragment_repository.query(query) == expected
+
+
+def test_find_sign_ngram_candidates(fragment_repository):
+    fragment = TransliteratedFragmentFactory.build()
+    fragment_repository.create_many([fragment, FragmentFactory.build()])
+    query = {"transliteration": ["MI DIŠ UD"], "signNgrams": ["MI DIŠ UD"]}
+
+    assert fragment_repository._find_sign_ngram_candidates(query) is None
+
+    fragment_repository.rebuild_sign_ngrams()
+
+    assert fragment_repository._find_sign_ngram_candidates(query) == [
+        str(fragment.number)
+    ]
+
+    fragment_repository.update_field(
+        "transliteration", attr.evolve(fragment, signs="KU NU")
+    )
+
+    assert fragment_repository._find_sign_ngram_candidates(query) == []
+
+
 def test_query_fragmentarium_sorting(fragment_repository, sign_repository, signs):
     for sign in signs:
         sign_repository.create(sign)
@@ -4,6 +4,9 @@ from ebl.fragmentarium.application.fragment_query_summary_schema import (
     FragmentQueryResultSchema,
 )
 from ebl.fragmentarium.domain.fragment import Script
+from ebl.fragmentarium.infrastructure import (
+    mongo_fragment_repository_get as repository_get,
+)
 from ebl.tests.factories.fragment import FragmentFactory, TransliteratedFragmentFactory
 from ebl.tests.fragmentarium.fragment_query_test_helpers import query_summary_of
 from ebl.tests.fragmentarium.fragment_repository_test_helpers import (
@@ -206,3 +209,131 @@ def test_query_fragmentarium_number_limit_summary_uses_bulk_photo_lookup(
             "matchCountTotal": 0,
         }
     )
+
+
+def _create_ku_fragments(fragment_repository, sign_repository, signs, count):
+    for sign in signs:
+        sign_repository.create(sign)
+    fragment_repository.create_many(
+        [
+            TransliteratedFragmentFactory.build(
+                number=MuseumNumber.of(f"X.{index}"),
+                script=Script(Period.LATE_BABYLONIAN),
+            )
+            for index in range(count)
+        ]
+    )
+    return create_transliteration_query_lines("KU", sign_repository)
+
+
+def test_query_fragmentarium_count_estimate_counts_small_collections_exactly(
+    fragment_repository, sign_repository, signs
+):
+    transliteration = _create_ku_fragments(
+        fragment_repository, sign_repository, signs, 3
+    )
+
+    result = fragment_repository.query(
+        {"transliteration": transliteration, "limit": 2, "count": "estimate"}
+    )
+
+    assert result.match_count_total == 3
+    assert result.is_match_count_total_exact is True
+    assert len(result.items) == 2
+
+
+def test_query_fragmentarium_count_is_cached_until_fragments_change(
+    fragment_repository, sign_repository, signs, database
+):
+    transliteration = _create_ku_fragments(
+        fragment_repository, sign_repository, signs, 3
+    )
+    query = {"transliteration": transliteration, "limit": 2}
+
+    fragment_repository.query(query)
+    database["fragment_query_counts"].update_many({}, {"$set": {"matchCountTotal": 99}})
+    cached = fragment_repository.query(query)
+    fragment_repository.create(
+        TransliteratedFragmentFactory.build(
+            number=MuseumNumber.of("X.3"), script=Script(Period.LATE_BABYLONIAN)
+        )
+    )
+    updated = fragment_repository.query(query)
+
+    assert cached.match_count_total == 99
+    assert cached.is_match_count_total_exact is True
+    assert len(cached.items) == 2
+    assert updated.match_count_total == 4
+
+
+def test_query_match_count_total(fragment_repository, sign_repository, signs):
+    transliteration = _create_ku_fragments(
+        fragment_repository, sign_repository, signs, 3
+    )
+
+    assert (
+        fragment_repository.query_match_count_total(
+            {"transliteration": transliteration, "limit": 2, "count": "estimate"}
+        )
+        == 3
+    )
+
+
+def test_query_fragmentarium_count_estimate_scales_sample(
+    monkeypatch, fragment_repository, sign_repository, signs
+):
+    transliteration = _create_ku_fragments(
+        fragment_repository, sign_repository, signs, 4
+    )
+    monkeypatch.setattr(repository_get, "ESTIMATE_SAMPLE_SIZE", 2)
+    monkeypatch.setattr(repository_get, "ESTIMATE_MIN_SAMPLED_MATCHES", 1)
+    monkeypatch.setattr(
+        fragment_repository, "_find_sign_ngram_candidates", lambda query: None
+    )
+
+    result = fragment_repository.query(
+        {"transliteration": transliteration, "limit": 2, "count": "estimate"}
+    )
+
+    assert result.match_count_total == 4
+    assert result.is_match_count_total_exact is False
+    assert len(result.items) == 2
+
+
+def test_query_fragmentarium_count_estimate_counts_sparse_samples_exactly(
+    monkeypatch, fragment_repository, sign_repository, signs
+):
+    transliteration = _create_ku_fragments(
+        fragment_repository, sign_repository, signs, 4
+    )
+    monkeypatch.setattr(repository_get, "ESTIMATE_SAMPLE_SIZE", 2)
+    monkeypatch.setattr(
+        fragment_repository, "_find_sign_ngram_candidates", lambda query: None
+    )
+
+    result = fragment_repository.query(
+        {"transliteration": transliteration, "limit": 2, "count": "estimate"}
+    )
+
+    assert result.match_count_total == 4
+    assert result.is_match_count_total_exact is True
+
+
+def test_query_fragmentarium_count_survives_unqueried_field_updates(
+    fragment_repository, sign_repository, signs, database
+):
+    transliteration = _create_ku_fragments(
+        fragment_repository, sign_repository, signs, 3
+    )
+    query = {"transliteration": transliteration, "limit": 2}
+    fragment = fragment_repository.query_by_museum_number(MuseumNumber.of("X.0"))
+
+    fragment_repository.query(query)
+    database["fragment_query_counts"].update_many({}, {"$set": {"matchCountTotal": 99}})
+    fragment_repository.update_field("notes", fragment)
+    after_notes = fragment_repository.query(query)
+    fragment_repository.update_field("genres", fragment)
+    after_genres = fragment_repository.query(query)
+
+    assert after_notes.match_count_total == 99
+    assert after_genres.match_count_total == 3
@@ -226,3 +226,30 @@ def test_update_field_rejects_unknown_field(fragment_repository):
 
     with pytest.raises(ValueError, match="Unexpected update field"):
         fragment_repository.update_field("unknown_field", fragment)
+
+
+def test_update_transliteration_stores_atf(database, fragment_repository, user):
+    fragment = FragmentFactory.build()
+    fragment_repository.create(fragment)
+    updated_fragment = fragment.update_transliteration(
+        TransliterationUpdate(parse_atf_lark("$ (the transliteration)")), user
+    )
+
+    fragment_repository.update_field("transliteration", updated_fragment)
+
+    assert database[COLLECTION].find_one({"_id": str(fragment.number)})["atf"] == (
+        updated_fragment.text.atf
+    )
+
+
+def test_update_stored_atf(database, fragment_repository):
+    fragment = TransliteratedFragmentFactory.build()
+    database[COLLECTION].insert_one(
+        {"_id": str(fragment.number), **SCHEMA.dump(fragment)}
+    )
+
+    assert fragment_repository.update_stored_atf() == 1
+    assert database[COLLECTION].find_one({"_id": str(fragment.number)})["atf"] == (
+        fragment.text.atf
+    )
+    assert fragment_repository.update_stored_atf() == 0
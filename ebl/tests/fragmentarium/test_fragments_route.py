@@ -1,3 +1,4 @@
+import json
 import pytest
 import attr
 import falcon
@@ -237,3 +238,57 @@ def test_retrieve_all_skip_greater_than_total(client):
     result = client.simulate_get("/fragments/retrieve-all?skip=99")
 
     assert result.status == falcon.HTTP_UNPROCESSABLE_ENTITY
+
+
+def test_export(client, fragmentarium, photo_repository):
+    fragments = [
+        TransliteratedFragmentFactory.build(
+            number=MuseumNumber("K", str(index)), authorized_scopes=None
+        )
+        for index in range(1, 4)
+    ]
+    for fragment in fragments:
+        fragmentarium.create(fragment)
+    fragmentarium.create(
+        TransliteratedFragmentFactory.build(
+            number=MuseumNumber("K", "5"),
+            authorized_scopes=[Scope.READ_ITALIANNINEVEH_FRAGMENTS],
+        )
+    )
+
+    result = client.simulate_get("/fragments/export")
+
+    assert result.status == falcon.HTTP_OK
+    assert result.headers["content-type"] == "application/x-ndjson"
+    records = [json.loads(line) for line in result.text.splitlines()]
+    assert [record["_id"] for record in records] == ["K.1", "K.2", "K.3"]
+    assert [record["atf"] for record in records] == [
+        fragment.text.atf for fragment in fragments
+    ]
+    assert [record["hasPhoto"] for record in records] == [True, True, False]
+    assert all("text" not in record for record in records)
+
+
+def test_export_resumes(client, fragmentarium):
+    for index in range(1, 4):
+        fragmentarium.create(
+            TransliteratedFragmentFactory.build(
+                number=MuseumNumber("K", str(index)), authorized_scopes=None
+            )
+        )
+    first = json.loads(client.simulate_get("/fragments/export").text.splitlines()[0])
+
+    result = client.simulate_get(
+        "/fragments/export", params={"resumeToken": first["resumeToken"]}
+    )
+
+    assert [json.loads(line)["_id"] for line in result.text.splitlines()] == [
+        "K.2",
+        "K.3",
+    ]
+
+
+def test_export_invalid_resume_token(client):
+    result = client.simulate_get("/fragments/export", params={"resumeToken": "é"})
+
+    assert result.status == falcon.HTTP_UNPROCESSABLE_ENTITY
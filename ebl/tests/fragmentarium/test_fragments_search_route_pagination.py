@@ -37,6 +37,7 @@ def test_query_fragmentarium_transliteration_count_none(
     assert result.json["matchCountTotal"] is None
     assert result.json["isMatchCountTotalExact"] is False
     assert result.json["hasNextPage"] is None
+    assert result.json["countMode"] == "none"
 
 
 def test_query_fragmentarium_transliteration_count_page(
@@ -74,6 +75,7 @@ def test_query_fragmentarium_transliteration_count_page(
         None,
         False,
         True,
+        "page",
     )
     assert last_page_result.status == falcon.HTTP_OK
     assert last_page_result.json == query_result_of(
@@ -81,6 +83,7 @@ def test_query_fragmentarium_transliteration_count_page(
         None,
         False,
         False,
+        "page",
     )
 
 
@@ -180,3 +183,32 @@ def test_query_fragmentarium_count_invalid(client, count):
     )
 
     assert result.status == falcon.HTTP_UNPROCESSABLE_ENTITY
+
+
+def test_query_fragmentarium_match_count_total(
+    client, fragmentarium, sign_repository, signs
+):
+    for index in range(3):
+        fragmentarium.create(
+            TransliteratedFragmentFactory.build(
+                number=MuseumNumber.of(f"X.{index}"),
+                script=Script(Period.LATE_BABYLONIAN),
+            )
+        )
+    for sign in signs:
+        sign_repository.create(sign)
+
+    estimate = client.simulate_get(
+        "/fragments/query",
+        params={"transliteration": "ma-tu₂", "limit": "2", "count": "estimate"},
+    )
+    result = client.simulate_get(
+        "/fragments/query-count",
+        params={"transliteration": "ma-tu₂", "limit": "2"},
+    )
+
+    assert estimate.status == falcon.HTTP_OK
+    assert estimate.json["matchCountTotal"] == 3
+    assert estimate.json["countMode"] == "exact"
+    assert result.status == falcon.HTTP_OK
+    assert result.json == {"matchCountTotal": 3}
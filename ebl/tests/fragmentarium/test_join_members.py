@@ -0,0 +1,46 @@
+from ebl.fragmentarium.infrastructure.join_members import JoinMembersVersion
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_not_current_before_rebuild(database):
+    version = JoinMembersVersion(database)
+    version.increment_joins(members_updated=True)
+
+    assert version.is_current() is False
+
+
+def test_current_after_rebuild(database):
+    version = JoinMembersVersion(database)
+    version.increment_joins()
+    version.set_members(version.get_joins())
+
+    assert version.is_current() is True
+
+
+def test_updated_members_stay_current(database):
+    version = JoinMembersVersion(database)
+    version.set_members(version.get_joins())
+    version.increment_joins(members_updated=True)
+
+    assert version.is_current() is True
+
+
+def test_joins_written_elsewhere_expire_after_refresh_interval(database):
+    clock = Clock()
+    version = JoinMembersVersion(database, refresh_interval=60, clock=clock)
+    version.set_members(version.get_joins())
+    assert version.is_current() is True
+
+    JoinMembersVersion(database).increment_joins()
+    clock.now = 59
+    assert version.is_current() is True
+
+    clock.now = 60
+    assert version.is_current() is False
@@ -1,4 +1,5 @@
 import falcon
+import pytest
 
 from ebl.fragmentarium.web.dtos import create_response_dto
 from ebl.tests.factories.fragment import LemmatizedFragmentFactory
@@ -12,7 +13,12 @@ def get_lemmatizable_tokens(fragment):
                 yield token
 
 
-def test_collect_lemmas(client, fragmentarium, word_repository, word):
+@pytest.mark.parametrize("with_statistics", [False, True])
+def test_collect_lemmas(
+    with_statistics, client, fragmentarium, lemma_repository, word_repository, word
+):
+    if with_statistics:
+        lemma_repository.rebuild_statistics()
     fragment = LemmatizedFragmentFactory.build()
     fragmentarium.create(fragment)
 
@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.matches.line_to_vec_corpus import (
+    LineToVecCorpus,
+    LineToVecCorpusScore,
+    pack,
+    score_packed_lines,
+)
+from ebl.fragmentarium.application.matches.line_to_vec_score import (
+    score,
+    score_weighted,
+)
+from ebl.fragmentarium.domain.fragment import Script
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.transliteration.domain.museum_number import MuseumNumber
+
+
+def create_line_to_vec(*lines):
+    return tuple(map(LineToVecEncoding.from_list, lines))
+
+
+def create_random_line_to_vec(rng: random.Random):
+    return create_line_to_vec(
+        *(
+            [rng.choice([0, 1, 1, 1, 2, 3, 4, 5]) for _ in range(rng.randint(0, 8))]
+            for _ in range(rng.randint(0, 3))
+        )
+    )
+
+
+def test_pack():
+    assert pack(create_line_to_vec([0, 1, 2], [3, 4, 5])) == (
+        b"\x00\x01\x02",
+        b"\x03\x04\x05",
+    )
+
+
+@pytest.mark.parametrize(
+    "first, second, expected",
+    [
+        [(1, 2, 1), (1, 2, 1), (3, 5)],
+        [(1, 2, 1), (), (0, 0)],
+        [(), (), (0, 0)],
+        [(1, 2, 1), (2, 1, 2), (2, 4)],
+        [(1, 2, 1), (2, 2, 2), (0, 0)],
+        [(1, 1, 2, 1, 1), (1, 2, 1), (3, 5)],
+        [(0, 1, 2, 1, 1), (1, 2, 5), (1, 1)],
+    ],
+)
+def test_score_packed_lines(first, second, expected):
+    assert score_packed_lines(bytes(first), bytes(second)) == expected
+
+
+def test_score():
+    candidate = create_line_to_vec([1, 2, 1, 1])
+    corpus = LineToVecCorpus.of(
+        [
+            LineToVecEntry(MuseumNumber.of("X.1"), Script(), candidate),
+            LineToVecEntry(
+                MuseumNumber.of("X.2"), Script(), create_line_to_vec([2, 1, 1])
+            ),
+            LineToVecEntry(MuseumNumber.of("X.3"), Script(), ()),
+        ]
+    )
+
+    assert corpus.score(candidate, MuseumNumber.of("X.1")) == [
+        LineToVecCorpusScore(1, 3, 5),
+        LineToVecCorpusScore(2, 0, 0),
+    ]
+
+
+def test_score_matches_reference_implementation():
+    rng = random.Random(0)
+    entries = [
+        LineToVecEntry(
+            MuseumNumber.of(f"X.{index}"), Script(), create_random_line_to_vec(rng)
+        )
+        for index in range(200)
+    ]
+    corpus = LineToVecCorpus.of(entries)
+
+    for _ in range(20):
+        candidate = create_random_line_to_vec(rng)
+        assert corpus.score(candidate) == [
+            LineToVecCorpusScore(
+                index,
+                score(candidate, entry.line_to_vec),
+                score_weighted(candidate, entry.line_to_vec),
+            )
+            for index, entry in enumerate(entries)
+        ]
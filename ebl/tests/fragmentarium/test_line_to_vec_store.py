@@ -0,0 +1,152 @@
+import threading
+
+from ebl.fragmentarium.application.line_to_vec import LineToVecEntry
+from ebl.fragmentarium.application.line_to_vec_store import LineToVecStore
+from ebl.fragmentarium.application.matches.line_to_vec_corpus import (
+    LineToVecCorpus,
+)
+from ebl.fragmentarium.domain.fragment import Script
+from ebl.fragmentarium.domain.line_to_vec_encoding import LineToVecEncoding
+from ebl.tests.factories.fragment import (
+    FragmentFactory,
+    TransliteratedFragmentFactory,
+)
+from ebl.transliteration.domain.museum_number import MuseumNumber
+from ebl.transliteration.domain.text import Text
+
+
+def create_entry(fragment):
+    return LineToVecEntry(fragment.number, fragment.script, fragment.line_to_vec)
+
+
+def test_snapshot_loads_transliterated_fragments(fragment_repository):
+    fragment = TransliteratedFragmentFactory.build()
+    fragment_repository.create_many([fragment, FragmentFactory.build()])
+    store = LineToVecStore(fragment_repository)
+
+    assert store.snapshot() == LineToVecCorpus.of([create_entry(fragment)])
+
+
+def test_snapshot_is_reused(fragment_repository):
+    fragment_repository.create(TransliteratedFragmentFactory.build())
+    store = LineToVecStore(fragment_repository)
+
+    assert store.snapshot() is store.snapshot()
+
+
+def test_snapshot_reloads_on_external_change(fragment_repository):
+    store = LineToVecStore(fragment_repository)
+    snapshot = store.snapshot()
+    fragment = TransliteratedFragmentFactory.build()
+
+    fragment_repository.create(fragment)
+
+    assert snapshot == LineToVecCorpus()
+    assert store.snapshot() == LineToVecCorpus.of([create_entry(fragment)])
+
+
+def test_update(fragment_repository):
+    fragment = TransliteratedFragmentFactory.build()
+    fragment_repository.create(fragment)
+    store = LineToVecStore(fragment_repository)
+    snapshot = store.snapshot()
+    updated_fragment = fragment.set_script(Script())
+
+    fragment_repository.update_field("script", updated_fragment)
+    store.update(updated_fragment)
+
+    assert store.snapshot() is not snapshot
+    assert store.snapshot() == LineToVecCorpus.of([create_entry(updated_fragment)])
+
+
+def test_update_removes_fragment_without_transliteration(fragment_repository):
+    fragment = TransliteratedFragmentFactory.build()
+    fragment_repository.create(fragment)
+    store = LineToVecStore(fragment_repository)
+    store.snapshot()
+    updated_fragment = fragment.set_text(Text())
+
+    store.update(updated_fragment)
+
+    assert store.snapshot() == LineToVecCorpus()
+
+
+def test_set_entry():
+    first = LineToVecEntry(
+        MuseumNumber.of("X.1"), Script(), (LineToVecEncoding.from_list([1]),)
+    )
+    second = LineToVecEntry(
+        MuseumNumber.of("X.2"), Script(), (LineToVecEncoding.from_list([1, 2]),)
+    )
+    updated_first = LineToVecEntry(
+        MuseumNumber.of("X.1"), Script(), (LineToVecEncoding.from_list([0, 1]),)
+    )
+    corpus = LineToVecCorpus.of([first])
+
+    assert corpus.set_entry(second) == LineToVecCorpus.of([first, second])
+    assert corpus.set_entry(updated_first) == LineToVecCorpus.of([updated_first])
+
+
+def test_remove_entry():
+    first = LineToVecEntry(MuseumNumber.of("X.1"), Script(), ())
+    second = LineToVecEntry(MuseumNumber.of("X.2"), Script(), ())
+    corpus = LineToVecCorpus.of([first, second])
+
+    assert corpus.remove_entry(first.museum_number) == LineToVecCorpus.of([second])
+
+
+class BlockingLineToVecRepository:
+    def __init__(self, entries):
+        self.entries = entries
+        self.version = 0
+        self.loading = threading.Event()
+        self.release = threading.Event()
+
+    def query_line_to_vec_version(self):
+        return self.version
+
+    def query_transliterated_line_to_vec(self):
+        if self.version:
+            self.loading.set()
+            self.release.wait(5)
+        return self.entries
+
+
+def test_snapshot_serves_previous_corpus_while_reloading():
+    fragment = TransliteratedFragmentFactory.build()
+    repository = BlockingLineToVecRepository([])
+    store = LineToVecStore(repository)
+    previous = store.snapshot()
+    repository.entries = [create_entry(fragment)]
+    repository.version = 1
+    reloaded = []
+
+    reload = threading.Thread(target=lambda: reloaded.append(store.snapshot()))
+    reload.start()
+    repository.loading.wait(5)
+    during_reload = store.snapshot()
+    repository.release.set()
+    reload.join(5)
+
+    assert during_reload is previous
+    assert reloaded == [LineToVecCorpus.of([create_entry(fragment)])]
+    assert store.snapshot() is reloaded[0]
+
+
+def test_update_queries_version_without_lock():
+    fragment = TransliteratedFragmentFactory.build()
+    repository = BlockingLineToVecRepository([])
+    store = LineToVecStore(repository)
+    store.snapshot()
+    locked = []
+    query_version = repository.query_line_to_vec_version
+
+    def query_line_to_vec_version():
+        locked.append(store._lock.locked())
+        return query_version()
+
+    repository.query_line_to_vec_version = query_line_to_vec_version
+    store.update(fragment)
+
+    assert locked == [False]
+    assert store.snapshot() == LineToVecCorpus.of([create_entry(fragment)])
@@ -4,7 +4,7 @@ from mockito import mock
 
 import ebl.fragmentarium.migrate_cropped_images as module
 from ebl.context import Context
-from ebl.fragmentarium.application.cropped_sign_image import CroppedSignImage, Base64
+from ebl.fragmentarium.application.cropped_sign_image import CroppedSignImage
 from ebl.transliteration.domain.museum_number import MuseumNumber
 
 
@@ -87,7 +87,7 @@ def test_main_exception(when):
 
 def test_cropped_sign_image_creation():
     fragment_number = MuseumNumber("K", "123")
-    image_data = Base64("test_image_data")
+    image_data = b"test_image_data"
 
     cropped_image = CroppedSignImage.create(image_data, fragment_number)
 
@@ -103,9 +103,9 @@ def test_cropped_sign_images_repository_delete_by_fragment_number(
     fragment_number_2 = MuseumNumber("K", "2")
 
     images = [
-        CroppedSignImage("image1", Base64("data1"), fragment_number_1),
-        CroppedSignImage("image2", Base64("data2"), fragment_number_1),
-        CroppedSignImage("image3", Base64("data3"), fragment_number_2),
+        CroppedSignImage("image1", b"data1", fragment_number_1),
+        CroppedSignImage("image2", b"data2", fragment_number_1),
+        CroppedSignImage("image3", b"data3", fragment_number_2),
     ]
 
     cropped_sign_images_repository.create_many(images)
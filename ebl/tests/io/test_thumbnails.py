@@ -1,7 +1,18 @@
+import io
+from datetime import datetime
+
 import pytest
+from gridfs import GridFS
 from PIL import Image
 from ebl.fragmentarium.application.fragment_finder import ThumbnailSize
-from ebl.io.fragments.thumbnails import resize
+from ebl.io.fragments.thumbnails import (
+    create_thumbnail_images,
+    find_outdated_photos,
+    is_up_to_date,
+    resize,
+    thumbnail_filename,
+    update_thumbnails,
+)
 
 
 @pytest.fixture
@@ -9,8 +20,54 @@ def large_image():
     return Image.new("RGB", (1200, 3800))
 
 
+@pytest.fixture
+def large_jpeg(large_image):
+    with io.BytesIO() as stream:
+        large_image.save(stream, format="jpeg")
+        return stream.getvalue()
+
+
 @pytest.mark.parametrize("size", ThumbnailSize)
 def test_resize(large_image, size):
     resized = resize(large_image, size)
 
     assert resized.size[0] == size.value
+
+
+def test_create_thumbnail_images(large_jpeg):
+    thumbnails = create_thumbnail_images(large_jpeg)
+
+    assert {
+        size: Image.open(io.BytesIO(data)).size[0] for size, data in thumbnails.items()
+    } == {size: size.value for size in ThumbnailSize}
+
+
+def test_thumbnail_filename():
+    assert thumbnail_filename("K.1.jpg", ThumbnailSize.SMALL) == "K.1_240.jpg"
+
+
+def test_is_up_to_date():
+    upload_date = datetime(2024, 1, 1)
+    photo = {"uploadDate": upload_date}
+    current = {"metadata": {"originalUploadDate": upload_date, "originalMd5": None}}
+    outdated = {"metadata": {"originalUploadDate": datetime(2023, 1, 1)}}
+
+    assert is_up_to_date(photo, [outdated, current]) is True
+    assert is_up_to_date(photo, [outdated]) is False
+    assert is_up_to_date(photo, [{}]) is False
+    assert is_up_to_date(photo, []) is False
+
+
+def test_update_thumbnails(database, large_jpeg):
+    GridFS(database, "photos").put(large_jpeg, filename="K.1.jpg")
+    GridFS(database, "thumbnails").put(b"legacy", filename="K.1_240.jpg")
+
+    assert find_outdated_photos(database) == ["K.1.jpg"]
+
+    update_thumbnails(database, "K.1.jpg")
+    update_thumbnails(database, "K.1.jpg")
+
+    assert find_outdated_photos(database) == []
+    assert sorted(
+        thumbnail["filename"] for thumbnail in database["thumbnails.files"].find()
+    ) == sorted(thumbnail_filename("K.1.jpg", size) for size in ThumbnailSize)
@@ -3,6 +3,11 @@ import pytest
 
 from ebl.dictionary.domain.word import WordId
 from ebl.lemmatization.application.suggestion_finder import SuggestionFinder
+from ebl.tests.factories.corpus import (
+    ChapterFactory,
+    LineFactory,
+    LineVariantFactory,
+)
 from ebl.tests.factories.fragment import (
     FragmentFactory,
     LemmatizedFragmentFactory,
@@ -163,6 +168,75 @@ def test_query_lemmas_not_found(is_normalized, fragment_repository, lemma_reposi
     assert lemma_repository.query_lemmas("aklu", is_normalized) == []
 
 
+def test_query_lemmas_from_statistics(fragment_repository, lemma_repository):
+    lemmatized_fragment = LemmatizedFragmentFactory.build()
+    fragment_repository.create_many([lemmatized_fragment, ANOTHER_LEMMATIZED_FRAGMENT])
+    expected = {
+        (word, is_normalized): lemma_repository.query_lemmas(word, is_normalized)
+        for word in ["GI₆", "ana", "u₄-šu", "aklu"]
+        for is_normalized in [False, True]
+    }
+
+    lemma_repository.rebuild_statistics()
+
+    for (word, is_normalized), lemmas in expected.items():
+        assert lemma_repository.query_lemmas(word, is_normalized) == lemmas
+
+
+def test_statistics_follow_lemmatization(fragment_repository, lemma_repository):
+    lemma_repository.rebuild_statistics()
+    fragment_repository.create(ANOTHER_LEMMATIZED_FRAGMENT)
+    relemmatized = attr.evolve(
+        ANOTHER_LEMMATIZED_FRAGMENT,
+        text=Text.of_iterable(
+            [
+                TextLine.of_iterable(
+                    LineNumber(1),
+                    [
+                        Word.of(
+                            [Reading.of_name("ana")], unique_lemma=(WordId("ana I"),)
+                        )
+                    ],
+                )
+            ]
+        ),
+    )
+
+    assert lemma_repository.query_lemmas("GI₆", False) == [["ginâ I"]]
+
+    fragment_repository.update_field("lemmatization", relemmatized)
+
+    assert lemma_repository.query_lemmas("GI₆", False) == []
+    assert lemma_repository.query_lemmas("ana", False) == [["ana I"]]
+
+
+def test_statistics_follow_chapters(text_repository, lemma_repository):
+    lemma_repository.rebuild_statistics()
+    chapter = ChapterFactory.build(
+        lines=(
+            LineFactory.build(
+                manuscript_id=1,
+                variant=LineVariantFactory.build(
+                    manuscript_id=1,
+                    reconstruction=(
+                        AkkadianWord.of(
+                            (ValueToken.of("buāru"),),
+                            unique_lemma=(WordId("buāru I"),),
+                        ),
+                    ),
+                ),
+            ),
+        )
+    )
+    text_repository.create_chapter(chapter)
+
+    assert lemma_repository.query_lemmas("buāru", True) == [["buāru I"]]
+
+    text_repository.update(chapter.id_, attr.evolve(chapter, lines=()))
+
+    assert lemma_repository.query_lemmas("buāru", True) == []
+
+
 def test_find_suggestions(dictionary, word, lemma_repository, when):
     suggestion_finder = SuggestionFinder(dictionary, lemma_repository)
     query = "GI₆"
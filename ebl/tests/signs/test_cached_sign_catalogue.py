@@ -0,0 +1,100 @@
+import pytest
+
+from ebl.errors import NotFoundError
+from ebl.signs.infrastructure.cached_sign_catalogue import CachedSignCatalogue
+from ebl.signs.infrastructure.mongo_sign_repository import COLLECTION, SignSchema
+
+
+@pytest.fixture
+def catalogue(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    return CachedSignCatalogue(sign_repository)
+
+
+def test_search(catalogue, sign_repository, signs):
+    for sign in signs:
+        for value in sign.values:
+            assert catalogue.search(
+                value.value, value.sub_index
+            ) == sign_repository.search(value.value, value.sub_index)
+            assert catalogue.search_all(
+                value.value, value.sub_index
+            ) == sign_repository.search_all(value.value, value.sub_index)
+
+
+def test_search_not_found(catalogue):
+    assert catalogue.search("not a reading", 1) is None
+    assert catalogue.search_all("not a reading", 1) == []
+
+
+def test_find(catalogue, signs):
+    for sign in signs:
+        assert catalogue.find(sign.name) == sign
+
+
+def test_find_not_found(catalogue):
+    with pytest.raises(NotFoundError):
+        catalogue.find("not a sign")
+
+
+def test_search_by_lists_name(catalogue, sign_repository, signs):
+    for sign in signs:
+        for record in sign.lists:
+            assert catalogue.search_by_lists_name(
+                record.name, record.number
+            ) == sign_repository.search_by_lists_name(record.name, record.number)
+
+
+def test_search_by_lemma(catalogue, signs):
+    sign = signs[0]
+
+    assert catalogue.search_by_lemma(sign.logograms[0].word_id[0]) == [sign]
+    assert catalogue.search_by_lemma("not a word") == []
+
+
+def test_does_not_query_signs_once_loaded(catalogue, database, signs):
+    sign = signs[1]
+    catalogue.find(sign.name)
+    database[COLLECTION].delete_many({})
+
+    assert catalogue.search(sign.values[0].value, sign.values[0].sub_index) == sign
+
+
+def test_refresh_on_version_change(sign_repository, signs):
+    catalogue = CachedSignCatalogue(sign_repository, refresh_interval=0)
+    sign = signs[1]
+
+    assert catalogue.search(sign.values[0].value, sign.values[0].sub_index) is None
+
+    sign_repository.create(sign)
+
+    assert catalogue.search(sign.values[0].value, sign.values[0].sub_index) == sign
+
+
+def test_reload_after_max_age(database, sign_repository, signs):
+    now = [0.0]
+    catalogue = CachedSignCatalogue(
+        sign_repository, refresh_interval=0, clock=lambda: now[0], max_age=10
+    )
+    sign = signs[1]
+    catalogue.search_by_lemma("not a word")
+    database[COLLECTION].insert_one(SignSchema().dump(sign))
+
+    now[0] = 9
+    before_max_age = catalogue.search(sign.values[0].value, sign.values[0].sub_index)
+    now[0] = 10
+    after_max_age = catalogue.search(sign.values[0].value, sign.values[0].sub_index)
+
+    assert before_max_age is None
+    assert after_max_age == sign
+
+
+def test_create(sign_repository, signs):
+    catalogue = CachedSignCatalogue(sign_repository)
+    sign = signs[1]
+    catalogue.search_by_lemma("not a word")
+
+    catalogue.create(sign)
+
+    assert catalogue.find(sign.name) == sign
@@ -1,7 +1,10 @@
 import falcon
 import pytest
 
-from ebl.fragmentarium.application.cropped_sign_image import CroppedSignImage, Base64
+from ebl.fragmentarium.application.cropped_sign_image import (
+    CroppedSignImage,
+    to_base64,
+)
 from ebl.fragmentarium.domain.annotation import PcaClustering
 from ebl.tests.factories.annotation import (
     AnnotationsFactory,
@@ -36,7 +39,7 @@ def test_signs_get(
         [
             CroppedSignImage(
                 annotation.cropped_sign.image_id,
-                Base64("test-base64-string"),
+                b"image",
                 fragment_number,
             )
         ]
@@ -53,7 +56,7 @@ def test_signs_get(
     result_json = result.json[0]
 
     assert result_json["fragmentNumber"] == str(fragment.number)
-    assert result_json["image"] == "test-base64-string"
+    assert result_json["image"] == to_base64(b"image")
     assert result_json["script"] == str(fragment.script)
     assert result_json["label"] == cropped_sign.label
 
@@ -93,7 +96,7 @@ def test_signs_get_with_centroids_only(
         [
             CroppedSignImage(
                 annotation.cropped_sign.image_id,
-                Base64("test-base64-string"),
+                b"image",
                 fragment_number,
             )
         ]
@@ -147,12 +150,12 @@ def test_signs_get_with_centroids_only_and_include_unclustered(
         [
             CroppedSignImage(
                 centroid_annotation.cropped_sign.image_id,
-                Base64("centroid-base64-string"),
+                b"centroid",
                 fragment_number,
             ),
             CroppedSignImage(
                 unclustered_annotation.cropped_sign.image_id,
-                Base64("unclustered-base64-string"),
+                b"unclustered",
                 fragment_number,
             ),
         ]
@@ -172,7 +175,7 @@ def test_signs_get_with_centroids_only_and_include_unclustered(
     assert len(result.json) == 2
 
     images = {item["image"] for item in result.json}
-    assert images == {"centroid-base64-string", "unclustered-base64-string"}
+    assert images == {to_base64(b"centroid"), to_base64(b"unclustered")}
 
 
 def test_signs_get_cluster_without_script_returns_bad_request(client):
@@ -217,7 +220,7 @@ def test_signs_get_cluster_with_script(
         [
             CroppedSignImage(
                 annotation.cropped_sign.image_id,
-                Base64("test-base64-string"),
+                b"image",
                 fragment_number,
             )
         ]
@@ -236,3 +239,21 @@ def test_signs_get_cluster_with_script(
     assert len(result.json) > 0
     assert result.status == falcon.HTTP_OK
     assert result.json[0]["annotationId"] == annotation.data.id
+
+
+def test_get_cropped_sign_image(client, cropped_sign_images_repository):
+    image = CroppedSignImage("image-id", b"image", MuseumNumber("K", "1"), "hash")
+    cropped_sign_images_repository.create_many([image])
+
+    result = client.simulate_get("/cropped-sign-images/image-id")
+
+    assert result.status == falcon.HTTP_OK
+    assert result.headers["content-type"] == "image/png"
+    assert result.headers["etag"] == '"hash"'
+    assert result.content == b"image"
+
+
+def test_get_cropped_sign_image_not_found(client):
+    result = client.simulate_get("/cropped-sign-images/unknown")
+
+    assert result.status == falcon.HTTP_NOT_FOUND
@@ -209,6 +209,15 @@ def test_create(database, sign_repository, sign_igi):
     )
 
 
+def test_create_increments_version(sign_repository, sign_igi, sign_si_2):
+    assert sign_repository.query_version() == 0
+
+    sign_repository.create(sign_igi)
+    sign_repository.create(sign_si_2)
+
+    assert sign_repository.query_version() == 2
+
+
 def test_find(database, sign_repository, mongo_sign_igi, sign_igi):
     database[COLLECTION].insert_one(mongo_sign_igi)
 
@@ -312,6 +321,24 @@ def test_get_unicode_from_atf(
     ]
 
 
+def test_get_unicode_from_atf_lines(
+    database, sign_repository, mongo_sign_igi, mongo_sign_si, mongo_sign_d
+):
+    database[COLLECTION].insert_many([mongo_sign_igi, mongo_sign_si, mongo_sign_d])
+    assert sign_repository.get_unicode_from_atf_lines(["ši ši", "{d} ši", "x"]) == [
+        [{"unicode": [74054]}, {"unicode": [9999]}, {"unicode": [74054]}],
+        [{"unicode": [1311]}, {"unicode": [9999]}, {"unicode": [74054]}],
+        [],
+    ]
+
+
+def test_get_unicode_from_atf_without_unicode(database, sign_repository):
+    database[COLLECTION].insert_one(
+        {"_id": "KU", "values": [{"value": "ku", "subIndex": 1}]}
+    )
+    assert sign_repository.get_unicode_from_atf("ku") == [{}]
+
+
 def test_find_signs_by_order_not_found(sign_repository):
     assert sign_repository.find_signs_by_order("SI", "not_existing_era") == []
 
@@ -150,3 +150,22 @@ def test_all_signs_route(client, sign_repository, signs):
     get_result = client.simulate_get("/signs/all")
     assert get_result.status == falcon.HTTP_OK
     assert get_result.json == sorted([sign.name for sign in signs])
+
+
+def test_signs_transliteration_lines(client, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    lines = ["ku", "nu ku"]
+
+    result = client.simulate_post("/signs/transliteration", json={"lines": lines})
+
+    assert result.status == falcon.HTTP_OK
+    assert result.json == [
+        client.simulate_get(f"/signs/transliteration/{line}").json for line in lines
+    ]
+
+
+def test_signs_transliteration_lines_invalid(client):
+    result = client.simulate_post("/signs/transliteration", json={"lines": "ku"})
+
+    assert result.status == falcon.HTTP_BAD_REQUEST
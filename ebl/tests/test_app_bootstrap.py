@@ -1,4 +1,5 @@
 import base64
+import signal
 
 import falcon
 import pytest
@@ -40,12 +41,34 @@ def test_get_app_bootstraps(monkeypatch: pytest.MonkeyPatch) -> None:
     configure_environment(monkeypatch, key.publickey().export_key())
     monkeypatch.setattr(ebl.app, "MongoClient", InMemoryMongoClient)
     monkeypatch.setattr(ebl.app.sentry_sdk, "init", noop_sentry_init)
+    monkeypatch.setattr(ebl.app, "close_on_termination", lambda changelog: None)
 
     app = ebl.app.get_app()
 
     assert isinstance(app, falcon.App)
 
 
+class ClosingChangelog:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_close_on_termination(monkeypatch: pytest.MonkeyPatch) -> None:
+    handlers = {}
+    changelog = ClosingChangelog()
+    monkeypatch.setattr(ebl.app.signal, "getsignal", lambda signum: signal.SIG_DFL)
+    monkeypatch.setattr(ebl.app.signal, "signal", handlers.__setitem__)
+
+    ebl.app.close_on_termination(changelog)
+    with pytest.raises(SystemExit):
+        handlers[signal.SIGTERM](signal.SIGTERM, None)
+
+    assert changelog.closed is True
+
+
 def test_create_context_helpers(monkeypatch: pytest.MonkeyPatch) -> None:
     key = RSA.generate(2048)
     configure_environment(monkeypatch, key.publickey().export_key())
@@ -66,6 +89,43 @@ def test_create_context_helpers(monkeypatch: pytest.MonkeyPatch) -> None:
         context.ebl_ai_client = EblAiClient("http://localhost:8001")
 
 
+def test_create_context_writes_changelog_immediately(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    key = RSA.generate(2048)
+    configure_environment(monkeypatch, key.publickey().export_key())
+    clients = []
+
+    def create_client(*args, **kwargs):
+        clients.append(InMemoryMongoClient(*args, **kwargs))
+        return clients[-1]
+
+    monkeypatch.setattr(ebl.app, "MongoClient", create_client)
+    context = ebl.app.create_context()
+    old = {"_id": "X.1", "notes": ""}
+
+    entry_id = context.changelog.create(
+        "fragments", {"name": "script"}, old, {**old, "notes": "updated"}
+    )
+
+    assert context.changelog.statistics is None
+    assert clients[0].get_database("ebltest")["changelog"].find_one({"_id": entry_id})
+
+
+def test_get_app_batches_changelog(monkeypatch: pytest.MonkeyPatch) -> None:
+    key = RSA.generate(2048)
+    configure_environment(monkeypatch, key.publickey().export_key())
+    monkeypatch.setattr(ebl.app, "MongoClient", InMemoryMongoClient)
+    monkeypatch.setattr(ebl.app.sentry_sdk, "init", noop_sentry_init)
+    changelogs = []
+    monkeypatch.setattr(ebl.app, "close_on_termination", changelogs.append)
+
+    ebl.app.get_app()
+
+    assert changelogs[0].statistics is not None
+    changelogs[0].close()
+
+
 def test_create_context_bootstraps_cache_indexes(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
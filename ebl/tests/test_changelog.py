@@ -1,5 +1,15 @@
+import dictdiffer
+import pytest
 from freezegun import freeze_time
+from pymongo.errors import BulkWriteError
 
+from ebl.changelog import (
+    DUPLICATE_KEY_ERROR,
+    Changelog,
+    ChangelogStatistics,
+    ChangelogWriter,
+    diff,
+)
 
 COLLECTION = "changelog"
 RESOURCE_TYPE = "type"
@@ -13,3 +23,124 @@ def test_create(database, changelog, user, make_changelog_entry):
     entry_id = changelog.create(RESOURCE_TYPE, user.profile, OLD, NEW)
     expected = make_changelog_entry(RESOURCE_TYPE, RESOURCE_ID, OLD, NEW)
     assert database[COLLECTION].find_one({"_id": entry_id}, {"_id": 0}) == expected
+
+
+@freeze_time("2018-09-07 15:41:24.032")
+def test_create_batched(database, user, make_changelog_entry):
+    changelog = Changelog(database, batched=True)
+
+    entry_id = changelog.create(RESOURCE_TYPE, user.profile, OLD, NEW)
+    changelog.flush()
+
+    expected = make_changelog_entry(RESOURCE_TYPE, RESOURCE_ID, OLD, NEW)
+    assert database[COLLECTION].find_one({"_id": entry_id}, {"_id": 0}) == expected
+    assert changelog.statistics == ChangelogStatistics(0, 1, 0, 1)
+    changelog.close()
+
+
+@pytest.mark.parametrize(
+    "old,new",
+    [
+        (OLD, NEW),
+        (OLD, OLD),
+        ({"a": [1, {"b": 2, "c": [3]}]}, {"a": [1, {"b": 2, "c": [4]}, 5]}),
+        ({"a": [1, 2, {"b": 3}]}, {"a": [1]}),
+        ({"a": {"b": [1]}, "c": 2}, {"a": {"b": (1,)}, "c": 2}),
+        ({"a": {"b": 1}}, {"a": [1]}),
+    ],
+)
+def test_diff(old, new):
+    assert diff(old, new) == list(dictdiffer.diff(old, new))
+
+
+class InsertManyCollection:
+    def __init__(self, error=None, failures=None):
+        self.batches = []
+        self.error = error
+        self.failures = failures
+
+    def insert_many(self, documents, ordered=True):
+        if self.error and self.failures != 0:
+            if self.failures is not None:
+                self.failures -= 1
+            raise self.error
+        self.batches.append(list(documents))
+
+
+def test_writer_flushes_on_close():
+    collection = InsertManyCollection()
+    writer = ChangelogWriter(collection, batch_size=2)
+
+    for index in range(5):
+        writer.add({"_id": index})
+    writer.close()
+
+    assert [entry for batch in collection.batches for entry in batch] == [
+        {"_id": index} for index in range(5)
+    ]
+    assert all(len(batch) <= 2 for batch in collection.batches)
+    assert writer.statistics == ChangelogStatistics(0, 5, 0, len(collection.batches))
+
+
+def test_writer_writes_after_close():
+    collection = InsertManyCollection()
+    writer = ChangelogWriter(collection)
+    writer.close()
+
+    writer.add({"_id": 1})
+
+    assert collection.batches == [[{"_id": 1}]]
+
+
+def test_writer_counts_failures():
+    writer = ChangelogWriter(
+        InsertManyCollection(ValueError()), max_attempts=2, retry_delay=0
+    )
+
+    writer.add({"_id": 1})
+    writer.flush()
+
+    assert writer.statistics == ChangelogStatistics(0, 0, 1, 1)
+    writer.close()
+
+
+def test_writer_retries_failed_batches():
+    collection = InsertManyCollection(ValueError(), failures=2)
+    writer = ChangelogWriter(collection, max_attempts=3, retry_delay=0)
+
+    writer.add({"_id": 1})
+    writer.close()
+
+    assert collection.batches == [[{"_id": 1}]]
+    assert writer.statistics == ChangelogStatistics(0, 1, 0, 1)
+
+
+class BulkWriteErrorCollection(InsertManyCollection):
+    def __init__(self, error_codes):
+        super().__init__()
+        self.error_codes = error_codes
+
+    def insert_many(self, documents, ordered=True):
+        write_errors = [
+            {"index": index, "code": self.error_codes.pop(document["_id"])}
+            for index, document in enumerate(documents)
+            if document["_id"] in self.error_codes
+        ]
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors})
+        super().insert_many(documents, ordered)
+
+
+def test_writer_retries_only_unwritten_entries():
+    collection = BulkWriteErrorCollection({0: DUPLICATE_KEY_ERROR, 2: 91})
+    writer = ChangelogWriter(collection, retry_delay=0)
+
+    for index in range(3):
+        writer.add({"_id": index})
+    writer.close()
+
+    written = [entry for batch in collection.batches for entry in batch]
+    assert {"_id": 0} not in written
+    assert {"_id": 2} in written
+    assert writer.statistics.written == 3
+    assert writer.statistics.failed == 0
@@ -14,7 +14,10 @@ from ebl.transliteration.domain.at_line import SurfaceAtLine
 from ebl.transliteration.domain.dollar_line import ScopeContainer, StateDollarLine
 from ebl.transliteration.domain.labels import SurfaceLabel
 from ebl.transliteration.domain.language import Language
-from ebl.transliteration.domain.atf_parsers.lark_parser import parse_atf_lark
+from ebl.transliteration.domain.atf_parsers.lark_parser import (
+    parse_atf_lark,
+    parsed_line_cache_statistics,
+)
 from ebl.transliteration.domain.line import ControlLine, Line
 from ebl.common.domain.stage import Stage
 from ebl.transliteration.domain.text import Text
@@ -85,6 +88,27 @@ def test_duplicate_labels(atf):
         parse_atf_lark(atf)
 
 
+def test_parsed_lines_are_shared():
+    first = parse_atf_lark("@obverse\n1. kur\n$ single ruling")
+    before = parsed_line_cache_statistics()
+    second = parse_atf_lark("@obverse\n2. kur\n$ single ruling")
+    after = parsed_line_cache_statistics()
+
+    assert second.lines[0] is first.lines[0]
+    assert second.lines[2] is first.lines[2]
+    assert second.lines[1] == parse_atf_lark("2. kur").lines[0]
+    assert after.hits - before.hits == 2
+
+
+def test_invalid_lines_are_not_cached():
+    before = parsed_line_cache_statistics()
+    for _ in range(2):
+        with pytest.raises(TransliterationError):
+            parse_atf_lark("this is not valid")
+
+    assert parsed_line_cache_statistics().hits == before.hits
+
+
 @pytest.fixture
 def siglum_parser():
     return Lark.open(
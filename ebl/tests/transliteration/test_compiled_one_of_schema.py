@@ -0,0 +1,92 @@
+from typing import Callable, TypeVar
+
+import pytest
+from marshmallow import ValidationError
+
+from ebl.corpus.application.schemas import ChapterSchema
+from ebl.tests.factories.corpus import ChapterFactory
+from ebl.tests.factories.fragment import (
+    LemmatizedFragmentFactory,
+    TransliteratedFragmentFactory,
+)
+from ebl.transliteration.application.compiled_one_of_schema import (
+    CompiledOneOfSchema,
+)
+from ebl.transliteration.application.one_of_line_schema import OneOfLineSchema
+from ebl.transliteration.application.text_schema import TextSchema
+from ebl.transliteration.domain.atf_parsers.lark_parser import parse_atf_lark
+
+T = TypeVar("T")
+
+ATF = """@obverse
+@column 1
+1. [...] {d}UTU# x X GAL-i <(mu)> <<ma>> {{giš}}a |KUR.KUR| ku-ur₂!
+2. %n [a-bu] %sux DINGIR : 3(diš) ...-ku* ku/ra °ku\\ra° <da> {(ra)} {+ra} 1/2
+3. %akkgr ma %akk ma-ma#?!* x x x {d}-UTU ma-{d}UTU ma@v (ma)-ma ma (...)
+#tr.en: translation @i{text}
+4. ma ; ma DIŠ-ma :. :'
+a+1. ma-<(ma)>
+$ 3 lines broken
+$ single ruling
+$ (image 1 = drawing)
+$ (a note)
+#note: a note @i{italic} @akk{ana} @bib{RN1@5}
+// F K.1 o 1
+// L I.1 1
+@h1
+@seal 1
+@m=division paragraph 1
+@object tablet
+@composite
+@div part 1
+@end part
+"""
+
+TEXTS = [
+    parse_atf_lark(ATF),
+    TransliteratedFragmentFactory.build().text,
+    LemmatizedFragmentFactory.build().text,
+]
+
+
+def with_marshmallow(function: Callable[[], T]) -> T:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(CompiledOneOfSchema, "compiled", False)
+        return function()
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_text_parity(text):
+    dumped = TextSchema().dump(text)
+
+    assert dumped == with_marshmallow(lambda: TextSchema().dump(text))
+    assert TextSchema().load(dumped) == text
+    assert with_marshmallow(lambda: TextSchema().load(dumped)) == text
+
+
+def test_chapter_dump_parity():
+    chapter = ChapterFactory.build()
+
+    assert ChapterSchema().dump(chapter) == with_marshmallow(
+        lambda: ChapterSchema().dump(chapter)
+    )
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        {"type": "Unknown"},
+        {"unknown": "field"},
+        {"lineNumber": None},
+        {"content": [{"type": "Reading", "value": "ma"}]},
+    ],
+)
+def test_invalid_data_errors_match(update):
+    data = {**TextSchema().dump(TEXTS[0])["lines"][2], **update}
+
+    with pytest.raises(ValidationError) as compiled_error:
+        OneOfLineSchema().load(data)
+    with pytest.raises(ValidationError) as marshmallow_error:
+        with_marshmallow(lambda: OneOfLineSchema().load(data))
+
+    assert compiled_error.value.messages == marshmallow_error.value.messages
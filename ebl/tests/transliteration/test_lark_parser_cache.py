@@ -0,0 +1,53 @@
+import pytest
+
+from ebl.transliteration.domain.atf_parsers import lark_parser_cache
+from ebl.transliteration.domain.atf_parsers.lark_parser_cache import (
+    get_cache_path,
+    open_parser,
+)
+
+GRAMMAR = "ebl_atf_common.lark"
+OPTIONS = {"maybe_placeholders": True, "start": "line_number"}
+
+
+@pytest.fixture(autouse=True)
+def cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(lark_parser_cache, "CACHE_DIRECTORY", tmp_path)
+    return tmp_path
+
+
+def test_writes_cache():
+    parser = open_parser(GRAMMAR, **OPTIONS)
+
+    assert get_cache_path(GRAMMAR, OPTIONS).exists()
+    assert parser.parse("1'a") == open_parser(GRAMMAR, **OPTIONS).parse("1'a")
+
+
+def test_loads_cache(monkeypatch):
+    open_parser(GRAMMAR, **OPTIONS)
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("Grammar was compiled.")
+
+    monkeypatch.setattr(lark_parser_cache.Lark, "open", fail)
+
+    assert open_parser(GRAMMAR, **OPTIONS).parse("1") is not None
+
+
+def test_cache_depends_on_options():
+    assert get_cache_path(GRAMMAR, OPTIONS) != get_cache_path(
+        GRAMMAR, {**OPTIONS, "start": "start"}
+    )
+
+
+def test_cache_depends_on_grammars(monkeypatch):
+    path = get_cache_path(GRAMMAR, OPTIONS)
+    monkeypatch.setattr(lark_parser_cache, "hash_grammars", lambda: "changed")
+
+    assert get_cache_path(GRAMMAR, OPTIONS) != path
+
+
+def test_compiles_if_cache_is_invalid():
+    get_cache_path(GRAMMAR, OPTIONS).write_bytes(b"invalid")
+
+    assert open_parser(GRAMMAR, **OPTIONS).parse("1") is not None
@@ -0,0 +1,59 @@
+import pytest
+
+from ebl.transliteration.domain.sign_ngrams import (
+    create_line_ngrams,
+    create_query_ngrams,
+    create_sign_ngrams,
+)
+
+
+def test_create_line_ngrams():
+    assert create_line_ngrams("KU NU IGI MI") == {
+        "KU",
+        "NU",
+        "IGI",
+        "MI",
+        "KU NU IGI",
+        "NU IGI MI",
+    }
+
+
+def test_create_line_ngrams_with_variants():
+    assert create_line_ngrams("BA ŠU/BU MA") == {
+        "BA",
+        "ŠU",
+        "BU",
+        "MA",
+        "BA ŠU MA",
+        "BA BU MA",
+    }
+
+
+def test_create_sign_ngrams():
+    assert create_sign_ngrams("KU NU\nIGI MI UD") == {
+        "KU",
+        "NU",
+        "IGI",
+        "MI",
+        "UD",
+        "IGI MI UD",
+    }
+
+
+@pytest.mark.parametrize("signs", [None, "", "\n"])
+def test_create_sign_ngrams_empty(signs):
+    assert create_sign_ngrams(signs) == set()
+
+
+@pytest.mark.parametrize(
+    "signs,expected",
+    [
+        (["KU"], {"KU"}),
+        (["KU", "NU"], {"KU", "NU"}),
+        (["KU", "NU", "IGI", "MI"], {"KU NU IGI", "NU IGI MI"}),
+        (["KU", "NU", "ŠU/BU", "IGI", "MI", "UD"], {"KU", "NU", "IGI MI UD"}),
+        ([], set()),
+    ],
+)
+def test_create_query_ngrams(signs, expected):
+    assert create_query_ngrams(signs) == expected
@@ -112,7 +112,7 @@ def test_update_lemmatization_wrong_lines() -> None:
 
 
 def test_labels(text_with_labels) -> None:
-    assert text_with_labels.labels == [
+    assert text_with_labels.labels == (
         LineLabel(None, None, None, LineNumber(1), None),
         LineLabel(
             ColumnLabel.from_int(1),
@@ -121,7 +121,22 @@ def test_labels(text_with_labels) -> None:
             LineNumber(2),
             None,
         ),
-    ]
+    )
+
+
+def test_derived_views_are_cached(text_with_labels) -> None:
+    assert text_with_labels.labels is text_with_labels.labels
+    assert text_with_labels.text_lines is text_with_labels.text_lines
+    assert text_with_labels.atf is text_with_labels.atf
+
+
+def test_derived_views_are_not_compared() -> None:
+    text = Text.of_iterable(LINES)
+    assert text.labels
+    assert text.atf
+
+    assert text == Text.of_iterable(LINES)
+    assert hash(text) == hash(Text.of_iterable(LINES))
 
 
 def test_translation_before_text() -> None:
@@ -4,6 +4,7 @@ import pytest
 
 from ebl.transliteration.domain.transliteration_query import TransliterationQuery
 from ebl.transliteration.application.signs_visitor import SignsVisitor
+from ebl.transliteration.domain.sign_ngrams import create_sign_ngrams
 
 REGEXP_DATA = [
     ("DU U", True),
@@ -29,6 +30,7 @@ REGEXP_DATA = [
     ("[UD|TA|NU] MA\nKI * BA", True),
     ("[UD|TA|NU] MA\nKI * NU", False),
 ]
+SIGNS = "KU NU IGI\nMI DIŠ MI UD MA\nKI DU ABZ411 BA MA TA\nX MU TA MA UD\nBA ŠU/BU"
 
 
 @pytest.mark.parametrize("string,is_match", REGEXP_DATA)
@@ -37,16 +39,42 @@ def test_regexp(string, is_match, sign_repository, signs):
         sign_repository.create(sign)
     visitor = SignsVisitor(sign_repository)
     query = TransliterationQuery(string=string, visitor=visitor)
-    match = re.search(
-        query.regexp,
-        "KU NU IGI\nMI DIŠ MI UD MA\nKI DU ABZ411 BA MA TA\nX MU TA MA UD\nBA ŠU/BU",
-    )
+    match = re.search(query.regexp, SIGNS)
     if is_match:
         assert match is not None
     else:
         assert match is None
 
 
+@pytest.mark.parametrize(
+    "string", [string for string, is_match in REGEXP_DATA if is_match]
+)
+def test_sign_ngrams_of_match(string, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
+
+    assert query.sign_ngrams
+    assert set(query.sign_ngrams) <= create_sign_ngrams(SIGNS)
+
+
+@pytest.mark.parametrize(
+    "string,expected",
+    [
+        ("U BA MA", ["ABZ411 BA MA"]),
+        ("BA ? TA", ["BA", "TA"]),
+        ("[UD|TA|NU] MA", ["MA"]),
+        ("GI₆ DIŠ\nU BA MA", ["ABZ411 BA MA", "DIŠ", "MI"]),
+    ],
+)
+def test_sign_ngrams(string, expected, sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    query = TransliterationQuery(string=string, visitor=SignsVisitor(sign_repository))
+
+    assert query.sign_ngrams == expected
+
+
 GET_IS_SEQUENCE_EMPTY_DATA = [
     ("", True),
     ("MA TA", False),
@@ -0,0 +1,119 @@
+import pytest
+
+from ebl.transliteration.application.signs_visitor import SignsVisitor
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+    TransliterationQueryCacheStatistics,
+)
+from ebl.transliteration.application.transliteration_query_factory import (
+    TransliterationQueryFactory,
+)
+from ebl.transliteration.domain.transliteration_query import TransliterationQuery
+
+
+class Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def create(sign_repository):
+    created = []
+
+    def _create(string: str) -> TransliterationQuery:
+        created.append(string)
+        return TransliterationQuery(
+            string=string, visitor=SignsVisitor(sign_repository)
+        )
+
+    _create.created = created
+    return _create
+
+
+def test_get(sign_repository, create):
+    cache = TransliterationQueryCache(sign_repository)
+
+    first = cache.get("ku-nu.", create)
+    second = cache.get(" ku-nu\n", create)
+
+    assert first is second
+    assert create.created == ["ku-nu"]
+    assert cache.statistics == TransliterationQueryCacheStatistics(1, 1, 1)
+
+
+def test_get_expired(sign_repository, create, clock):
+    cache = TransliterationQueryCache(sign_repository, timeout=10, clock=clock)
+
+    cache.get("ku", create)
+    clock.time = 10
+    cache.get("ku", create)
+
+    assert create.created == ["ku", "ku"]
+    assert cache.statistics == TransliterationQueryCacheStatistics(0, 2, 1)
+
+
+def test_get_evicts_least_recently_used(sign_repository, create):
+    cache = TransliterationQueryCache(sign_repository, max_size=2)
+
+    cache.get("ku", create)
+    cache.get("nu", create)
+    cache.get("ku", create)
+    cache.get("ba", create)
+    cache.get("ku", create)
+    cache.get("nu", create)
+
+    assert create.created == ["ku", "nu", "ba", "nu"]
+    assert cache.statistics == TransliterationQueryCacheStatistics(2, 4, 2)
+
+
+def test_get_after_sign_list_changed(sign_repository, signs, create, clock):
+    cache = TransliterationQueryCache(sign_repository, clock=clock)
+
+    before = cache.get("ku", create)
+    sign_repository.create(signs[1])
+    clock.time = 60
+    after = cache.get("ku", create)
+
+    assert before.regexp != after.regexp
+    assert create.created == ["ku", "ku"]
+
+
+def test_get_checks_version_once_per_refresh_interval(
+    sign_repository, signs, create, clock
+):
+    cache = TransliterationQueryCache(sign_repository, clock=clock)
+
+    cache.get("ku", create)
+    sign_repository.create(signs[1])
+    clock.time = 59
+    cache.get("ku", create)
+
+    assert create.created == ["ku"]
+
+
+def test_clear(sign_repository, create):
+    cache = TransliterationQueryCache(sign_repository)
+
+    cache.get("ku", create)
+    cache.clear()
+    cache.get("ku", create)
+
+    assert create.created == ["ku", "ku"]
+
+
+def test_factory_uses_cache(sign_repository, signs):
+    for sign in signs:
+        sign_repository.create(sign)
+    cache = TransliterationQueryCache(sign_repository)
+    factory = TransliterationQueryFactory(sign_repository, cache)
+
+    assert factory.create("ku") is factory.create("ku")
+    assert cache.statistics == TransliterationQueryCacheStatistics(1, 1, 1)
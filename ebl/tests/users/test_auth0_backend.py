@@ -1,5 +1,8 @@
 import datetime
-from typing import Any, Dict, Optional, Tuple
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from unittest.mock import Mock, patch
 
 import falcon
@@ -10,7 +13,7 @@ import jwt
 import pytest
 from Cryptodome.PublicKey import RSA
 
-from ebl.users.infrastructure.auth0 import Auth0Backend
+from ebl.users.infrastructure.auth0 import Auth0Backend, ProfileCache
 
 TEST_AUDIENCE = "test-audience"
 TEST_ISSUER = "https://issuer/"
@@ -196,26 +199,116 @@ def test_auth_backend_m2m_token_profile() -> None:
     assert resource.captured_profile == {"name": sub}
 
 
-def test_auth_backend_non_m2m_profile_calls_userinfo() -> None:
-    private_key, public_key = create_key_pair()
-    auth_backend = create_auth_backend(public_key)
-    mock_profile = {"name": "john"}
-    token = create_token(private_key, TEST_AUDIENCE, TEST_ISSUER)
-    client, resource = create_profile_capturing_client(auth_backend)
+@pytest.fixture
+def userinfo_server() -> Iterator[Tuple[str, List[str]]]:
+    authorizations: List[str] = []
 
-    with patch("ebl.users.infrastructure.auth0.requests.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json.return_value = mock_profile
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+    class UserinfoHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            authorizations.append(self.headers["Authorization"])
+            body = json.dumps({"name": "john"}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
 
-        result = client.simulate_get(
-            "/test", headers={"Authorization": f"Bearer {token}"}
-        )
+        def log_message(self, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UserinfoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", authorizations
+    server.shutdown()
+    server.server_close()
+
+
+def get_profile(
+    auth_backend: Auth0Backend, private_key: bytes, issuer: str, **overrides
+) -> Optional[Dict[str, Any]]:
+    client, resource = create_profile_capturing_client(auth_backend)
+    token = create_token(private_key, TEST_AUDIENCE, issuer, overrides=overrides)
+
+    result = client.simulate_get("/test", headers={"Authorization": f"Bearer {token}"})
 
     assert result.status == falcon.HTTP_OK
-    mock_get.assert_called_once()
-    assert resource.captured_profile == mock_profile
+    return resource.captured_profile
+
+
+def test_auth_backend_non_m2m_profile_calls_userinfo(userinfo_server) -> None:
+    issuer, authorizations = userinfo_server
+    private_key, public_key = create_key_pair()
+    auth_backend = Auth0Backend(public_key, TEST_AUDIENCE, issuer, lambda _id: None)
+
+    profile = get_profile(auth_backend, private_key, issuer)
+
+    assert profile == {"name": "john"}
+    assert len(authorizations) == 1
+    assert authorizations[0].startswith("Bearer ")
+
+
+def test_auth_backend_caches_profile_by_sub(userinfo_server) -> None:
+    issuer, authorizations = userinfo_server
+    private_key, public_key = create_key_pair()
+    auth_backend = Auth0Backend(public_key, TEST_AUDIENCE, issuer, lambda _id: None)
+    issued_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+    profiles = [
+        get_profile(auth_backend, private_key, issuer, iat=issued_at) for _ in range(3)
+    ]
+    other_user = get_profile(
+        auth_backend, private_key, issuer, iat=issued_at, sub="other"
+    )
+
+    assert profiles == [{"name": "john"}] * 3
+    assert other_user == {"name": "john"}
+    assert len(authorizations) == 2
+
+
+def test_auth_backend_refetches_profile_for_new_token(userinfo_server) -> None:
+    issuer, authorizations = userinfo_server
+    private_key, public_key = create_key_pair()
+    auth_backend = Auth0Backend(public_key, TEST_AUDIENCE, issuer, lambda _id: None)
+    issued_at = datetime.datetime.now(tz=datetime.timezone.utc)
+
+    get_profile(auth_backend, private_key, issuer, iat=issued_at)
+    get_profile(
+        auth_backend,
+        private_key,
+        issuer,
+        iat=issued_at - datetime.timedelta(seconds=10),
+    )
+
+    assert len(authorizations) == 2
+
+
+def test_profile_cache_expires() -> None:
+    now = [0.0]
+    cache = ProfileCache(ttl=60, clock=lambda: now[0])
+    fetch = Mock(side_effect=[{"name": "john"}, {"name": "johnny"}])
+
+    first = cache.get("user", 1, fetch)
+    cached = cache.get("user", 1, fetch)
+    now[0] = 61
+    expired = cache.get("user", 1, fetch)
+
+    assert (first, cached, expired) == (
+        {"name": "john"},
+        {"name": "john"},
+        {"name": "johnny"},
+    )
+
+
+def test_profile_cache_is_bounded() -> None:
+    cache = ProfileCache(max_size=1)
+    fetch = Mock(return_value={"name": "john"})
+
+    cache.get("user", 1, fetch)
+    cache.get("other", 1, fetch)
+    cache.get("user", 1, fetch)
+
+    assert fetch.call_count == 3
 
 
 def test_auth_backend_missing_sub_is_unauthorized() -> None:
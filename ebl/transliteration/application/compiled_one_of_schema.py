@@ -0,0 +1,147 @@
+from functools import cache
+from typing import Any, Optional, Type
+
+from marshmallow import EXCLUDE, Schema, ValidationError, missing
+from marshmallow.decorators import (
+    POST_DUMP,
+    POST_LOAD,
+    PRE_DUMP,
+    PRE_LOAD,
+    VALIDATES,
+    VALIDATES_SCHEMA,
+)
+from marshmallow.utils import set_value
+from marshmallow_oneofschema import OneOfSchema
+
+
+class SchemaCodec:
+    """Dumps and loads with the fields and hooks of a single schema instance.
+
+    Does the same steps as `Schema.dump` and `Schema.load` for one object
+    without the per call bookkeeping. Errors are raised as they occur
+    instead of being collected.
+    """
+
+    def __init__(self, schema_class: Type[Schema]) -> None:
+        schema = schema_class()
+        self._schema = schema
+        self._dump_fields = [
+            (name, name if field.data_key is None else field.data_key, field)
+            for name, field in schema.dump_fields.items()
+        ]
+        self._load_fields = [
+            (
+                name if field.data_key is None else field.data_key,
+                field.attribute or name,
+                field,
+            )
+            for name, field in schema.load_fields.items()
+        ]
+        self._load_keys = frozenset(key for key, _, _ in self._load_fields)
+        self.is_supported = not (
+            schema._hooks[VALIDATES] or schema._hooks[VALIDATES_SCHEMA]
+        )
+
+    def dump(self, obj: Any) -> dict:
+        schema = self._schema
+        processed = (
+            schema._invoke_dump_processors(PRE_DUMP, obj, many=False, original_data=obj)
+            if schema._hooks[PRE_DUMP]
+            else obj
+        )
+        result = {}
+        for name, key, field in self._dump_fields:
+            value = field.serialize(name, processed, accessor=schema.get_attribute)
+            if value is not missing:
+                result[key] = value
+        return (
+            schema._invoke_dump_processors(
+                POST_DUMP, result, many=False, original_data=obj
+            )
+            if schema._hooks[POST_DUMP]
+            else result
+        )
+
+    def load(self, data: dict, partial: Optional[bool], unknown: str) -> Any:
+        schema = self._schema
+        processed = (
+            schema._invoke_load_processors(
+                PRE_LOAD, data, many=False, original_data=data, partial=partial
+            )
+            if schema._hooks[PRE_LOAD]
+            else data
+        )
+        if unknown != EXCLUDE and not self._load_keys.issuperset(processed):
+            raise ValidationError("Unknown field.")
+
+        kwargs = {} if partial is None else {"partial": partial}
+        result: dict = {}
+        for key, attribute, field in self._load_fields:
+            value = field.deserialize(
+                processed.get(key, missing), key, processed, **kwargs
+            )
+            if value is not missing:
+                set_value(result, attribute, value)
+        return (
+            schema._invoke_load_processors(
+                POST_LOAD, result, many=False, original_data=data, partial=partial
+            )
+            if schema._hooks[POST_LOAD]
+            else result
+        )
+
+
+@cache
+def get_codec(schema_class: Type[Schema]) -> Optional[SchemaCodec]:
+    codec = SchemaCodec(schema_class)
+    return codec if codec.is_supported else None
+
+
+class CompiledOneOfSchema(OneOfSchema):
+    """A OneOfSchema which reuses one codec per type.
+
+    OneOfSchema instantiates the type schema, and with it all its fields, for
+    every object. Anything the codec does not handle, including invalid data,
+    goes through OneOfSchema so that errors are reported the same way.
+    """
+
+    compiled = True
+
+    def _get_codec(self, type_: Any) -> Optional[SchemaCodec]:
+        type_schema = self.type_schemas.get(type_) if isinstance(type_, str) else None
+        return (
+            get_codec(type_schema)
+            if self.compiled
+            and isinstance(type_schema, type)
+            and not getattr(self, "context", None)
+            else None
+        )
+
+    def _dump(self, obj, *, update_fields=True, **kwargs):
+        obj_type = self.get_obj_type(obj)
+        codec = None if kwargs else self._get_codec(obj_type)
+        if codec is None:
+            return super()._dump(obj, update_fields=update_fields, **kwargs)
+        try:
+            result = codec.dump(obj)
+        except ValidationError:
+            return super()._dump(obj, update_fields=update_fields, **kwargs)
+        if result is not None:
+            result[self.type_field] = obj_type
+        return result
+
+    def _load(self, data, *, partial=None, unknown=None, **kwargs):
+        codec = (
+            self._get_codec(data.get(self.type_field))
+            if isinstance(data, dict) and not kwargs and partial in (None, False)
+            else None
+        )
+        if codec is None:
+            return super()._load(data, partial=partial, unknown=unknown, **kwargs)
+        fields = dict(data)
+        if self.type_field_remove:
+            fields.pop(self.type_field)
+        try:
+            return codec.load(fields, partial, unknown or self.unknown)
+        except ValidationError:
+            return super()._load(data, partial=partial, unknown=unknown, **kwargs)
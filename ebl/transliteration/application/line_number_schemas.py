@@ -1,7 +1,7 @@
 from typing import Mapping, Type
 
 from marshmallow import EXCLUDE, Schema, fields, post_load, validate
-from marshmallow_oneofschema import OneOfSchema
+from ebl.transliteration.application.compiled_one_of_schema import CompiledOneOfSchema
 
 from ebl.bibliography.application.reference_schema import ApiReferenceSchema
 from ebl.transliteration.domain.line_number import (
@@ -55,7 +55,7 @@ class LineNumberRangeSchema(Schema):
         return LineNumberRange(data["start"], data["end"])
 
 
-class OneOfLineNumberSchema(OneOfSchema):
+class OneOfLineNumberSchema(CompiledOneOfSchema):
     type_field = "type"
     type_schemas: Mapping[str, Type[Schema]] = {
         "LineNumber": LineNumberSchema,
@@ -1,7 +1,7 @@
 from typing import Mapping, Type
 
 from marshmallow import Schema, fields, post_load
-from marshmallow_oneofschema import OneOfSchema
+from ebl.transliteration.application.compiled_one_of_schema import CompiledOneOfSchema
 
 from ebl.bibliography.application.reference_schema import ReferenceSchema
 from ebl.schemas import NameEnumField
@@ -92,7 +92,7 @@ class UrlPartSchema(Schema):
         return UrlPart(**data)
 
 
-class OneOfNoteLinePartSchema(OneOfSchema):
+class OneOfNoteLinePartSchema(CompiledOneOfSchema):
     type_field = "type"
     type_schemas: Mapping[str, Type[Schema]] = {
         "StringPart": StringPartSchema,
@@ -1,7 +1,7 @@
 from typing import Mapping, Type
 
 from marshmallow import Schema
-from marshmallow_oneofschema import OneOfSchema
+from ebl.transliteration.application.compiled_one_of_schema import CompiledOneOfSchema
 
 from ebl.transliteration.application.at_line_schemas import (
     ColumnAtLineSchema,
@@ -40,7 +40,7 @@ PARALLEL_LINE_SCHEMAS: Mapping[str, Type[Schema]] = {
 }
 
 
-class OneOfLineSchema(OneOfSchema):
+class OneOfLineSchema(CompiledOneOfSchema):
     type_field = "type"
     type_schemas: Mapping[str, Type[Schema]] = {
         "TextLine": TextLineSchema,
@@ -65,6 +65,6 @@ class OneOfLineSchema(OneOfSchema):
     }
 
 
-class ParallelLineSchema(OneOfSchema):
+class ParallelLineSchema(CompiledOneOfSchema):
     type_field = "type"
     type_schemas = PARALLEL_LINE_SCHEMAS
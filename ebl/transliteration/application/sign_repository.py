@@ -48,3 +48,7 @@ class SignRepository(ABC):
     @abstractmethod
     def list_all_signs(self) -> Sequence[str]:
         raise NotImplementedError
+
+    @abstractmethod
+    def query_version(self) -> int:
+        raise NotImplementedError
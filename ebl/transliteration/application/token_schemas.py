@@ -1,7 +1,7 @@
 from typing import Mapping, Type, Union
 
 from marshmallow import Schema
-from marshmallow_oneofschema.one_of_schema import OneOfSchema
+from ebl.transliteration.application.compiled_one_of_schema import CompiledOneOfSchema
 
 from ebl.transliteration.application.token_schemas_enclosures import (
     AccidentalOmissionSchema,
@@ -64,12 +64,12 @@ WORD_SCHEMAS: Mapping[str, Type[BaseWordSchema]] = {
 }
 
 
-class OneOfWordSchema(OneOfSchema):
+class OneOfWordSchema(CompiledOneOfSchema):
     type_field = "type"
     type_schemas: Mapping[str, Union[Type[Schema], Schema]] = WORD_SCHEMAS
 
 
-class OneOfTokenSchema(OneOfSchema):
+class OneOfTokenSchema(CompiledOneOfSchema):
     type_field = "type"
     type_schemas: Mapping[str, Union[Type[Schema], Schema]] = {
         **WORD_SCHEMAS,
@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from ebl.transliteration.application.sign_repository import SignRepository
+from ebl.transliteration.domain.transliteration_query import TransliterationQuery
+
+DEFAULT_MAX_SIZE: int = 1024
+DEFAULT_TIMEOUT: float = 3600
+DEFAULT_REFRESH_INTERVAL: float = 60
+
+
+class TransliterationQueryCacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+def normalize(string: str) -> str:
+    return string.strip(" -.\n")
+
+
+class TransliterationQueryCache:
+    def __init__(
+        self,
+        sign_repository: SignRepository,
+        max_size: int = DEFAULT_MAX_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ):
+        self._sign_repository = sign_repository
+        self._max_size = max_size
+        self._timeout = timeout
+        self._refresh_interval = refresh_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._queries: OrderedDict[str, Tuple[float, TransliterationQuery]] = (
+            OrderedDict()
+        )
+        self._version = 0
+        self._checked_at: Optional[float] = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def statistics(self) -> TransliterationQueryCacheStatistics:
+        with self._lock:
+            return TransliterationQueryCacheStatistics(
+                self._hits, self._misses, len(self._queries)
+            )
+
+    def get(
+        self, string: str, create: Callable[[str], TransliterationQuery]
+    ) -> TransliterationQuery:
+        key = normalize(string)
+        now = self._clock()
+        version = self._query_version(now)
+        with self._lock:
+            if version != self._version:
+                self._queries.clear()
+                self._version = version
+            entry = self._queries.get(key)
+            if entry is not None and entry[0] > now:
+                self._queries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        query = create(key)
+
+        with self._lock:
+            if version == self._version:
+                self._queries[key] = (now + self._timeout, query)
+                self._queries.move_to_end(key)
+                while len(self._queries) > self._max_size:
+                    self._queries.popitem(last=False)
+        return query
+
+    def clear(self) -> None:
+        with self._lock:
+            self._queries.clear()
+            self._checked_at = None
+
+    def _query_version(self, now: float) -> int:
+        with self._lock:
+            if (
+                self._checked_at is not None
+                and now - self._checked_at < self._refresh_interval
+            ):
+                return self._version
+        version = self._sign_repository.query_version()
+        with self._lock:
+            self._checked_at = now
+        return version
@@ -1,4 +1,9 @@
+from typing import Optional
+
 from ebl.transliteration.application.sign_repository import SignRepository
+from ebl.transliteration.application.transliteration_query_cache import (
+    TransliterationQueryCache,
+)
 from ebl.transliteration.domain.transliteration_query import (
     TransliterationQuery,
     TransliterationQueryEmpty,
@@ -7,13 +12,24 @@ from ebl.transliteration.application.signs_visitor import SignsVisitor
 
 
 class TransliterationQueryFactory:
-    def __init__(self, sign_repository: SignRepository) -> None:
+    def __init__(
+        self,
+        sign_repository: SignRepository,
+        cache: Optional[TransliterationQueryCache] = None,
+    ) -> None:
         self.visitor = SignsVisitor(sign_repository)
+        self._cache = cache
 
     @staticmethod
     def create_empty() -> TransliterationQuery:
         return TransliterationQueryEmpty()
 
     def create(self, string: str) -> TransliterationQuery:
-        query = TransliterationQuery(string=string, visitor=self.visitor)
-        return query
+        return (
+            self._create(string)
+            if self._cache is None
+            else self._cache.get(string, self._create)
+        )
+
+    def _create(self, string: str) -> TransliterationQuery:
+        return TransliterationQuery(string=string, visitor=self.visitor)
@@ -0,0 +1,55 @@
+import argparse
+import time
+
+from ebl.transliteration.domain.at_line import ColumnAtLine
+from ebl.transliteration.domain.labels import ColumnLabel
+from ebl.transliteration.domain.line_number import LineNumber
+from ebl.transliteration.domain.sign_tokens import Reading
+from ebl.transliteration.domain.text import Text
+from ebl.transliteration.domain.text_line import TextLine
+from ebl.transliteration.domain.tokens import Joiner
+from ebl.transliteration.domain.word_tokens import Word
+
+COLUMN_LENGTH = 100
+
+
+def create_text(number_of_lines: int) -> Text:
+    word = Word.of([Reading.of_name("ha"), Joiner.hyphen(), Reading.of_name("am")])
+    return Text.of_iterable(
+        (
+            ColumnAtLine(ColumnLabel.from_int(index // COLUMN_LENGTH + 1))
+            if index % COLUMN_LENGTH == 0
+            else TextLine.of_iterable(LineNumber(index % COLUMN_LENGTH), [word] * 5)
+        )
+        for index in range(number_of_lines)
+    )
+
+
+def measure(text: Text, view: str) -> float:
+    start = time.perf_counter()
+    getattr(text, view)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Time the derived views of a synthetic text."
+    )
+    parser.add_argument("-l", "--lines", type=int, default=3000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = create_text(args.lines)
+    create = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        Text(text.lines)
+        create.append(time.perf_counter() - start)
+    print(f"{'create':<16} {min(create) * 1000:8.3f} ms (validates the labels)")
+    for view in ("labels", "text_lines", "number_of_lines", "atf"):
+        texts = [Text(text.lines) for _ in range(args.repeat)]
+        first = min(measure(fresh, view) for fresh in texts)
+        cached = min(measure(texts[0], view) for _ in texts)
+        print(
+            f"{view:<16} first {first * 1000:8.3f} ms  cached {cached * 1000:8.3f} ms"
+        )
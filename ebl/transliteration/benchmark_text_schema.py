@@ -0,0 +1,48 @@
+import argparse
+import timeit
+from typing import Callable
+
+from ebl.transliteration.application.compiled_one_of_schema import (
+    CompiledOneOfSchema,
+)
+from ebl.transliteration.application.text_schema import TextSchema
+from ebl.transliteration.domain.atf_parsers.lark_parser import parse_atf_lark
+from ebl.transliteration.domain.text import Text
+
+ATF = """@obverse
+1. [...] {d}UTU# x X GAL-i <(mu)> <<ma>> {{giš}}a |KUR.KUR| ku-ur₂!
+2. %n [a-bu] %sux DINGIR : 3(diš) ...-ku* ku/ra °ku\\ra° <da> {(ra)} {+ra} 1/2
+3. %akkgr ma %akk ma-ma#?!* x x x {d}-UTU ma-{d}UTU ma@v (ma)-ma ma (...)
+$ 3 lines broken
+#note: a note @i{italic} @akk{ana}
+"""
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def run(text: Text, repeat: int) -> None:
+    schema = TextSchema()
+    data = schema.dump(text)
+    for compiled in (False, True):
+        CompiledOneOfSchema.compiled = compiled
+        dump = measure(lambda: schema.dump(text), repeat)
+        load = measure(lambda: schema.load(data), repeat)
+        print(
+            f"{'compiled' if compiled else 'marshmallow':<12}"
+            f" dump {dump * 1000:8.1f} ms  load {load * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare TextSchema with and without the compiled codecs."
+    )
+    parser.add_argument("-l", "--lines", type=int, default=1000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sample = parse_atf_lark(ATF)
+    lines = (sample.lines * (args.lines // len(sample.lines) + 1))[: args.lines]
+    run(Text(lines, sample.parser_version), args.repeat)
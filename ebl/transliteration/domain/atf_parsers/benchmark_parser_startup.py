@@ -0,0 +1,57 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+from ebl.transliteration.domain.atf_parsers.lark_parser_cache import (
+    CACHE_DIRECTORY,
+)
+
+
+def time_import(module: str, cache_directory: str) -> float:
+    t0 = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        env={**os.environ, "LARK_CACHE_DIRECTORY": cache_directory},
+        check=True,
+    )
+    return time.perf_counter() - t0
+
+
+def measure(module: str, runs: int, cache_directory: Optional[str]) -> List[float]:
+    if cache_directory is not None:
+        time_import(module, cache_directory)
+        return [time_import(module, cache_directory) for _ in range(runs)]
+    results = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as empty_directory:
+            results.append(time_import(module, empty_directory))
+    return results
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare process start-up with and without the parser cache."
+    )
+    parser.add_argument(
+        "-m", "--module", default="ebl.app", help="Module to import (default ebl.app)."
+    )
+    parser.add_argument("-r", "--runs", type=int, default=3, help="Number of runs.")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_arguments()
+    for name, cache_directory in [
+        ("compiled", None),
+        ("cached", str(CACHE_DIRECTORY)),
+    ]:
+        results = measure(args.module, args.runs, cache_directory)
+        print(
+            f"{name:<10}median {statistics.median(results):.2f} s"
+            f"  min {min(results):.2f} s  max {max(results):.2f} s"
+        )
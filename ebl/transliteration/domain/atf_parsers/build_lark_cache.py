@@ -0,0 +1,18 @@
+import importlib
+
+from ebl.transliteration.domain.atf_parsers.lark_parser_cache import (
+    CACHE_DIRECTORY,
+    open_parser,
+    used_cache_files,
+)
+
+if __name__ == "__main__":
+    importlib.import_module("ebl.transliteration.domain.atf_parsers.lark_parser")
+    # LegacyAtfConverter.ebl_parser, without importing the ATF importer.
+    open_parser("ebl_atf.lark", maybe_placeholders=True)
+
+    for path in CACHE_DIRECTORY.glob("*.pickle"):
+        if path not in used_cache_files:
+            path.unlink()
+    for path in sorted(used_cache_files):
+        print(f"{path.name}: {path.stat().st_size} bytes")
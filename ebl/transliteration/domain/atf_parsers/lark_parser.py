@@ -1,5 +1,6 @@
+from functools import lru_cache
 from itertools import dropwhile
-from typing import Sequence, Iterator
+from typing import NamedTuple, Sequence, Iterator
 import re
 
 import pydash
@@ -26,6 +27,7 @@ from ebl.transliteration.domain.transliteration_error import (
     ErrorAnnotation,
 )
 from ebl.transliteration.domain.word_tokens import Word
+from ebl.transliteration.domain.atf_parsers.lark_parser_cache import open_parser
 from ebl.transliteration.domain.atf_parsers.lark_parser_errors import (
     PARSE_ERRORS,
     create_transliteration_error_data,
@@ -34,9 +36,10 @@ from ebl.transliteration.domain.line_transformer import LineTransformer
 from ebl.transliteration.domain.label_transformer import LabelTransformer
 from ebl.transliteration.domain.labels import Label
 
-ATF_GRAMMAR_PATH = "lark_parser/ebl_atf.lark"
-ATF_COMMON_PATH = "lark_parser/ebl_atf_common.lark"
-kwargs_lark = {"maybe_placeholders": True, "rel_to": __file__}
+PARSED_LINE_CACHE_SIZE = 8192
+ATF_GRAMMAR_PATH = "ebl_atf.lark"
+ATF_COMMON_PATH = "ebl_atf_common.lark"
+kwargs_lark = {"maybe_placeholders": True}
 LINE_PARSER_STARTS = [
     "start",
     "text_line",
@@ -80,7 +83,7 @@ class _StartParser:
         return getattr(parser, name)
 
 
-LINE_PARSER = Lark.open(ATF_GRAMMAR_PATH, **kwargs_lark, start=ATF_GRAMMAR_STARTS)
+LINE_PARSER = open_parser(ATF_GRAMMAR_PATH, **kwargs_lark, start=ATF_GRAMMAR_STARTS)
 WORD_PARSER = _StartParser(LINE_PARSER, "any_word")
 NOTE_LINE_PARSER = _StartParser(LINE_PARSER, "note_line")
 MARKUP_PARSER = _StartParser(LINE_PARSER, "markup")
@@ -89,17 +92,17 @@ TRANSLATION_LINE_PARSER = _StartParser(LINE_PARSER, "translation_line")
 PARATEXT_PARSER = _StartParser(LINE_PARSER, "paratext")
 LABEL_PARSER = _StartParser(LINE_PARSER, "labels")
 
-CHAPTER_PARSER = Lark.open(
-    "lark_parser/ebl_atf_chapter.lark",
+CHAPTER_PARSER = open_parser(
+    "ebl_atf_chapter.lark",
     **kwargs_lark,
     start=["chapter", "chapter_line", "line_variant", "reconstruction"],
 )
-MANUSCRIPT_PARSER = Lark.open(
-    "lark_parser/ebl_atf_manuscript_line.lark",
+MANUSCRIPT_PARSER = open_parser(
+    "ebl_atf_manuscript_line.lark",
     **kwargs_lark,
     start=["manuscript_line", "siglum"],
 )
-LINE_NUMBER_PARSER = Lark.open(ATF_COMMON_PATH, **kwargs_lark, start="line_number")
+LINE_NUMBER_PARSER = open_parser(ATF_COMMON_PATH, **kwargs_lark, start="line_number")
 
 
 def parse_word(atf: str) -> Word:
@@ -206,13 +209,37 @@ def clean_line(line: str):
     return line
 
 
+@lru_cache(maxsize=PARSED_LINE_CACHE_SIZE)
+def _parse_valid_line(line: str, parser_version: str) -> Line:
+    parsed_line = parse_line(line) if line else EmptyLine()
+    validate_line(parsed_line)
+    return parsed_line
+
+
+def parse_valid_line(line: str) -> Line:
+    """Lines are immutable so identical lines share one parse.
+
+    Failed parses are not cached.
+    """
+    return _parse_valid_line(line, atf.ATF_PARSER_VERSION)
+
+
+class ParsedLineCacheStatistics(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+
+
+def parsed_line_cache_statistics() -> ParsedLineCacheStatistics:
+    info = _parse_valid_line.cache_info()
+    return ParsedLineCacheStatistics(info.hits, info.misses, info.currsize)
+
+
 def parse_atf_lark(atf_: str) -> Text:
     def parse_line_(line: str, line_number: int):
         try:
             line = clean_line(line)
-            parsed_line = parse_line(line) if line else EmptyLine()
-            validate_line(parsed_line)
-            return parsed_line, None
+            return parse_valid_line(line), None
         except PARSE_ERRORS as ex:
             return (None, create_transliteration_error_data(ex, line, line_number))
 
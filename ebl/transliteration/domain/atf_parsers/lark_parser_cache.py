@@ -0,0 +1,102 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Set
+
+import lark
+from lark import Lark
+from lark.load_grammar import Grammar
+
+logger = logging.getLogger(__name__)
+
+GRAMMAR_DIRECTORY = Path(__file__).parent / "lark_parser"
+CACHE_DIRECTORY = Path(
+    os.environ.get("LARK_CACHE_DIRECTORY", Path(__file__).parent / "lark_parser_cache")
+)
+
+used_cache_files: Set[Path] = set()
+
+
+class CompiledGrammar(Grammar):
+    """Previously compiled terminals and rules.
+
+    Lark skips loading and compiling the grammar when given a Grammar, which
+    is most of its start-up time. Lark's own cache only supports LALR.
+    """
+
+    def __init__(self, terminals, rules, ignore_tokens) -> None:
+        self.terminals = terminals
+        self.rules = rules
+        self.ignore_tokens = ignore_tokens
+
+    def compile(self, start, terminals_to_keep):
+        return self.terminals, self.rules, self.ignore_tokens
+
+
+@cache
+def hash_grammars() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(GRAMMAR_DIRECTORY.glob("*.lark")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def get_cache_path(grammar: str, options: dict) -> Path:
+    key = "\n".join(
+        [
+            hash_grammars(),
+            grammar,
+            repr(sorted(options.items())),
+            lark.__version__,
+            sys.implementation.cache_tag or "",
+        ]
+    )
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return CACHE_DIRECTORY / f"{Path(grammar).stem}-{digest[:16]}.pickle"
+
+
+def load_compiled_grammar(path: Path) -> CompiledGrammar:
+    with path.open("rb") as file:
+        return CompiledGrammar(*pickle.load(file))
+
+
+def save_compiled_grammar(parser: Lark, path: Path) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(
+                (parser.terminals, parser.rules, parser.ignore_tokens),
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(file.name, path)
+    except OSError:
+        logger.warning("Could not write the parser cache %s.", path, exc_info=True)
+
+
+def open_parser(grammar: str, **options) -> Lark:
+    """Open a grammar in the lark_parser directory.
+
+    The compiled grammar is cached under a hash of all grammar files and
+    the options, so editing any grammar falls back to compiling.
+    """
+    path = get_cache_path(grammar, options)
+    used_cache_files.add(path)
+    try:
+        return Lark(load_compiled_grammar(path), **options)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning("Could not load the parser cache %s.", path, exc_info=True)
+
+    parser = Lark.open(str(GRAMMAR_DIRECTORY / grammar), **options)
+    save_compiled_grammar(parser, path)
+    return parser
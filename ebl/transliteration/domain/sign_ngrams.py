@@ -0,0 +1,47 @@
+from itertools import product
+from typing import List, Optional, Sequence, Set
+
+from ebl.transliteration.domain.atf import VARIANT_SEPARATOR
+
+NGRAM_SIZE = 3
+
+
+def _create_ngrams(tokens: Sequence[Sequence[str]]) -> Set[str]:
+    return {
+        " ".join(signs)
+        for index in range(len(tokens) - NGRAM_SIZE + 1)
+        for signs in product(*tokens[index : index + NGRAM_SIZE])
+    }
+
+
+def create_line_ngrams(line: str) -> Set[str]:
+    tokens = [token.split(VARIANT_SEPARATOR) for token in line.split()]
+    return {sign for token in tokens for sign in token} | _create_ngrams(tokens)
+
+
+def create_sign_ngrams(signs: Optional[str]) -> Set[str]:
+    return {
+        ngram
+        for line in (signs or "").split("\n")
+        for ngram in create_line_ngrams(line)
+    }
+
+
+def _split_at_variants(signs: Sequence[str]) -> List[Sequence[str]]:
+    runs: List[List[str]] = [[]]
+    for sign in signs:
+        if VARIANT_SEPARATOR in sign:
+            runs.append([])
+        else:
+            runs[-1].append(sign)
+    return [run for run in runs if run]
+
+
+def create_query_ngrams(signs: Sequence[str]) -> Set[str]:
+    return {
+        ngram
+        for run in _split_at_variants(signs)
+        for ngram in (
+            _create_ngrams([[sign] for sign in run]) if len(run) >= NGRAM_SIZE else run
+        )
+    }
@@ -1,3 +1,4 @@
+from functools import cached_property
 from itertools import count, zip_longest
 from collections import defaultdict
 from typing import (
@@ -8,7 +9,6 @@ from typing import (
     List,
     Mapping,
     Sequence,
-    Tuple,
     Type,
     Iterator,
     cast,
@@ -58,16 +58,34 @@ def set_id(token: Token, count: Iterator[int]) -> Token:
     )
 
 
+LABEL_UPDATES: Mapping[Type[Line], Callable[[LineLabel, Line], LineLabel]] = {
+    ColumnAtLine: lambda label, line: label.set_column(
+        cast(ColumnAtLine, line).column_label
+    ),
+    SurfaceAtLine: lambda label, line: label.set_surface(
+        cast(SurfaceAtLine, line).surface_label
+    ),
+    ObjectAtLine: lambda label, line: label.set_object(cast(ObjectAtLine, line).label),
+    SealAtLine: lambda label, line: label.set_seal(cast(SealAtLine, line).number),
+}
+
+
 @attr.s(auto_attribs=True, frozen=True)
 class Text:
+    """The cached properties are computed once per instance.
+
+    They are stored outside the attributes, so equality, hashing and the
+    schemas ignore them.
+    """
+
     lines: Sequence[Line] = attr.ib(default=(), validator=_validate_extents)
     parser_version: str = ATF_PARSER_VERSION
 
-    @property
+    @cached_property
     def number_of_lines(self) -> int:
         return len(self.text_lines)
 
-    @property
+    @cached_property
     def text_lines(self) -> Sequence[TextLine]:
         return tuple(line for line in self.lines if isinstance(line, TextLine))
 
@@ -75,48 +93,22 @@ class Text:
     def lemmatization(self) -> Lemmatization:
         return Lemmatization(tuple(line.lemmatization for line in self.lines))
 
-    @property
+    @cached_property
     def atf(self) -> Atf:
         return Atf("\n".join(line.atf for line in self.lines))
 
-    @property
+    @cached_property
     def labels(self) -> Sequence[LineLabel]:
         current: LineLabel = LineLabel(None, None, None, None, None)
         labels: List[LineLabel] = []
-
-        handlers: Mapping[
-            Type[Line], Callable[[Line], Tuple[LineLabel, List[LineLabel]]]
-        ] = {
-            TextLine: lambda line: (
-                current,
-                [
-                    *labels,
-                    current.set_line_number(cast(TextLine, line).line_number),
-                ],
-            ),
-            ColumnAtLine: lambda line: (
-                current.set_column(cast(ColumnAtLine, line).column_label),
-                labels,
-            ),
-            SurfaceAtLine: lambda line: (
-                current.set_surface(cast(SurfaceAtLine, line).surface_label),
-                labels,
-            ),
-            ObjectAtLine: lambda line: (
-                current.set_object(cast(ObjectAtLine, line).label),
-                labels,
-            ),
-            SealAtLine: lambda line: (
-                current.set_seal(cast(SealAtLine, line).number),
-                labels,
-            ),
-        }
-
         for index, line in enumerate(self.lines):
-            if type(line) in handlers:
+            line_type = type(line)
+            if line_type is TextLine:
                 current = current.set_line_index(index)
-                current, labels = handlers[type(line)](line)
-        return labels
+                labels.append(current.set_line_number(cast(TextLine, line).line_number))
+            elif line_type in LABEL_UPDATES:
+                current = LABEL_UPDATES[line_type](current.set_line_index(index), line)
+        return tuple(labels)
 
     @property
     def is_empty(self) -> bool:
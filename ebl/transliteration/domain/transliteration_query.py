@@ -1,11 +1,13 @@
 from __future__ import annotations
 import re
 import attr
+from functools import cached_property
 from typing import cast, Sequence, Tuple, List
 from enum import Enum
 from collections import OrderedDict
 from ebl.errors import DataError
 from ebl.transliteration.domain.atf_parsers.lark_parser import parse_line
+from ebl.transliteration.domain.sign_ngrams import create_query_ngrams
 from ebl.transliteration.domain.text_line import TextLine
 from ebl.transliteration.domain.tokens import TokenVisitor
 
@@ -35,6 +37,7 @@ class TransliterationQuery:
     visitor: TokenVisitor
     type: Type = attr.ib(init=False)
     regexp: str = attr.ib(init=False)
+    sign_ngrams: Sequence[str] = attr.ib(init=False, factory=list)
 
     def __attrs_post_init__(self) -> None:
         self.string = self.string.strip(" -.\n")
@@ -69,6 +72,9 @@ class TransliterationQuery:
         children = self.create_children(string)
         if not children:
             return r""
+        self.sign_ngrams = sorted(
+            {ngram for child in children for ngram in child.sign_ngrams}
+        )
         separator = r"( .*)?\n.*" if self.type == Type.LINES else r" "
         return separator.join(child.regexp for child in children)
 
@@ -103,15 +109,17 @@ class TransliterationQuery:
                 children.append(self.make_transliteration_query_text(segment))
         return children
 
+    @cached_property
+    def pattern(self) -> re.Pattern:
+        return re.compile(self.regexp, re.MULTILINE)
+
     def match(self, transliteration: str) -> Sequence[Tuple[int, int]]:
         return [
             (
                 self.get_line_number(transliteration, match.start()),
                 self.get_line_number(transliteration, match.end()),
             )
-            for match in re.finditer(
-                re.compile(self.regexp, re.MULTILINE), transliteration
-            )
+            for match in self.pattern.finditer(transliteration)
         ]
 
     def get_line_number(self, transliteration: str, position: int) -> int:
@@ -132,9 +140,9 @@ class TransliterationQuery:
 @attr.s(auto_attribs=True)
 class TransliterationQueryText(TransliterationQuery):
     def _regexp(self) -> str:
-        signs_regexp = " ".join(
-            self._create_sign_regexp(sign) for sign in self._create_signs(self.string)
-        )
+        signs = self._create_signs(self.string)
+        self.sign_ngrams = sorted(create_query_ngrams(signs))
+        signs_regexp = " ".join(self._create_sign_regexp(sign) for sign in signs)
         return rf"(?<![^|\s]){signs_regexp}"
 
     def _create_sign_regexp(self, sign: str) -> str:
@@ -189,6 +197,7 @@ class TransliterationQueryLine(TransliterationQuery):
 
     def _regexp(self) -> str:
         content = TransliterationQuery(string=self.string, visitor=self.visitor)
+        self.sign_ngrams = content.sign_ngrams
         return rf"(?<![^|\s]){content.regexp}"
 
 
@@ -198,6 +207,7 @@ class TransliterationQueryEmpty(TransliterationQuery):
     visitor: TokenVisitor = TokenVisitor()
     type: Type = Type.UNDEFINED
     regexp: str = r""
+    sign_ngrams: Sequence[str] = ()
 
     def __attrs_post_init__(self) -> None:
         pass
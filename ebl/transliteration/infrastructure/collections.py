@@ -2,3 +2,4 @@ TEXTS_COLLECTION = "texts"
 CHAPTERS_COLLECTION = "chapters"
 FRAGMENTS_COLLECTION = "fragments"
 FINDSPOTS_COLLECTION = "findspots"
+CHAPTER_SIGN_NGRAMS_COLLECTION = "chapter_sign_ngrams"
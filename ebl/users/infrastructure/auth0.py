@@ -1,5 +1,8 @@
 import copy
-from typing import Any, Callable, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple
 
 import falcon
 import pydash
@@ -9,15 +12,57 @@ from ebl.common.domain.scopes import Scope
 
 from ebl.users.domain.user import User
 
+PROFILE_CACHE_TTL: float = 5 * 60
+PROFILE_CACHE_SIZE: int = 1024
 
-def fetch_user_profile(issuer: str, authorization: str):
+
+def fetch_user_profile(issuer: str, authorization: str, session: requests.Session):
     url = f"{issuer}userinfo"
     headers = {"Authorization": authorization}
-    response = requests.get(url, headers=headers)
+    response = session.get(url, headers=headers)
     response.raise_for_status()
     return response.json()
 
 
+class ProfileCache:
+    """A thread-safe LRU of user profiles keyed by the token subject.
+
+    A profile is fetched again when it expires or when the subject presents
+    a token issued at a different time, e.g. after logging in again.
+    """
+
+    def __init__(
+        self,
+        ttl: float = PROFILE_CACHE_TTL,
+        max_size: int = PROFILE_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[Any, float, Any]] = OrderedDict()
+
+    def get(self, sub: str, issued_at: Any, fetch: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(sub)
+            if entry is not None and entry[0] == issued_at and entry[1] > self._clock():
+                self._entries.move_to_end(sub)
+                return entry[2]
+
+        profile = fetch()
+        with self._lock:
+            self._entries[sub] = (issued_at, self._clock() + self._ttl, profile)
+            self._entries.move_to_end(sub)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return profile
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
 class Auth0User(User):
     def __init__(self, access_token: dict, profile_factory: Callable[[], Any]):
         self._access_token = copy.deepcopy(access_token)
@@ -65,7 +110,14 @@ class Auth0User(User):
 
 
 class Auth0Backend(JWTAuthBackend):
-    def __init__(self, public_key, audience, issuer, set_user):
+    def __init__(
+        self,
+        public_key,
+        audience,
+        issuer,
+        set_user,
+        profile_cache: Optional[ProfileCache] = None,
+    ):
         super().__init__(
             lambda payload: payload,
             public_key,
@@ -77,6 +129,8 @@ class Auth0Backend(JWTAuthBackend):
             required_claims=["exp", "iat", "sub"],
         )
         self._set_user = set_user
+        self._profile_cache = profile_cache or ProfileCache()
+        self._session = requests.Session()
 
     def authenticate(self, req, resp, resource):
         access_token = super().authenticate(req, resp, resource)
@@ -93,6 +147,10 @@ class Auth0Backend(JWTAuthBackend):
         else:
 
             def profile_factory():
-                return fetch_user_profile(self.issuer, req.auth)
+                return self._profile_cache.get(
+                    sub,
+                    access_token.get("iat"),
+                    lambda: fetch_user_profile(self.issuer, req.auth, self._session),
+                )
 
         return Auth0User(access_token, profile_factory)